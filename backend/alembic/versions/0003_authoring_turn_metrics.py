@@ -0,0 +1,61 @@
+"""Add authoring_turn_metrics table for per-turn model telemetry
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00.000000
+
+One append-only row per System 1 authoring turn: model, token counts, model
+latency vs backend overhead, parse failures and overridden handoffs.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "authoring_turn_metrics",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        # No FK to authoring_drafts — telemetry outlives deleted drafts
+        sa.Column("session_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("model", sa.String(100), nullable=True),
+        sa.Column("tier", sa.String(20), nullable=True),
+        sa.Column("model_calls", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("cached_tokens", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("completion_tokens", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("model_ms", sa.Float(), nullable=False),
+        sa.Column("backend_ms", sa.Float(), nullable=False),
+        sa.Column("parse_failures", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "handoff_overridden",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+        sa.Column("cache_hit", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("streamed", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("failed", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+    )
+    op.create_index(
+        "ix_authoring_turn_metrics_created_at", "authoring_turn_metrics", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_authoring_turn_metrics_created_at", table_name="authoring_turn_metrics")
+    op.drop_table("authoring_turn_metrics")
@@ -0,0 +1,58 @@
+"""Add authoring_prompt_shadow_runs table for prompt shadow comparisons
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00.000000
+
+One append-only row per live authoring turn replayed on a candidate prompt
+version: the primary and candidate calls' latency, token counts and whether
+each reply completes the draft.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "authoring_prompt_shadow_runs",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        # No FK to authoring_drafts — telemetry outlives deleted drafts
+        sa.Column("session_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("primary_version", sa.String(20), nullable=False),
+        sa.Column("candidate_version", sa.String(20), nullable=False),
+        sa.Column("primary_model_ms", sa.Float(), nullable=False),
+        sa.Column("primary_prompt_tokens", sa.Integer(), nullable=False),
+        sa.Column("primary_completion_tokens", sa.Integer(), nullable=False),
+        sa.Column("primary_completes_draft", sa.Boolean(), nullable=False),
+        sa.Column("candidate_model_ms", sa.Float(), nullable=True),
+        sa.Column("candidate_prompt_tokens", sa.Integer(), nullable=True),
+        sa.Column("candidate_completion_tokens", sa.Integer(), nullable=True),
+        sa.Column("candidate_completes_draft", sa.Boolean(), nullable=True),
+        sa.Column("candidate_error", sa.String(50), nullable=True),
+    )
+    op.create_index(
+        "ix_authoring_prompt_shadow_runs_created_at", "authoring_prompt_shadow_runs", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_authoring_prompt_shadow_runs_created_at", table_name="authoring_prompt_shadow_runs"
+    )
+    op.drop_table("authoring_prompt_shadow_runs")
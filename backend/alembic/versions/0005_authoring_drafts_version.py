@@ -0,0 +1,31 @@
+"""Add authoring_drafts.version for optimistic concurrency between workers
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00.000000
+
+Every save increments the version and only succeeds if the row is still at
+the version the writer loaded, so two API workers can no longer overwrite
+each other's turn on the same session.  Existing rows start at 1 (0 means
+"never saved" in memory).
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "authoring_drafts",
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("authoring_drafts", "version")
@@ -0,0 +1,79 @@
+"""Move authoring message history from authoring_drafts.messages_json to authoring_messages
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00.000000
+
+messages_json was rewritten in full on every save, so a session of n
+messages wrote O(n²) bytes (and a new TOAST value each time).  Messages now
+get one append-only row each, keyed by (draft_id, seq); a turn inserts only
+the messages it added.  Existing histories are backfilled from messages_json
+before the column is dropped; downgrade rebuilds it.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "authoring_messages",
+        sa.Column(
+            "draft_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("authoring_drafts.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("seq", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("role", sa.String(20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    # Timestamps without an offset were written as UTC
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+    op.execute(
+        """
+        INSERT INTO authoring_messages (draft_id, seq, role, content, created_at)
+        SELECT d.id,
+               m.ordinality - 1,
+               m.message->>'role',
+               m.message->>'content',
+               (m.message->>'timestamp')::timestamptz
+        FROM authoring_drafts AS d
+        CROSS JOIN LATERAL jsonb_array_elements(d.messages_json::jsonb)
+            WITH ORDINALITY AS m(message, ordinality)
+        """
+    )
+    op.drop_column("authoring_drafts", "messages_json")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "authoring_drafts",
+        sa.Column("messages_json", sa.Text(), nullable=False, server_default="[]"),
+    )
+    op.execute(
+        """
+        UPDATE authoring_drafts AS d
+        SET messages_json = m.messages
+        FROM (
+            SELECT draft_id,
+                   json_agg(
+                       json_build_object('role', role, 'content', content, 'timestamp', created_at)
+                       ORDER BY seq
+                   )::text AS messages
+            FROM authoring_messages
+            GROUP BY draft_id
+        ) AS m
+        WHERE m.draft_id = d.id
+        """
+    )
+    op.drop_table("authoring_messages")
@@ -0,0 +1,33 @@
+"""Persist the authoring history summary on authoring_drafts
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 00:00:00.000000
+
+Each history compaction extends the previous summary and trims its oldest
+lines, so a summary rebuilt from the messages after a reload differs from
+the one the model had been seeing (changing its context and breaking the
+prompt-prefix cache).  Existing rows start unsummarised.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("authoring_drafts", sa.Column("context_summary", sa.Text(), nullable=True))
+    op.add_column(
+        "authoring_drafts",
+        sa.Column("summarized_through", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("authoring_drafts", "summarized_through")
+    op.drop_column("authoring_drafts", "context_summary")
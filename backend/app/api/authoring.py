@@ -1,15 +1,42 @@
 """
 System 1 authoring router.
 
-All endpoints require a valid JWT (Depends(get_current_user)).
-Sessions are persisted to PostgreSQL (authoring_drafts table) as a
-write-through cache on top of the in-memory AuthoringStore so they
+All session endpoints require a valid JWT (Depends(get_current_principal) —
+identity only, served from the principal cache; no endpoint here touches
+credits).  The cross-user telemetry under /metrics is operator-only
+(Depends(require_internal_access)); an end-user JWT does not open it.
+Sessions are persisted through session_backend (authoring_drafts table)
+as a write-through cache on top of the in-memory AuthoringStore so they
 survive server restarts and appear in the user's history.
 
 Rate limits (in-memory, per process):
   - Max 10 new sessions per user per hour
   - Max 100 messages per session
 
+Turns:
+  - Serialised per session by authoring_turn_queue.  Messages sent while a
+    turn is in flight are coalesced into the next turn, and every request in
+    that batch receives its response.
+
+Multi-worker coherence:
+  - _persist_to_db publishes every write on the change bus; other workers
+    evict their stale in-memory copy and count remote session creations
+    towards the rate limit.
+  - The in-memory store is bounded (LRU, byte budget, idle TTL); any
+    session missing from it is rehydrated by _load_from_db.  A session is
+    pinned for the duration of a turn, so it cannot be evicted mid-turn.
+  - No sticky sessions needed: a turn first checks its copy against the
+    stored version (reloading if stale), and saves are optimistic — a turn
+    that lost a race with another worker fails with 409 instead of
+    overwriting it.
+
+Telemetry:
+  - Every turn (blocking or streamed) is queued to turn_metrics_writer and
+    lands in authoring_turn_metrics in batches; GET /metrics/turns
+    aggregates it.
+  - Turns replayed on a shadow prompt version land in
+    authoring_prompt_shadow_runs; GET /metrics/shadow compares the versions.
+
 Audit trail:
   - Every mutation is logged at INFO level with user_id + session_id.
   - The launched_at timestamp on the DB row is the authoritative audit
@@ -19,20 +46,24 @@ import json
 import logging
 import uuid
 from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Response
-from sqlalchemy import select, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Integer, cast, exists, select, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.dependencies import get_current_user
-from app.models import User
+from app.database import SessionLocal, get_db
+from app.dependencies import get_current_principal, require_internal_access
+from app.etag import is_not_modified, make_etag, not_modified
 from app.models.authoring_draft import AuthoringDraft
+from app.models.authoring_message import AuthoringDraftMessage
+from app.models.authoring_prompt_shadow_run import AuthoringPromptShadowRun
+from app.models.authoring_turn_metric import AuthoringTurnMetric
+from app.principal_cache import Principal
 from app.schemas.prank_authoring import (
     AuthoringDraftSummary,
-    AuthoringMessage,
     AuthoringSession,
     AuthoringStatus,
     CreateSessionResponse,
@@ -41,12 +72,23 @@ from app.schemas.prank_authoring import (
     ListSessionsResponse,
     MessageRole,
     PrankDraft,
+    PrankPackage,
+    PromptShadowComparison,
+    PromptShadowResponse,
     SendMessageRequest,
     SendMessageResponse,
     SetPhoneRequest,
+    TurnMetricsBucket,
+    TurnMetricsResponse,
 )
-from app.services.authoring_engine import process_turn
+from app.services.authoring_engine import process_turn, process_turn_stream
+from app.services.authoring_metrics import TurnTiming, measure_turn
+from app.services.authoring_session_backend import SessionVersionConflict, session_backend
+from app.services.authoring_turn_queue import TurnInterrupted, authoring_turn_queue
+from app.services.prank_compiler import prank_compiler
 from app.services.authoring_store import authoring_store
+from app.services.change_bus import CHANNEL_AUTHORING_SESSION, change_bus
+from app.services.turn_metrics_writer import turn_metrics_writer
 
 logger = logging.getLogger(__name__)
 
@@ -82,10 +124,34 @@ def _check_session_rate_limit(user_id: str) -> None:
         )
 
 
+def _check_message_limit(session: AuthoringSession) -> int:
+    """Hard cap: prevent runaway sessions. Returns the current user-turn count."""
+    user_turns = session.messages.count_role(MessageRole.USER)
+    if user_turns >= _MAX_MESSAGES_PER_SESSION:
+        raise HTTPException(
+            status_code=429,
+            detail=(
+                f"Session message limit reached "
+                f"({_MAX_MESSAGES_PER_SESSION} messages per session)"
+            ),
+        )
+    return user_turns
+
+
 def _record_session_creation(user_id: str) -> None:
     _user_session_timestamps[user_id].append(datetime.now(timezone.utc))
 
 
+def _on_remote_authoring_change(payload: dict) -> None:
+    """Change bus subscriber: another worker wrote this session."""
+    authoring_store.evict(payload["id"])
+    if payload.get("c"):
+        _record_session_creation(payload["u"])
+
+
+change_bus.subscribe(CHANNEL_AUTHORING_SESSION, _on_remote_authoring_change)
+
+
 # =============================================================================
 # DB write-through helpers
 # =============================================================================
@@ -98,52 +164,26 @@ async def _persist_to_db(
     launched_at: Optional[datetime] = None,
 ) -> None:
     """
-    Upsert the in-memory session state to the authoring_drafts table.
+    Write the in-memory session state through session_backend.
 
     Called after every mutation (create, message, phone update, launch).
-    Using a simple SELECT + INSERT/UPDATE rather than ON CONFLICT because
-    SQLAlchemy's PostgreSQL dialect upsert requires explicit column lists
-    that would need updating whenever the model changes.
+    The write is optimistic (see authoring_session_backend): if another
+    worker saved the session since this copy was loaded, nothing is written,
+    the stale copy is dropped and the request fails with 409 — the client
+    reloads the session and retries.
     """
-    draft_json = session.draft.json()
-    messages_json = json.dumps(
-        [m.dict() for m in session.messages], default=str
-    )
-
     try:
-        sid = uuid.UUID(session.id)
-    except ValueError:
-        logger.error("_persist_to_db: invalid session id %s", session.id)
-        return
-
-    existing = await db.scalar(
-        select(AuthoringDraft).where(AuthoringDraft.id == sid)
-    )
-
-    if existing is None:
-        db_row = AuthoringDraft(
-            id=sid,
-            user_id=user_id,
-            status=session.status.value,
-            draft_json=draft_json,
-            messages_json=messages_json,
-            recipient_phone=session.recipient_phone,
-            is_complete=session.is_complete,
-            prank_title=session.draft.prank_title,
-            launched_at=launched_at,
+        await session_backend.save(db, session, user_id, launched_at=launched_at)
+    except SessionVersionConflict:
+        authoring_store.evict(session.id)
+        logger.warning(
+            "authoring._persist_to_db: version conflict user=%s session=%s version=%d",
+            user_id, session.id, session.version,
+        )
+        raise HTTPException(
+            status_code=409,
+            detail="Authoring session was changed by another request — reload it and retry",
         )
-        db.add(db_row)
-    else:
-        existing.status = session.status.value
-        existing.draft_json = draft_json
-        existing.messages_json = messages_json
-        existing.recipient_phone = session.recipient_phone
-        existing.is_complete = session.is_complete
-        existing.prank_title = session.draft.prank_title
-        if launched_at is not None:
-            existing.launched_at = launched_at
-
-    await db.commit()
     logger.debug("authoring._persist_to_db: session=%s persisted", session.id)
 
 
@@ -153,53 +193,42 @@ async def _load_from_db(
     db: AsyncSession,
 ) -> Optional[AuthoringSession]:
     """
-    Load a session from the DB, verify ownership, and hydrate it into the
-    in-memory store so subsequent engine calls can find it.
+    Load a session from the shared backend, verify ownership, and hydrate it
+    into the in-memory store so subsequent engine calls can find it.
 
     Returns None if the session does not exist.
     Raises 403 if the session exists but belongs to a different user.
     """
-    try:
-        sid = uuid.UUID(session_id)
-    except ValueError:
+    stored = await session_backend.load(db, session_id)
+    if stored is None:
         return None
-
-    db_row = await db.scalar(
-        select(AuthoringDraft).where(AuthoringDraft.id == sid)
-    )
-    if db_row is None:
-        return None
-    if db_row.user_id != user_id:
+    if stored.user_id != user_id:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    # Deserialise stored JSON back into Pydantic models
-    draft = PrankDraft.parse_raw(db_row.draft_json)
-    messages_raw = json.loads(db_row.messages_json)
-    messages = [AuthoringMessage(**m) for m in messages_raw]
-
-    session = AuthoringSession(
-        id=str(db_row.id),
-        created_at=db_row.created_at,
-        updated_at=db_row.updated_at,
-        status=AuthoringStatus(db_row.status),
-        draft=draft,
-        messages=messages,
-        is_complete=db_row.is_complete,
-        recipient_phone=db_row.recipient_phone,
-    )
-
     # Populate in-memory store so the engine can operate on it
-    authoring_store._sessions[session_id] = session
+    authoring_store.put_session(stored.session)
     logger.info(
-        "authoring._load_from_db: hydrated session=%s from DB into memory store",
-        session_id,
+        "authoring._load_from_db: hydrated session=%s version=%d from DB into memory store",
+        session_id, stored.session.version,
     )
-    return session
+    return stored.session
+
+
+async def _ensure_current(session_id: str, user_id: uuid.UUID, db: AsyncSession) -> None:
+    """
+    Before a turn: reload the session unless the in-memory copy is at the
+    stored version (it may have been evicted while the turn was queued, or
+    changed by another worker).
+    """
+    local = authoring_store.get_session(session_id)
+    if local is not None and await session_backend.version(db, session_id) == local.version:
+        return
+    await _load_from_db(session_id, user_id, db)
 
 
 async def _require_session(
     session_id: str,
-    current_user: User,
+    current_user: Principal,
     db: AsyncSession,
 ) -> AuthoringSession:
     """
@@ -221,7 +250,7 @@ async def _require_session(
 
 @router.post("/sessions", response_model=CreateSessionResponse, status_code=201)
 async def create_authoring_session(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -245,7 +274,9 @@ async def create_authoring_session(
 
 @router.get("/sessions", response_model=ListSessionsResponse)
 async def list_authoring_sessions(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -254,33 +285,40 @@ async def list_authoring_sessions(
     Used to populate the HistoryTab in the Android app.
     Each item is a lightweight summary; the full session is fetched
     separately via GET /sessions/{id} when the user opens a card.
+
+    Conditional GET: the ETag is (row count, newest updated_at) from one
+    index-backed aggregate, so an unchanged history costs no row loads.
     """
+    row_count, last_updated_at = (
+        await db.execute(
+            select(func.count(), func.max(AuthoringDraft.updated_at))
+            .where(AuthoringDraft.user_id == current_user.id)
+        )
+    ).one()
+    etag = make_etag("list", current_user.id, row_count, last_updated_at or 0)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    # Skip empty junk sessions — no user input means no meaningful content.
+    # These are created automatically on app open and abandoned immediately.
+    has_user_message = exists().where(
+        AuthoringDraftMessage.draft_id == AuthoringDraft.id,
+        AuthoringDraftMessage.role == MessageRole.USER.value,
+    )
     rows = (
         await db.scalars(
             select(AuthoringDraft)
-            .where(AuthoringDraft.user_id == current_user.id)
+            .where(AuthoringDraft.user_id == current_user.id, has_user_message)
             .order_by(desc(AuthoringDraft.created_at))
             .limit(50)
         )
     ).all()
 
-    def _has_user_messages(messages_json: str) -> bool:
-        """Return True if the session has at least one user message."""
-        try:
-            msgs = json.loads(messages_json or "[]")
-            return any(m.get("role") == "user" for m in msgs)
-        except Exception:
-            return True  # keep on parse failure — safer than hiding real sessions
-
     summaries: list[AuthoringDraftSummary] = []
     for row in rows:
-        # Skip empty junk sessions — no user input means no meaningful content.
-        # These are created automatically on app open and abandoned immediately.
-        if not _has_user_messages(row.messages_json or "[]"):
-            continue
-
         try:
-            draft = PrankDraft.parse_raw(row.draft_json)
+            draft = PrankDraft.model_validate_json(row.draft_json)
         except Exception:
             draft = PrankDraft()
 
@@ -314,7 +352,7 @@ async def list_authoring_sessions(
 
 @router.get("/sessions/active", response_model=GetSessionResponse)
 async def get_active_authoring_session(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -355,11 +393,22 @@ async def get_active_authoring_session(
 @router.get("/sessions/{session_id}", response_model=GetSessionResponse)
 async def get_authoring_session(
     session_id: str,
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
-    """Return the full state of an authoring session (ownership verified)."""
+    """
+    Return the full state of an authoring session (ownership verified).
+
+    Honours If-None-Match: the ETag is (session id, updated_at), so an
+    unchanged session returns 304 without serialising its message history.
+    """
     session = await _require_session(session_id, current_user, db)
+    etag = make_etag(session.id, session.updated_at)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return GetSessionResponse(session=session)
 
 
@@ -367,7 +416,8 @@ async def get_authoring_session(
 async def send_authoring_message(
     session_id: str,
     body: SendMessageRequest,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -376,43 +426,136 @@ async def send_authoring_message(
 
     Accepts messages even when the session is already READY so the user
     can continue editing without losing session context.
+
+    The Server-Timing header splits the turn into model time and backend
+    overhead (context build, merge, persistence).
     """
     session = await _require_session(session_id, current_user, db)
+    user_turns = _check_message_limit(session)
 
-    # Hard cap: prevent runaway sessions
-    user_turns = sum(1 for m in session.messages if m.role == MessageRole.USER)
-    if user_turns >= _MAX_MESSAGES_PER_SESSION:
-        raise HTTPException(
-            status_code=429,
-            detail=(
-                f"Session message limit reached "
-                f"({_MAX_MESSAGES_PER_SESSION} messages per session)"
-            ),
+    async def _run_turn(content: str) -> tuple[SendMessageResponse, TurnTiming]:
+        failed = True
+        try:
+            with measure_turn() as timing, authoring_store.pinned(session_id):
+                await _ensure_current(session_id, current_user.id, db)
+                try:
+                    assistant_reply = await process_turn(authoring_store, session_id, content)
+                except ValueError as exc:
+                    logger.exception(
+                        "authoring.send_message: engine error user=%s session=%s",
+                        current_user.id, session_id,
+                    )
+                    raise HTTPException(status_code=500, detail=str(exc))
+
+                session = authoring_store.get_session(session_id)
+                await _persist_to_db(session, current_user.id, db)
+                failed = False
+        finally:
+            turn_metrics_writer.record_turn(session_id, timing, failed=failed)
+
+        logger.info(
+            "authoring.send_message: user=%s session=%s status=%s is_complete=%s turns=%d "
+            "model_ms=%.0f backend_ms=%.0f",
+            current_user.id, session_id, session.status, session.is_complete, user_turns + 1,
+            timing.model_ms, timing.backend_ms,
         )
 
+        return SendMessageResponse(
+            assistant_reply=assistant_reply,
+            draft=session.draft,
+            status=session.status,
+            is_complete=session.is_complete,
+            session=session,
+        ), timing
+
+    # Serialised per session; messages that arrive while a turn is in flight
+    # are answered together by the next one.
     try:
-        assistant_reply = process_turn(authoring_store, session_id, body.content)
-    except ValueError as exc:
-        logger.exception(
-            "authoring.send_message: engine error user=%s session=%s",
-            current_user.id, session_id,
-        )
-        raise HTTPException(status_code=500, detail=str(exc))
+        result, timing = await authoring_turn_queue.submit(session_id, body.content, _run_turn)
+    except TurnInterrupted as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    response.headers["Server-Timing"] = timing.server_timing()
+    return result
 
-    session = authoring_store.get_session(session_id)
-    await _persist_to_db(session, current_user.id, db)
 
-    logger.info(
-        "authoring.send_message: user=%s session=%s status=%s is_complete=%s turns=%d",
-        current_user.id, session_id, session.status, session.is_complete, user_turns + 1,
-    )
+def _sse_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
 
-    return SendMessageResponse(
-        assistant_reply=assistant_reply,
-        draft=session.draft,
-        status=session.status,
-        is_complete=session.is_complete,
-        session=session,
+
+@router.post("/sessions/{session_id}/messages/stream")
+async def stream_authoring_message(
+    session_id: str,
+    body: SendMessageRequest,
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Streaming variant of POST /sessions/{id}/messages (Server-Sent Events).
+
+    Events:
+      delta  {"text": "..."}         — next piece of the assistant reply
+      done   SendMessageResponse     — merged draft, status, is_complete and
+                                       the authoritative assistant_reply
+      error  {"detail": "..."}       — the turn failed; nothing was merged
+
+    Validation, rate limits and ownership are checked before the stream
+    opens, so those still fail with a normal HTTP status.
+    """
+    session = await _require_session(session_id, current_user, db)
+    user_turns = _check_message_limit(session)
+    user_id = current_user.id
+
+    async def _events():
+        # A streamed reply belongs to this connection, so it is never
+        # coalesced — it only waits for the session's in-flight turn.
+        async with authoring_turn_queue.exclusive(session_id):
+            failed = True
+            try:
+                with measure_turn() as timing, authoring_store.pinned(session_id):
+                    async with SessionLocal() as load_db:
+                        await _ensure_current(session_id, user_id, load_db)
+                    try:
+                        async for delta in process_turn_stream(authoring_store, session_id, body.content):
+                            yield _sse_event("delta", json.dumps({"text": delta}, ensure_ascii=False))
+                    except ValueError as exc:
+                        logger.exception(
+                            "authoring.stream_message: engine error user=%s session=%s",
+                            user_id, session_id,
+                        )
+                        yield _sse_event("error", json.dumps({"detail": str(exc)}, ensure_ascii=False))
+                        return
+
+                    final = authoring_store.get_session(session_id)
+                    # The request-scoped DB session is already closed once the handler has
+                    # returned the StreamingResponse, so persist on a fresh one.
+                    try:
+                        async with SessionLocal() as stream_db:
+                            await _persist_to_db(final, user_id, stream_db)
+                    except HTTPException as exc:
+                        # Lost a race with another worker's turn; the deltas already sent are void
+                        yield _sse_event("error", json.dumps({"detail": exc.detail}, ensure_ascii=False))
+                        return
+                    failed = False
+            finally:
+                turn_metrics_writer.record_turn(session_id, timing, streamed=True, failed=failed)
+
+        logger.info(
+            "authoring.stream_message: user=%s session=%s status=%s is_complete=%s turns=%d",
+            user_id, session_id, final.status, final.is_complete, user_turns + 1,
+        )
+        response = SendMessageResponse(
+            assistant_reply=final.messages[-1].content,
+            draft=final.draft,
+            status=final.status,
+            is_complete=final.is_complete,
+            session=final,
+        )
+        yield _sse_event("done", response.model_dump_json())
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -420,7 +563,7 @@ async def send_authoring_message(
 async def set_recipient_phone(
     session_id: str,
     body: SetPhoneRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Store the recipient phone number for this authoring session."""
@@ -436,10 +579,20 @@ async def set_recipient_phone(
     return Response(status_code=204)
 
 
+async def _compiled_prank(session: AuthoringSession) -> tuple[Optional[PrankPackage], list[str]]:
+    """Precompiled package + audio for the session's draft; a failure never blocks launch."""
+    try:
+        compiled = await prank_compiler.get(session.draft)
+    except Exception:
+        logger.exception("authoring.launch: compilation failed session=%s", session.id)
+        return None, []
+    return compiled.package, list(compiled.audio_urls)
+
+
 @router.post("/sessions/{session_id}/launch", response_model=LaunchSessionResponse)
 async def launch_authoring_session(
     session_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -451,6 +604,10 @@ async def launch_authoring_session(
     launched_at timestamp.
 
     A session must be marked is_complete before it can be launched.
+
+    The response carries the PrankPackage and pre-rendered audio compiled
+    when the session became READY (or compiled now if that has not finished),
+    so the call can be dialled straight away.
     """
     session = await _require_session(session_id, current_user, db)
 
@@ -460,6 +617,8 @@ async def launch_authoring_session(
             detail="Session is not complete — cannot record launch",
         )
 
+    package, audio_urls = await _compiled_prank(session)
+
     # Check for existing launch record (idempotent)
     try:
         sid = uuid.UUID(session_id)
@@ -475,7 +634,9 @@ async def launch_authoring_session(
             "authoring.launch: user=%s session=%s already_launched_at=%s",
             current_user.id, session_id, db_row.launched_at,
         )
-        return LaunchSessionResponse(launched=True, launched_at=db_row.launched_at)
+        return LaunchSessionResponse(
+            launched=True, launched_at=db_row.launched_at, package=package, audio_urls=audio_urls
+        )
 
     now = datetime.now(timezone.utc)
     await _persist_to_db(session, current_user.id, db, launched_at=now)
@@ -484,4 +645,142 @@ async def launch_authoring_session(
         "authoring.launch: user=%s session=%s launched_at=%s",
         current_user.id, session_id, now,
     )
-    return LaunchSessionResponse(launched=True, launched_at=now)
+    return LaunchSessionResponse(launched=True, launched_at=now, package=package, audio_urls=audio_urls)
+
+
+async def _turn_metric_buckets(db: AsyncSession, group_by, since: datetime) -> list[TurnMetricsBucket]:
+    m = AuthoringTurnMetric
+    # One labelled expression for SELECT and GROUP BY, so both share a single
+    # bind for "none" — Postgres rejects GROUP BY coalesce(..., $2) as a
+    # different expression from the selected coalesce(..., $1)
+    key = func.coalesce(group_by, "none").label("key")
+    rows = (
+        await db.execute(
+            select(
+                key,
+                func.count(),
+                func.percentile_cont(0.5).within_group(m.model_ms),
+                func.percentile_cont(0.95).within_group(m.model_ms),
+                func.percentile_cont(0.5).within_group(m.backend_ms),
+                func.percentile_cont(0.95).within_group(m.backend_ms),
+                func.avg(m.prompt_tokens),
+                func.avg(m.cached_tokens),
+                func.avg(m.completion_tokens),
+                func.sum(m.parse_failures),
+                func.count().filter(m.handoff_overridden),
+                func.count().filter(m.cache_hit),
+                func.count().filter(m.failed),
+            )
+            .where(m.created_at >= since)
+            .group_by(key)
+            .order_by(func.count().desc())
+        )
+    ).all()
+    return [
+        TurnMetricsBucket(
+            key=row[0],
+            turns=row[1],
+            model_ms_p50=row[2],
+            model_ms_p95=row[3],
+            backend_ms_p50=row[4],
+            backend_ms_p95=row[5],
+            avg_prompt_tokens=row[6],
+            avg_cached_tokens=row[7],
+            avg_completion_tokens=row[8],
+            parse_failures=row[9],
+            handoff_overrides=row[10],
+            cache_hits=row[11],
+            failed_turns=row[12],
+        )
+        for row in rows
+    ]
+
+
+@router.get(
+    "/metrics/turns",
+    response_model=TurnMetricsResponse,
+    dependencies=[Depends(require_internal_access)],
+)
+async def get_turn_metrics(
+    hours: float = Query(24, gt=0, le=24 * 30),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Aggregate authoring-turn telemetry over the last `hours`: p50/p95 model
+    latency and backend overhead, average token counts, and failure counters,
+    grouped per model and per starting status.
+
+    Aggregates across all users — operator-only (require_internal_access).
+    """
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    return TurnMetricsResponse(
+        since=since,
+        by_model=await _turn_metric_buckets(db, AuthoringTurnMetric.model, since),
+        by_status=await _turn_metric_buckets(db, AuthoringTurnMetric.status, since),
+    )
+
+
+@router.get(
+    "/metrics/shadow",
+    response_model=PromptShadowResponse,
+    dependencies=[Depends(require_internal_access)],
+)
+async def get_prompt_shadow_metrics(
+    hours: float = Query(24, gt=0, le=24 * 30),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Compare the live prompt version with shadow candidates over the last
+    `hours`: p50/p95 model latency, average token counts and the share of
+    turns whose reply completes the draft, from the same turns replayed on
+    both versions (see authoring_shadow).
+
+    Covers every session — operator-only (require_internal_access).
+    """
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    r = AuthoringPromptShadowRun
+    rows = (
+        await db.execute(
+            select(
+                r.primary_version,
+                r.candidate_version,
+                func.count(),
+                func.count(r.candidate_error),
+                func.percentile_cont(0.5).within_group(r.primary_model_ms),
+                func.percentile_cont(0.95).within_group(r.primary_model_ms),
+                func.percentile_cont(0.5).within_group(r.candidate_model_ms),
+                func.percentile_cont(0.95).within_group(r.candidate_model_ms),
+                func.avg(r.primary_prompt_tokens),
+                func.avg(r.candidate_prompt_tokens),
+                func.avg(r.primary_completion_tokens),
+                func.avg(r.candidate_completion_tokens),
+                func.avg(cast(r.primary_completes_draft, Integer)),
+                func.avg(cast(func.coalesce(r.candidate_completes_draft, False), Integer)),
+            )
+            .where(r.created_at >= since)
+            .group_by(r.primary_version, r.candidate_version)
+            .order_by(func.count().desc())
+        )
+    ).all()
+    return PromptShadowResponse(
+        since=since,
+        comparisons=[
+            PromptShadowComparison(
+                primary_version=row[0],
+                candidate_version=row[1],
+                turns=row[2],
+                candidate_errors=row[3],
+                primary_ms_p50=row[4],
+                primary_ms_p95=row[5],
+                candidate_ms_p50=row[6],
+                candidate_ms_p95=row[7],
+                avg_primary_prompt_tokens=row[8],
+                avg_candidate_prompt_tokens=row[9],
+                avg_primary_completion_tokens=row[10],
+                avg_candidate_completion_tokens=row[11],
+                primary_completion_rate=row[12],
+                candidate_completion_rate=row[13],
+            )
+            for row in rows
+        ],
+    )
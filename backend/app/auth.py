@@ -1,4 +1,6 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import bcrypt
 from fastapi import HTTPException
@@ -8,27 +10,61 @@ JWT_SECRET = os.environ["JWT_SECRET"]
 JWT_ALGORITHM = os.environ.get("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# bcrypt cost factor for new hashes; existing hashes are upgraded on login.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+# bcrypt releases the GIL, so these threads hash in parallel with the event
+# loop.  Kept small so a login burst queues instead of eating every core.
+BCRYPT_MAX_THREADS = int(os.environ.get("BCRYPT_MAX_THREADS", "2"))
+
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=BCRYPT_MAX_THREADS, thread_name_prefix="bcrypt"
+)
+
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode(), hashed.encode())
 
 
+def needs_rehash(hashed: str) -> bool:
+    """True if hashed was produced with a cost other than BCRYPT_ROUNDS."""
+    try:
+        rounds = int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return False  # not a bcrypt hash we understand — leave it alone
+    return rounds != BCRYPT_ROUNDS
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password on the bcrypt pool — never call bcrypt on the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_executor, hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_executor, verify_password, password, hashed)
+
+
 def create_access_token(subject: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {"sub": subject, "exp": expire}
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
-def verify_access_token(token: str) -> str:
+def decode_access_token(token: str) -> dict:
+    """Verify the token and return its claims (sub and exp are guaranteed)."""
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        sub: str = payload.get("sub")
-        if sub is None:
-            raise HTTPException(status_code=401, detail="Invalid token")
-        return sub
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+    if payload.get("sub") is None or payload.get("exp") is None:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return payload
+
+
+def verify_access_token(token: str) -> str:
+    return decode_access_token(token)["sub"]
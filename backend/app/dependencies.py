@@ -1,15 +1,21 @@
+import hmac
+import os
 import uuid
-from fastapi import Depends, HTTPException
+from fastapi import Depends, Header, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import User
-from app.auth import verify_access_token
+from app.auth import decode_access_token, verify_access_token
+from app.principal_cache import Principal, principal_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
+# Shared secret for operator-only endpoints (telemetry); unset = those endpoints are off
+INTERNAL_API_TOKEN = os.environ.get("INTERNAL_API_TOKEN", "").strip()
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -20,3 +26,43 @@ async def get_current_user(
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
     return user
+
+
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    """
+    Cached variant of get_current_user for endpoints that only need identity.
+
+    A cache hit skips both JWT decoding and the users query (the AsyncSession
+    never checks out a connection).  Endpoints that spend or check credits
+    must keep using get_current_user.
+    """
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+
+    claims = decode_access_token(token)
+    user = await db.scalar(select(User).where(User.id == uuid.UUID(claims["sub"])))
+    if user is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    principal = Principal.from_user(user)
+    principal_cache.put(token, principal, float(claims["exp"]))
+    return principal
+
+
+async def require_internal_access(
+    x_internal_token: str = Header(default=""),
+) -> None:
+    """
+    Gate for operator-only endpoints that expose data across all users.
+
+    End-user JWTs never grant access: the caller must send INTERNAL_API_TOKEN
+    in the X-Internal-Token header.  With no token configured every request
+    is refused.
+    """
+    if not INTERNAL_API_TOKEN or not hmac.compare_digest(
+        x_internal_token.encode(), INTERNAL_API_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Forbidden")
@@ -0,0 +1,41 @@
+"""
+Weak ETags for conditional GETs.
+
+Tags are derived from cheap row metadata (row id + updated_at), never from
+the response body, so a matching If-None-Match is answered with 304 before
+any Pydantic model is built or serialised.
+"""
+from datetime import datetime
+
+from fastapi import Request, Response
+
+
+def _etag_part(part: object) -> str:
+    if isinstance(part, datetime):
+        # Microsecond epoch in hex — compact and timezone-independent
+        return format(int(part.timestamp() * 1_000_000), "x")
+    return str(part)
+
+
+def make_etag(*parts: object) -> str:
+    return 'W/"' + "-".join(_etag_part(p) for p in parts) + '"'
+
+
+def _opaque(tag: str) -> str:
+    """Strip the weak prefix — If-None-Match uses weak comparison (RFC 9110 §13.1.2)."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = _opaque(etag)
+    return any(_opaque(candidate) == target for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
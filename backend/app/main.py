@@ -1,23 +1,37 @@
+import asyncio
 import base64
 import json
 import logging
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import DATABASE_URL, get_db
 from app.models import User
-from app.auth import hash_password, verify_password, create_access_token
-from app.dependencies import get_current_user
+from app.auth import (
+    create_access_token,
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+from app.dependencies import get_current_principal, get_current_user
+from app.principal_cache import Principal
+from app.etag import is_not_modified, make_etag, not_modified
+from app.services.authoring_engine import close_model_provider, init_model_provider
+from app.services.change_bus import change_bus
 from app.services.prank_orchestrator import PrankOrchestrator, PrankEventType
 from app.services.prank_session_service import PrankSessionService
+from app.services.session_state_notifier import session_state_notifier
+from app.services.authoring_shadow import prompt_shadow
+from app.services.turn_metrics_writer import turn_metrics_writer
 from app.services.telnyx_call_service import TelnyxCallService
 from app.models.prank_session import PrankSessionState
 
@@ -34,7 +48,16 @@ async def lifespan(_app: FastAPI):
         raise RuntimeError(
             "Required environment variable MAX_CALL_DURATION_SECONDS is not set"
         )
-    yield
+    init_model_provider()
+    await change_bus.start(DATABASE_URL)
+    await turn_metrics_writer.start()
+    try:
+        yield
+    finally:
+        await prompt_shadow.stop()
+        await turn_metrics_writer.stop()
+        await change_bus.stop()
+        await close_model_provider()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -122,7 +145,7 @@ async def register(body: RegisterRequest, db: AsyncSession = Depends(get_db)):
 
     user = User(
         email=body.email,
-        hashed_password=hash_password(body.password),
+        hashed_password=await hash_password_async(body.password),
         phone_number=body.phone_number,
         credits=1,
     )
@@ -136,15 +159,21 @@ async def register(body: RegisterRequest, db: AsyncSession = Depends(get_db)):
 @app.post("/login", response_model=TokenResponse)
 async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
     user = await db.scalar(select(User).where(User.email == form_data.username))
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    # Transparently move the stored hash to the configured BCRYPT_ROUNDS
+    if needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(form_data.password)
+        await db.commit()
+        logger.info("Rehashed password for user %s with the current bcrypt cost", user.id)
+
     token = create_access_token(str(user.id))
     return TokenResponse(access_token=token)
 
 
 @app.get("/me", response_model=UserResponse)
-async def me(current_user: User = Depends(get_current_user)):
+async def me(current_user: Principal = Depends(get_current_principal)):
     return current_user
 
 
@@ -171,19 +200,69 @@ async def start_prank(
     )
 
 
-@app.get("/pranks/{session_id}", response_model=PrankSessionResponse)
-async def get_prank_session(
+# Long-poll bounds for GET /pranks/{id}?wait_for_change_from=...
+# Kept below common proxy/mobile idle timeouts (~30s).
+_LONG_POLL_DEFAULT_TIMEOUT_SECONDS = 25
+_LONG_POLL_MAX_TIMEOUT_SECONDS = 30
+
+
+async def _get_owned_prank_session(
+    service: PrankSessionService,
     session_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal,
 ):
-    service = PrankSessionService(db)
     try:
         session = await service.get_session(session_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Session not found")
     if session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Forbidden")
+    return session
+
+
+@app.get("/pranks/{session_id}", response_model=PrankSessionResponse)
+async def get_prank_session(
+    session_id: UUID,
+    request: Request,
+    response: Response,
+    wait_for_change_from: Optional[PrankSessionState] = None,
+    timeout: float = Query(
+        _LONG_POLL_DEFAULT_TIMEOUT_SECONDS, ge=0, le=_LONG_POLL_MAX_TIMEOUT_SECONDS
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Return the prank session state.
+
+    Long-poll mode: with ?wait_for_change_from=<state> the request parks until
+    the session leaves that state or `timeout` seconds pass, then returns the
+    current state.  Returns immediately if the session is already elsewhere.
+
+    Honours If-None-Match with an ETag of (session id, updated_at).
+    """
+    service = PrankSessionService(db)
+    if wait_for_change_from is None:
+        session = await _get_owned_prank_session(service, session_id, current_user)
+    else:
+        # Listen before reading so a transition between the read and the wait
+        # still wakes us.
+        with session_state_notifier.listen(session_id) as changed:
+            session = await _get_owned_prank_session(service, session_id, current_user)
+            if session.state == wait_for_change_from:
+                # End the read transaction so the pooled connection is not
+                # held for the whole park.
+                await db.commit()
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                await db.refresh(session)
+
+    etag = make_etag(session.id, session.updated_at)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return PrankSessionResponse(
         id=str(session.id),
         state=session.state.value,
@@ -1,5 +1,16 @@
 from app.models.user import User
 from app.models.prank_session import PrankSession, PrankSessionState
 from app.models.authoring_draft import AuthoringDraft
+from app.models.authoring_message import AuthoringDraftMessage
+from app.models.authoring_turn_metric import AuthoringTurnMetric
+from app.models.authoring_prompt_shadow_run import AuthoringPromptShadowRun
 
-__all__ = ["User", "PrankSession", "PrankSessionState", "AuthoringDraft"]
+__all__ = [
+    "User",
+    "PrankSession",
+    "PrankSessionState",
+    "AuthoringDraft",
+    "AuthoringDraftMessage",
+    "AuthoringTurnMetric",
+    "AuthoringPromptShadowRun",
+]
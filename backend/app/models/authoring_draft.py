@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -17,9 +17,14 @@ class AuthoringDraft(Base):
     is the write-through backing store that survives server restarts and
     provides the data for the user's prank history.
 
-    draft_json / messages_json store the serialized Pydantic models as JSON
-    text.  JSONB would allow server-side querying but Text is sufficient for
-    V1 — the app fetches full rows and deserialises in Python.
+    draft_json stores the serialized PrankDraft as JSON text.  JSONB would
+    allow server-side querying but Text is sufficient for V1 — the app
+    fetches full rows and deserialises in Python.  The message history lives
+    in authoring_messages (AuthoringDraftMessage), one row per message.
+
+    version is the optimistic-concurrency counter: PostgresSessionBackend
+    only writes a row still at the version the worker loaded, so workers
+    sharing this table cannot overwrite each other's turns.
     """
 
     __tablename__ = "authoring_drafts"
@@ -46,8 +51,6 @@ class AuthoringDraft(Base):
     )
     # Full PrankDraft JSON — updated on every turn
     draft_json: Mapped[str] = mapped_column(Text, nullable=False, server_default="'{}'")
-    # Full message list JSON — updated on every turn
-    messages_json: Mapped[str] = mapped_column(Text, nullable=False, server_default="'[]'")
     recipient_phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
     is_complete: Mapped[bool] = mapped_column(
         Boolean,
@@ -57,6 +60,13 @@ class AuthoringDraft(Base):
     # Denormalised from PrankDraft.prank_title — allows cheap list rendering
     # without deserialising draft_json for every row.
     prank_title: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    # Rolling history summary (authoring_history): messages before
+    # summarized_through are represented only by context_summary in the
+    # model's context.  Persisted because each compaction builds on the last.
+    context_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    summarized_through: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    # Incremented by every save (see authoring_session_backend)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
     # Set the moment the user taps "Стартирай пранка".  Null = not yet launched.
     launched_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
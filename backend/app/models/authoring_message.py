@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class AuthoringDraftMessage(Base):
+    """
+    One message of an authoring session (append-only).
+
+    A turn inserts only the messages it added — seq continues from the
+    count already stored — instead of rewriting the whole history, and a
+    session's log is read back with one ordered scan of the primary key.
+    Rows go away with their draft (ON DELETE CASCADE).
+    """
+
+    __tablename__ = "authoring_messages"
+
+    draft_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("authoring_drafts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # 0-based position in the session's message log
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # MessageRole value ("user", "assistant")
+    role: Mapped[str] = mapped_column(String(20), nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    # AuthoringMessage.timestamp — set by the app, not the insert time
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
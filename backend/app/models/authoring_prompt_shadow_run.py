@@ -0,0 +1,54 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class AuthoringPromptShadowRun(Base):
+    """
+    One live authoring turn replayed on a candidate prompt version (append-only).
+
+    Written by authoring_shadow after the primary turn has been answered; the
+    candidate's reply is only measured, never shown or applied.  Each row
+    pairs the primary call's latency, tokens and draft completion with the
+    candidate's, on the same model and context.  Aggregated by
+    GET /authoring/metrics/shadow.
+
+    session_id is deliberately not a foreign key, as for authoring_turn_metrics.
+    """
+
+    __tablename__ = "authoring_prompt_shadow_runs"
+    __table_args__ = (
+        Index("ix_authoring_prompt_shadow_runs_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    # AuthoringStatus value the turn started in
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    primary_version: Mapped[str] = mapped_column(String(20), nullable=False)
+    candidate_version: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    primary_model_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    primary_prompt_tokens: Mapped[int] = mapped_column(Integer, nullable=False)
+    primary_completion_tokens: Mapped[int] = mapped_column(Integer, nullable=False)
+    # The reply, merged into the draft, completes it
+    primary_completes_draft: Mapped[bool] = mapped_column(Boolean, nullable=False)
+
+    # Null when the candidate call failed (see candidate_error)
+    candidate_model_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    candidate_prompt_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    candidate_completion_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    candidate_completes_draft: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    # "timeout", "invalid_output" or "error"
+    candidate_error: Mapped[str | None] = mapped_column(String(50), nullable=True)
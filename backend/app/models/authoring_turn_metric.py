@@ -0,0 +1,55 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class AuthoringTurnMetric(Base):
+    """
+    Telemetry for one System 1 authoring turn (append-only).
+
+    Written in batches by turn_metrics_writer after the response has been
+    sent, so a slow or unavailable metrics insert never delays a turn.
+    Aggregated by GET /authoring/metrics/turns.
+
+    session_id is deliberately not a foreign key: telemetry must not block
+    deleting drafts, and rows outlive the sessions they describe.
+    """
+
+    __tablename__ = "authoring_turn_metrics"
+    __table_args__ = (
+        Index("ix_authoring_turn_metrics_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    # AuthoringStatus value the turn started in
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Model / tier of the call that produced the reply; null when no model
+    # call completed (cache hit or failed turn)
+    model: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    tier: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    model_calls: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    prompt_tokens: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    cached_tokens: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    completion_tokens: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    model_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    backend_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    parse_failures: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    handoff_overridden: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, server_default=text("false")
+    )
+    cache_hit: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    streamed: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    # The turn raised (model failure, timeout, invalid output) — nothing was merged
+    failed: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
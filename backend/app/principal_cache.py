@@ -0,0 +1,121 @@
+"""
+Process-local cache of resolved principals for authenticated requests.
+
+get_current_principal() consults this before decoding the JWT and loading
+the user row, so polls and authoring turns normally skip the DB entirely.
+
+  - Keyed by SHA-256 of the bearer token (raw tokens are never held).
+  - LRU-bounded; each entry expires after PRINCIPAL_CACHE_TTL_SECONDS or at
+    the token's own `exp`, whichever comes first.
+  - Entries are dropped per user when their credits change — locally via
+    invalidate_user(), and on other workers via the change bus.
+
+The credits value in a Principal is a snapshot for display only; anything
+that spends credits must read the User row transactionally.
+"""
+import hashlib
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.models.user import User
+from app.services.change_bus import CHANNEL_USER, change_bus
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.environ.get("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.environ.get("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Slim, immutable snapshot of the authenticated user."""
+    id: uuid.UUID
+    email: str
+    phone_number: str
+    credits: int
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            phone_number=user.phone_number,
+            credits=user.credits,
+        )
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class PrincipalCache:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        # key → (monotonic expiry, principal); order = LRU (oldest first)
+        self._entries: OrderedDict[bytes, tuple[float, Principal]] = OrderedDict()
+        self._keys_by_user: dict[uuid.UUID, set[bytes]] = {}
+
+    def get(self, token: str) -> Optional[Principal]:
+        key = _token_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            self._remove(key, principal.id)
+            return None
+        self._entries.move_to_end(key)
+        return principal
+
+    def put(self, token: str, principal: Principal, token_exp: float) -> None:
+        """Cache principal for token; token_exp is the JWT `exp` (epoch seconds)."""
+        lifetime = min(self._ttl_seconds, token_exp - time.time())
+        if lifetime <= 0:
+            return
+        key = _token_key(token)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._discard_user_key(previous[1].id, key)
+        self._entries[key] = (time.monotonic() + lifetime, principal)
+        self._keys_by_user.setdefault(principal.id, set()).add(key)
+        while len(self._entries) > self._max_entries:
+            old_key, (_, old_principal) = self._entries.popitem(last=False)
+            self._discard_user_key(old_principal.id, old_key)
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        for key in self._keys_by_user.pop(user_id, ()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: bytes, user_id: uuid.UUID) -> None:
+        self._entries.pop(key, None)
+        self._discard_user_key(user_id, key)
+
+    def _discard_user_key(self, user_id: uuid.UUID, key: bytes) -> None:
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_MAX_ENTRIES, PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def _on_remote_user_change(payload: dict) -> None:
+    principal_cache.invalidate_user(uuid.UUID(payload["u"]))
+
+
+change_bus.subscribe(CHANNEL_USER, _on_remote_user_change)
@@ -1,8 +1,11 @@
 import re
+from array import array
+from collections.abc import Sequence
 from enum import Enum
-from typing import Optional
-from datetime import datetime
-from pydantic import BaseModel, field_validator
+from typing import Any, Iterable, Optional, overload
+from datetime import datetime, timedelta, timezone
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler, field_validator
+from pydantic_core import core_schema
 
 
 # Accepted phone format (after stripping spaces, dashes, parentheses):
@@ -149,6 +152,118 @@ class AuthoringMessage(BaseModel):
     timestamp: datetime
 
 
+_ROLES = (MessageRole.USER, MessageRole.ASSISTANT)          # index = stored role code
+_ROLE_CODES = {role: code for code, role in enumerate(_ROLES)}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(timestamp: datetime) -> int:
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+class MessageLog(Sequence):
+    """
+    Compact message history of an authoring session.
+
+    Held as parallel arrays — a role code per message (bytearray), the
+    contents (list of str) and UTC timestamps as epoch microseconds
+    (array "q") — instead of one AuthoringMessage, datetime and enum per
+    message.  Indexing or iterating materialises AuthoringMessage objects on
+    demand; role_at / content_at / contents / count_role read the arrays
+    directly.
+
+    Validates from, and serialises to, list[AuthoringMessage], so the API
+    shape is unchanged.  Persisted one row per message (authoring_messages,
+    see authoring_session_backend).
+    """
+
+    __slots__ = ("_roles", "_contents", "_timestamps")
+
+    def __init__(self, messages: Iterable[AuthoringMessage] = ()) -> None:
+        self._roles = bytearray()
+        self._contents: list[str] = []
+        self._timestamps = array("q")
+        for message in messages:
+            self.append(message)
+
+    def add(self, role: MessageRole, content: str, timestamp: datetime) -> None:
+        self._roles.append(_ROLE_CODES[role])
+        self._contents.append(content)
+        self._timestamps.append(_epoch_us(timestamp))
+
+    def append(self, message: AuthoringMessage) -> None:
+        self.add(message.role, message.content, message.timestamp)
+
+    def role_at(self, index: int) -> MessageRole:
+        return _ROLES[self._roles[index]]
+
+    def content_at(self, index: int) -> str:
+        return self._contents[index]
+
+    def timestamp_at(self, index: int) -> datetime:
+        return _EPOCH + self._timestamps[index] * _MICROSECOND
+
+    def contents(self, start: int = 0) -> list[str]:
+        return self._contents[start:]
+
+    def count_role(self, role: MessageRole) -> int:
+        return self._roles.count(_ROLE_CODES[role])
+
+    def _message(self, index: int) -> AuthoringMessage:
+        return AuthoringMessage.model_construct(
+            role=_ROLES[self._roles[index]],
+            content=self._contents[index],
+            timestamp=self.timestamp_at(index),
+        )
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    @overload
+    def __getitem__(self, index: int) -> AuthoringMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[AuthoringMessage]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._message(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message index out of range")
+        return self._message(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MessageLog):
+            return (
+                self._roles == other._roles
+                and self._contents == other._contents
+                and self._timestamps == other._timestamps
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessageLog({len(self)} messages)"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        as_list = handler.generate_schema(list[AuthoringMessage])
+        from_list = core_schema.no_info_after_validator_function(cls, as_list)
+        return core_schema.json_or_python_schema(
+            json_schema=from_list,
+            # An existing MessageLog is kept as-is (not copied), so the store's
+            # appends land in the session that holds it
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_list]),
+            serialization=core_schema.plain_serializer_function_ser_schema(list, return_schema=as_list),
+        )
+
+
 class AuthoringContext(BaseModel):
     """
     Packaged input for one authoring model turn.
@@ -163,6 +278,8 @@ class AuthoringContext(BaseModel):
     recent_messages: list[AuthoringMessage]
     latest_user_message: str
     total_user_turns: int   # used by stub; real LLM reads history directly
+    history_summary: Optional[str] = None   # turns folded out of recent_messages
+    previous_draft: Optional[PrankDraft] = None   # draft as sent in the previous turn's prompt
 
 
 class AuthoringSession(BaseModel):
@@ -171,10 +288,20 @@ class AuthoringSession(BaseModel):
     updated_at: datetime
     status: AuthoringStatus
     draft: PrankDraft
-    messages: list[AuthoringMessage]
+    messages: MessageLog
     latest_assistant_question: Optional[str] = None
     is_complete: bool = False
     recipient_phone: Optional[str] = None
+    # Model-context bookkeeping — internal, never serialized.  The history
+    # summary (authoring_history) is persisted with the session; the draft
+    # last shown to the model is not (a reload simply marks nothing changed).
+    context_summary: Optional[str] = Field(default=None, exclude=True)
+    summarized_through: int = Field(default=0, exclude=True)
+    prompted_draft: Optional[PrankDraft] = Field(default=None, exclude=True)
+    # authoring_drafts.version this copy was loaded or last saved at; 0 = never saved
+    version: int = Field(default=0, exclude=True)
+    # messages[:persisted_messages] are already rows in authoring_messages
+    persisted_messages: int = Field(default=0, exclude=True)
 
 
 # ---------- request / response models ----------
@@ -243,3 +370,56 @@ class ListSessionsResponse(BaseModel):
 class LaunchSessionResponse(BaseModel):
     launched: bool
     launched_at: Optional[datetime]
+    package: Optional[PrankPackage] = None   # precompiled at READY (None if compilation failed)
+    audio_urls: list[str] = []               # pre-rendered script lines, in call order
+
+
+# ---------- telemetry ----------
+
+class TurnMetricsBucket(BaseModel):
+    """Aggregate over authoring_turn_metrics rows sharing one model or status."""
+    model_config = ConfigDict(protected_namespaces=())   # model_ms_* are latency fields
+
+    key: str
+    turns: int
+    model_ms_p50: float
+    model_ms_p95: float
+    backend_ms_p50: float
+    backend_ms_p95: float
+    avg_prompt_tokens: float
+    avg_cached_tokens: float
+    avg_completion_tokens: float
+    parse_failures: int
+    handoff_overrides: int
+    cache_hits: int
+    failed_turns: int
+
+
+class TurnMetricsResponse(BaseModel):
+    since: datetime
+    by_model: list[TurnMetricsBucket]    # key "none" = no model call (cache hit / failure)
+    by_status: list[TurnMetricsBucket]   # key = status the turn started in
+
+
+class PromptShadowComparison(BaseModel):
+    """Primary vs candidate prompt version over authoring_prompt_shadow_runs."""
+    primary_version: str
+    candidate_version: str
+    turns: int
+    candidate_errors: int                 # timeouts, failed calls, invalid output
+    primary_ms_p50: float
+    primary_ms_p95: float
+    candidate_ms_p50: Optional[float]     # None if every candidate call failed
+    candidate_ms_p95: Optional[float]
+    avg_primary_prompt_tokens: float
+    avg_candidate_prompt_tokens: Optional[float]
+    avg_primary_completion_tokens: float
+    avg_candidate_completion_tokens: Optional[float]
+    # Share of turns whose reply completes the draft; a failed candidate counts as not completing
+    primary_completion_rate: float
+    candidate_completion_rate: float
+
+
+class PromptShadowResponse(BaseModel):
+    since: datetime
+    comparisons: list[PromptShadowComparison]
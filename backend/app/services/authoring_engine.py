@@ -3,31 +3,71 @@ System 1 authoring engine.
 
 Architecture
 ------------
-process_turn() is the single public entry point. It runs these phases in order:
+process_turn() is the single public entry point (async — the model call never
+blocks the event loop). It runs these phases in order:
 
   1. Load session / persist user message
-  2. Build AuthoringContext  (_build_authoring_context)
-  3. Call model              (_call_model)
+  2. Build AuthoringContext  (_build_authoring_context — token-budgeted
+                             history + rolling summary, see authoring_history)
+  3. Call model              (_routed_call — picks the FAST or STRONG tier
+                             with _route_tier and re-runs an unusable FAST
+                             reply once on STRONG; or a cached first-turn
+                             reply from authoring_response_cache)
   4. Validate / sanitize     (_sanitize_result)
   5. Merge into draft        (_merge_draft)
   6. Determine new status    (_determine_status)    ← backend-authoritative
   7. Persist state + reply
+  8. READY → compile the PrankPackage + audio in the background
+                             (prank_compiler), so launch finds it prepared
+
+process_turn_stream() runs the same phases but streams the model completion
+through ReplyStreamParser (authoring_stream_parser) and yields the `reply`
+text as it is decoded, so the client sees tokens while the rest of the JSON
+(draft_update, status hints) is still being generated.  The complete object
+is then validated and applied by the same phases 4–7.
 
 LLM integration
 ---------------
-_call_model(ctx) is the only OpenAI-touching function. It uses:
+_call_model(ctx, tier) / _stream_model(ctx, tier) are the only
+model-touching functions; _routed_call() and process_turn_stream() choose
+the tier.  They use:
+  - one process-wide ModelProvider (authoring_providers; AUTHORING_PROVIDER
+    selects OpenAI or the offline stub), created at startup by
+    init_model_provider() and closed by close_model_provider() (both called
+    from the app lifespan)
   - build_provider_messages(ctx) from authoring_prompts for the messages array
-  - OPENAI_MODEL env var for model name (default: gpt-4o-mini)
+  - a model tier per turn (_route_tier): easy turns — edits and
+    confirmations of a complete draft, short answers once the creative
+    fields are filled — go to OPENAI_MODEL_FAST, everything else to
+    OPENAI_MODEL (default: gpt-4o-mini).  A fast-tier reply that fails
+    validation, or claims ready_for_handoff for a draft that is not complete,
+    is re-run once on the strong tier, if enough of the turn's deadline is
+    left (AUTHORING_ESCALATION_MIN_SECONDS).
   - response_format json_object for structured output
-  - AuthoringLLMResult.parse_raw() to validate the response
-
-Everything outside _call_model (merge, sanitize, status, persistence) is unchanged.
+  - prompt_cache_key per session, so a session's turns are routed to the
+    provider cache that already holds their shared prefix
+  - AuthoringLLMResult.model_validate_json() to validate the response
+
+Every call records prompt / cached / completion tokens and latency through
+authoring_metrics.record_turn_usage().
+
+Prompt changes can be trialled on live traffic first: prompt_shadow
+(authoring_shadow) replays a sample of model-answered turns on the
+AUTHORING_SHADOW_PROMPT_VERSION candidate, off the request path.
+
+Tail latency: a turn has one deadline, AUTHORING_TURN_DEADLINE_SECONDS after
+the model is first called, shared by the routed call and any escalation (an
+escalation is skipped when too little of it is left).  A blocking call that
+is still outstanding after the recent p95 latency is hedged with an identical second request (first success wins, the other
+is cancelled).  Hedge delays are tracked per tier.
 """
 
+import asyncio
 import logging
 import os
-
-import openai
+import time
+from enum import Enum
+from typing import AsyncIterator, Optional
 
 from app.schemas.prank_authoring import (
     AuthoringContext,
@@ -44,13 +84,34 @@ from app.schemas.prank_authoring import (
     Progression,
     TargetEffect,
 )
-from app.services.authoring_prompts import build_provider_messages, build_system_prompt
+from app.services.authoring_history import compact_history
+from app.services.authoring_metrics import (
+    LatencyWindow,
+    add_model_time,
+    current_turn,
+    record_attempt_cancelled,
+    record_escalation,
+    record_hedge,
+    record_turn_usage,
+    usage_from_completion,
+)
+from app.services.authoring_prompts import (
+    CREATIVE_FIELDS,
+    build_provider_messages,
+    build_system_prompt,
+)
+from app.services.authoring_providers import AUTHORING_PROVIDER, ModelProvider, create_provider
+from app.services.authoring_response_cache import (
+    AUTHORING_RESPONSE_CACHE_ENABLED,
+    authoring_response_cache,
+)
+from app.services.authoring_shadow import prompt_shadow
 from app.services.authoring_store import AuthoringStore
+from app.services.authoring_stream_parser import ReplyStreamParser
+from app.services.prank_compiler import prank_compiler
 
 logger = logging.getLogger(__name__)
 
-_RECENT_MESSAGES_WINDOW = 8  # messages included in model context
-
 
 # =============================================================================
 # Context builder
@@ -58,16 +119,19 @@ _RECENT_MESSAGES_WINDOW = 8  # messages included in model context
 
 def _build_authoring_context(session: AuthoringSession, latest_user_message: str) -> AuthoringContext:
     missing = _compute_missing_fields(session.draft)
-    user_turns = sum(1 for m in session.messages if m.role == MessageRole.USER)
+    user_turns = session.messages.count_role(MessageRole.USER)
+    recent = compact_history(session)
     return AuthoringContext(
-        system_instructions=build_system_prompt(),
+        system_instructions=build_system_prompt(session.status, missing),
         session_id=session.id,
         current_status=session.status,
         current_draft=session.draft,
         missing_fields=missing,
-        recent_messages=session.messages[-_RECENT_MESSAGES_WINDOW:],
+        recent_messages=recent,
         latest_user_message=latest_user_message,
         total_user_turns=user_turns,
+        history_summary=session.context_summary,
+        previous_draft=session.prompted_draft,
     )
 
 
@@ -101,73 +165,419 @@ def _is_draft_complete(draft: PrankDraft) -> bool:
 
 
 # =============================================================================
-# OpenAI config helpers
+# Provider / model config
 # =============================================================================
 
 # gpt-4o-mini: fast, cheap, reliable structured JSON output — right fit for
 # guided authoring. Override with OPENAI_MODEL for stronger reasoning if needed.
 _MODEL_DEFAULT = "gpt-4o-mini"
 
+_provider: Optional[ModelProvider] = None
+
 
-def _get_openai_client() -> openai.OpenAI:
+def init_model_provider() -> None:
     """
-    Return an OpenAI client. Fails clearly if OPENAI_API_KEY is not set.
-    Client is created per-call (OpenAI SDK is stateless; cost is negligible).
+    Create the process-wide model provider. Called once at startup.
+
+    A missing OPENAI_API_KEY is not fatal here — the rest of the API still
+    works; authoring turns fail clearly in _get_provider() instead.
+    """
+    global _provider
+    if _provider is not None:
+        return
+    _provider = create_provider()
+    if _provider is None:
+        logger.warning("OPENAI_API_KEY is not set — authoring turns will fail")
+
+
+async def close_model_provider() -> None:
+    global _provider
+    if _provider is not None:
+        await _provider.aclose()
+        _provider = None
+
+
+def _get_provider() -> ModelProvider:
     """
-    api_key = os.environ.get("OPENAI_API_KEY", "").strip()
-    if not api_key:
+    Return the shared provider. Fails clearly if OPENAI_API_KEY is not set.
+    Created lazily when running outside the app lifespan (scripts, REPL).
+    """
+    if _provider is None:
+        init_model_provider()
+    if _provider is None:
         raise ValueError(
             "OPENAI_API_KEY is not set — authoring requires an OpenAI API key"
         )
-    return openai.OpenAI(api_key=api_key)
+    return _provider
 
 
 def _get_model() -> str:
     return os.environ.get("OPENAI_MODEL", _MODEL_DEFAULT).strip() or _MODEL_DEFAULT
 
 
+# =============================================================================
+# Model routing
+# =============================================================================
+
+class ModelTier(str, Enum):
+    FAST = "fast"       # OPENAI_MODEL_FAST — edits, confirmations, short answers
+    STRONG = "strong"   # OPENAI_MODEL — idea generation and anything open-ended
+
+
+# Longer messages usually carry a new idea or a rewrite — keep them on STRONG.
+AUTHORING_FAST_MAX_MESSAGE_CHARS = int(os.environ.get("AUTHORING_FAST_MAX_MESSAGE_CHARS", "200"))
+
+
+def _get_fast_model() -> str:
+    """OPENAI_MODEL_FAST, or OPENAI_MODEL when unset (routing disabled)."""
+    return os.environ.get("OPENAI_MODEL_FAST", "").strip() or _get_model()
+
+
+def _model_for(tier: ModelTier) -> str:
+    return _get_fast_model() if tier == ModelTier.FAST else _get_model()
+
+
+def _route_tier(ctx: AuthoringContext) -> ModelTier:
+    """
+    Pick the model tier for this turn from the session status, the missing
+    fields and the message length. Only turns that refine an existing draft
+    go FAST; the opening turns, which shape the prank, stay STRONG.
+    """
+    if _get_fast_model() == _get_model():
+        return ModelTier.STRONG
+    if len(ctx.latest_user_message) > AUTHORING_FAST_MAX_MESSAGE_CHARS:
+        return ModelTier.STRONG
+    if ctx.current_status in (AuthoringStatus.DRAFTING, AuthoringStatus.READY):
+        return ModelTier.FAST
+    if not CREATIVE_FIELDS.intersection(ctx.missing_fields):
+        return ModelTier.FAST
+    return ModelTier.STRONG
+
+
+def _escalation_reason(
+    tier: ModelTier, result: AuthoringLLMResult, session: AuthoringSession
+) -> Optional[str]:
+    """Why a FAST result should be redone on STRONG, or None to keep it."""
+    if tier == ModelTier.FAST and _handoff_rejected(result, session):
+        return "handoff_rejected"
+    return None
+
+
+async def _escalate(
+    ctx: AuthoringContext, tier: ModelTier, reason: str, deadline: float
+) -> Optional[AuthoringLLMResult]:
+    """
+    Redo the turn on STRONG within what is left of the turn's deadline.
+    Returns None, without calling the model, when too little time is left.
+    """
+    remaining = deadline - asyncio.get_running_loop().time()
+    if remaining < AUTHORING_ESCALATION_MIN_SECONDS:
+        logger.warning(
+            "AuthoringEngine._escalate: skipped session=%s reason=%s remaining=%.1fs",
+            ctx.session_id, reason, remaining,
+        )
+        return None
+    record_escalation(ctx.session_id, tier.value, reason)
+    return await _call_model(ctx, ModelTier.STRONG, deadline)
+
+
+async def _routed_call(ctx: AuthoringContext, session: AuthoringSession) -> AuthoringLLMResult:
+    """
+    _call_model on the routed tier, escalating a FAST reply once if it is
+    unusable. Both calls share one deadline (_turn_deadline).
+    """
+    deadline = _turn_deadline()
+    tier = _route_tier(ctx)
+    try:
+        result = await _call_model(ctx, tier, deadline)
+    except InvalidModelOutput:
+        if tier == ModelTier.STRONG:
+            raise
+        escalated = await _escalate(ctx, tier, "invalid_output", deadline)
+        if escalated is None:
+            raise
+        return escalated
+    reason = _escalation_reason(tier, result, session)
+    if reason is None:
+        return result
+    # Without time to escalate, the FAST reply stands; _sanitize_result
+    # overrides the rejected handoff
+    escalated = await _escalate(ctx, tier, reason, deadline)
+    return result if escalated is None else escalated
+
+
+def _prompt_cache_key(ctx: AuthoringContext) -> str:
+    return f"authoring:{ctx.session_id}"
+
+
+# =============================================================================
+# Deadlines and hedging
+# =============================================================================
+
+# Turn budget: every model call of a turn (routed call, escalation, stream)
+# must answer within this many seconds of the first; past it the turn fails
+# with ValueError.
+AUTHORING_TURN_DEADLINE_SECONDS = float(os.environ.get("AUTHORING_TURN_DEADLINE_SECONDS", "25"))
+# A FAST reply is only redone on STRONG if at least this much of the turn's
+# deadline is left; otherwise the escalation would most likely time out.
+AUTHORING_ESCALATION_MIN_SECONDS = float(os.environ.get("AUTHORING_ESCALATION_MIN_SECONDS", "5"))
+
+# A second, identical request is fired once the first has been outstanding
+# longer than the recent p95 attempt latency — so ~5% of turns pay for two
+# calls, while the slowest tail is cut to roughly p95 + a typical call.
+# AUTHORING_HEDGE_DELAY_SECONDS pins the delay instead.
+AUTHORING_HEDGE_ENABLED = os.environ.get("AUTHORING_HEDGE_ENABLED", "1") == "1"
+AUTHORING_HEDGE_PERCENTILE = float(os.environ.get("AUTHORING_HEDGE_PERCENTILE", "0.95"))
+_HEDGE_DELAY_OVERRIDE = os.environ.get("AUTHORING_HEDGE_DELAY_SECONDS", "").strip()
+_HEDGE_DELAY_DEFAULT_SECONDS = 8.0   # until enough latencies have been observed
+_HEDGE_DELAY_MIN_SECONDS = 1.0
+_HEDGE_MIN_SAMPLES = 20
+
+# Per tier — the fast model's p95 says nothing about the strong one's.
+# Completed attempts, plus a primary that lost to its hedge (a lower bound on
+# its latency); a cancelled hedge ran only briefly and is never recorded.
+_attempt_latencies = {tier: LatencyWindow(maxlen=200) for tier in ModelTier}
+# Whole-stream durations — not comparable with completion latencies, so
+# kept out of the hedge window
+_stream_latencies = {tier: LatencyWindow(maxlen=200) for tier in ModelTier}
+
+
+def _turn_deadline() -> float:
+    """Event-loop time by which every model call of the turn must have answered."""
+    return asyncio.get_running_loop().time() + AUTHORING_TURN_DEADLINE_SECONDS
+
+
+def _turn_timed_out() -> ValueError:
+    return ValueError(
+        f"Turn timed out: no model reply within the {AUTHORING_TURN_DEADLINE_SECONDS:.0f}s turn budget"
+    )
+
+
+def _hedge_delay(tier: ModelTier = ModelTier.STRONG) -> float:
+    if _HEDGE_DELAY_OVERRIDE:
+        return float(_HEDGE_DELAY_OVERRIDE)
+    window = _attempt_latencies[tier]
+    if len(window) < _HEDGE_MIN_SAMPLES:
+        return _HEDGE_DELAY_DEFAULT_SECONDS
+    p = window.percentile(AUTHORING_HEDGE_PERCENTILE) / 1000
+    return max(_HEDGE_DELAY_MIN_SECONDS, p)
+
+
 # =============================================================================
 # Model call
 # =============================================================================
 
-def _call_model(ctx: AuthoringContext) -> AuthoringLLMResult:
+async def _call_model(
+    ctx: AuthoringContext, tier: ModelTier = ModelTier.STRONG, deadline: Optional[float] = None
+) -> AuthoringLLMResult:
     """
-    Call OpenAI and return a validated AuthoringLLMResult.
+    Call the model provider on tier's model and return a validated AuthoringLLMResult.
 
-    This is the only function with provider-specific code.
     The prompt/context payload is owned by authoring_prompts.build_provider_messages().
+
+    Must answer by deadline — the turn's budget, see _turn_deadline(); a
+    fresh one when None — and is hedged (see _hedged_completion).
     """
-    client = _get_openai_client()
-    model = _get_model()
+    if deadline is None:
+        deadline = _turn_deadline()
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout_at(deadline):
+            content = await _hedged_completion(ctx, tier)
+    except TimeoutError:
+        logger.error(
+            "AuthoringEngine._call_model: turn budget of %.0fs exhausted session=%s tier=%s",
+            AUTHORING_TURN_DEADLINE_SECONDS, ctx.session_id, tier.value,
+        )
+        raise _turn_timed_out() from None
+    finally:
+        add_model_time((time.perf_counter() - started) * 1000)
+    return _parse_model_output(content, ctx.session_id)
+
+
+async def _hedged_completion(ctx: AuthoringContext, tier: ModelTier) -> str:
+    """
+    Run the completion; if it has not answered after _hedge_delay(), fire an
+    identical second request and take whichever succeeds first. The loser is
+    cancelled. A failed attempt only fails the turn once no attempt is left.
+    """
+    model = _model_for(tier)
     messages = build_provider_messages(ctx)
 
     logger.debug(
-        "AuthoringEngine._call_model: session=%s model=%s", ctx.session_id, model
+        "AuthoringEngine._call_model: session=%s tier=%s model=%s", ctx.session_id, tier.value, model
     )
 
+    primary = asyncio.create_task(_request_completion(ctx, tier, messages, attempt=1))
+    primary_started = time.perf_counter()
+    attempts = {primary}
+    hedged = False
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            response_format={"type": "json_object"},
+        if AUTHORING_HEDGE_ENABLED:
+            delay = _hedge_delay(tier)
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                hedged = True
+                record_hedge(ctx.session_id, delay * 1000)
+                attempts.add(asyncio.create_task(_request_completion(ctx, tier, messages, attempt=2)))
+
+        failure: Optional[BaseException] = None
+        while attempts:
+            done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                failure = failure or task.exception()
+        raise failure
+    finally:
+        for task in attempts:
+            task.cancel()
+        if hedged and primary in attempts:
+            # The primary was outstanding at least this long; recording the
+            # lower bound keeps the slow calls that trigger hedges in the p95
+            _attempt_latencies[tier].add((time.perf_counter() - primary_started) * 1000)
+
+
+async def _request_completion(
+    ctx: AuthoringContext, tier: ModelTier, messages: list[dict], *, attempt: int
+) -> str:
+    """One completion request; returns the raw message content."""
+    provider = _get_provider()
+    model = _model_for(tier)
+    started = time.perf_counter()
+    try:
+        completion = await provider.complete(
+            ctx, messages, model=model, cache_key=_prompt_cache_key(ctx)
         )
-    except openai.OpenAIError as exc:
+    except asyncio.CancelledError:
+        record_attempt_cancelled(ctx.session_id, model, attempt, (time.perf_counter() - started) * 1000)
+        raise
+
+    latency_ms = (time.perf_counter() - started) * 1000
+    _attempt_latencies[tier].add(latency_ms)
+    record_turn_usage(usage_from_completion(
+        completion.usage,
+        session_id=ctx.session_id,
+        model=model,
+        latency_ms=latency_ms,
+        attempt=attempt,
+        tier=tier.value,
+    ))
+    return completion.content
+
+
+async def _stream_model(
+    ctx: AuthoringContext, tier: ModelTier = ModelTier.STRONG, deadline: Optional[float] = None
+) -> AsyncIterator[str]:
+    """
+    Streaming variant of _call_model: yields raw completion text chunks.
+    The caller accumulates them and validates with _parse_model_output().
+
+    Not hedged (the client is already watching this reply), but bound by the
+    same turn budget as _call_model: the stream must finish by deadline (a
+    fresh _turn_deadline() when None).
+    """
+    provider = _get_provider()
+    model = _model_for(tier)
+    messages = build_provider_messages(ctx)
+
+    logger.debug(
+        "AuthoringEngine._stream_model: session=%s tier=%s model=%s", ctx.session_id, tier.value, model
+    )
+
+    started = time.perf_counter()
+    if deadline is None:
+        deadline = _turn_deadline()
+    usage = None
+    chunks = aiter(provider.stream(ctx, messages, model=model, cache_key=_prompt_cache_key(ctx)))
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(
+                    anext(chunks), timeout=deadline - asyncio.get_running_loop().time()
+                )
+            except StopAsyncIteration:
+                break
+            if chunk.usage is not None:
+                usage = chunk.usage
+            if chunk.text:
+                yield chunk.text
+    except TimeoutError:
         logger.error(
-            "AuthoringEngine._call_model: OpenAI error session=%s: %s",
-            ctx.session_id, exc,
+            "AuthoringEngine._stream_model: turn budget of %.0fs exhausted session=%s tier=%s",
+            AUTHORING_TURN_DEADLINE_SECONDS, ctx.session_id, tier.value,
         )
-        raise ValueError(f"Model call failed: {exc}") from exc
+        raise _turn_timed_out() from None
+
+    latency_ms = (time.perf_counter() - started) * 1000
+    _stream_latencies[tier].add(latency_ms)
+    add_model_time(latency_ms)
+    record_turn_usage(usage_from_completion(
+        usage,
+        session_id=ctx.session_id,
+        model=model,
+        latency_ms=latency_ms,
+        tier=tier.value,
+    ))
+
 
-    content = response.choices[0].message.content
+class InvalidModelOutput(ValueError):
+    """The model's reply did not validate as an AuthoringLLMResult."""
 
+
+def _parse_model_output(content: str, session_id: str) -> AuthoringLLMResult:
     try:
-        return AuthoringLLMResult.parse_raw(content)
+        return AuthoringLLMResult.model_validate_json(content)
     except Exception as exc:
+        turn = current_turn()
+        if turn is not None:
+            turn.parse_failures += 1
         logger.error(
-            "AuthoringEngine._call_model: malformed model output session=%s content=%.500s",
-            ctx.session_id, content,
+            "AuthoringEngine: malformed model output session=%s content=%.500s",
+            session_id, content,
         )
-        raise ValueError(f"Model returned invalid AuthoringLLMResult: {exc}") from exc
+        raise InvalidModelOutput(f"Model returned invalid AuthoringLLMResult: {exc}") from exc
+
+
+# =============================================================================
+# Cold-start response cache
+# =============================================================================
+
+def _cache_model_key() -> str:
+    # Stub replies must never be served to real sessions, or vice versa
+    return f"{AUTHORING_PROVIDER}:{_get_model()}"
+
+
+def _cached_result(ctx: AuthoringContext) -> Optional[AuthoringLLMResult]:
+    if not AUTHORING_RESPONSE_CACHE_ENABLED:
+        return None
+    result = authoring_response_cache.lookup(ctx, _cache_model_key())
+    turn = current_turn()
+    if result is not None and turn is not None:
+        turn.cache_hit = True
+    return result
+
+
+def _cache_result(ctx: AuthoringContext, result: AuthoringLLMResult) -> None:
+    if AUTHORING_RESPONSE_CACHE_ENABLED:
+        authoring_response_cache.store(ctx, _cache_model_key(), result)
+
+
+# =============================================================================
+# Shadow prompt comparison
+# =============================================================================
+
+def _shadow_turn(ctx: AuthoringContext, session: AuthoringSession, result: AuthoringLLMResult) -> None:
+    """Offer a model-answered turn to prompt_shadow (see authoring_shadow)."""
+    if not prompt_shadow.enabled:
+        return
+    draft = session.draft
+    prompt_shadow.maybe_shadow(
+        ctx,
+        _get_provider(),
+        result,
+        completes=lambda r: _is_draft_complete(_merge_draft(draft, r.draft_update)),
+    )
 
 
 # =============================================================================
@@ -179,18 +589,26 @@ def _sanitize_result(result: AuthoringLLMResult, session: AuthoringSession) -> A
     Validate and sanitize raw model output before applying it.
     Backend rules override model claims where they conflict.
     """
-    if result.ready_for_handoff:
-        preview = _merge_draft(session.draft, result.draft_update)
-        if not _is_draft_complete(preview):
-            logger.warning(
-                "session=%s: model claimed ready_for_handoff=True but draft incomplete after merge; overriding",
-                session.id,
-            )
-            result = result.copy(update={"ready_for_handoff": False})
+    if _handoff_rejected(result, session):
+        logger.warning(
+            "session=%s: model claimed ready_for_handoff=True but draft incomplete after merge; overriding",
+            session.id,
+        )
+        result = result.model_copy(update={"ready_for_handoff": False})
+        turn = current_turn()
+        if turn is not None:
+            turn.handoff_overridden = True
 
     return result
 
 
+def _handoff_rejected(result: AuthoringLLMResult, session: AuthoringSession) -> bool:
+    """True if the model claims ready_for_handoff but the merged draft is incomplete."""
+    if not result.ready_for_handoff:
+        return False
+    return not _is_draft_complete(_merge_draft(session.draft, result.draft_update))
+
+
 # =============================================================================
 # Draft merge
 # =============================================================================
@@ -237,7 +655,7 @@ def _merge_draft(current: PrankDraft, update: DraftUpdate, allow_overwrite: bool
                 if allow_overwrite or not current.caller.tone:
                     sub["tone"] = update.caller.tone
             if sub:
-                patches["caller"] = current.caller.copy(update=sub)
+                patches["caller"] = current.caller.model_copy(update=sub)
 
     if update.target_effect is not None:
         if current.target_effect is None:
@@ -256,7 +674,7 @@ def _merge_draft(current: PrankDraft, update: DraftUpdate, allow_overwrite: bool
                 if allow_overwrite or current.target_effect.duration_seconds is None:
                     sub["duration_seconds"] = update.target_effect.duration_seconds
             if sub:
-                patches["target_effect"] = current.target_effect.copy(update=sub)
+                patches["target_effect"] = current.target_effect.model_copy(update=sub)
 
     if update.progression is not None:
         if current.progression is None:
@@ -269,16 +687,16 @@ def _merge_draft(current: PrankDraft, update: DraftUpdate, allow_overwrite: bool
         else:
             if allow_overwrite:
                 # Replace any sub-field the model provides
-                sub = {k: v for k, v in update.progression.dict(exclude_none=True).items()}
+                sub = {k: v for k, v in update.progression.model_dump(exclude_none=True).items()}
             else:
                 # Fill gaps only
                 sub = {
                     k: v
-                    for k, v in update.progression.dict(exclude_none=True).items()
+                    for k, v in update.progression.model_dump(exclude_none=True).items()
                     if getattr(current.progression, k) is None
                 }
             if sub:
-                patches["progression"] = current.progression.copy(update=sub)
+                patches["progression"] = current.progression.model_copy(update=sub)
 
     if update.constraints is not None:
         if current.constraints is None:
@@ -294,10 +712,10 @@ def _merge_draft(current: PrankDraft, update: DraftUpdate, allow_overwrite: bool
             )
             sub = {
                 k: v
-                for k, v in update.constraints.dict(exclude_none=True).items()
+                for k, v in update.constraints.model_dump(exclude_none=True).items()
                 if k != "avoid_topics" and getattr(current.constraints, k) is None
             }
-            patches["constraints"] = current.constraints.copy(
+            patches["constraints"] = current.constraints.model_copy(
                 update={"avoid_topics": merged_topics, **sub}
             )
 
@@ -314,7 +732,7 @@ def _merge_draft(current: PrankDraft, update: DraftUpdate, allow_overwrite: bool
     if update.prank_title is not None:
         patches["prank_title"] = update.prank_title
 
-    return current.copy(update=patches) if patches else current
+    return current.model_copy(update=patches) if patches else current
 
 
 # =============================================================================
@@ -343,7 +761,7 @@ def _determine_status(
     draft_complete = _is_draft_complete(merged_draft)
 
     if result.ready_for_handoff and draft_complete:
-        user_turns = sum(1 for m in session.messages if m.role == MessageRole.USER)
+        user_turns = session.messages.count_role(MessageRole.USER)
         if user_turns < _MIN_USER_TURNS_BEFORE_READY:
             logger.info(
                 "session=%s: ready_for_handoff=True suppressed — only %d user turn(s), "
@@ -363,20 +781,8 @@ def _determine_status(
 # Main entry point
 # =============================================================================
 
-def process_turn(store: AuthoringStore, session_id: str, user_content: str) -> str:
-    """
-    Process one user turn in a System 1 authoring session.
-
-    Phases:
-      1. Load session and persist user message
-      2. Build AuthoringContext for the model
-      3. Call model (_call_model — OpenAI with authoring_prompts payload)
-      4. Validate / sanitize result
-      5. Merge result into current draft
-      6. Determine new status (backend-authoritative)
-      7. Persist updated state and assistant reply
-    """
-    # Phase 1 — load + persist user message
+def _begin_turn(store: AuthoringStore, session_id: str, user_content: str) -> tuple[AuthoringSession, AuthoringContext]:
+    """Phases 1–2: persist the user message and build the model context."""
     session = store.get_session(session_id)
     if session is None:
         raise ValueError(f"Session {session_id} not found")
@@ -388,13 +794,20 @@ def process_turn(store: AuthoringStore, session_id: str, user_content: str) -> s
         "AuthoringEngine.process_turn: session=%s status=%s messages=%d",
         session_id, session.status, len(session.messages),
     )
+    turn = current_turn()
+    if turn is not None:
+        turn.status = session.status.value
 
-    # Phase 2 — build context
-    ctx = _build_authoring_context(session, user_content)
+    return session, _build_authoring_context(session, user_content)
 
-    # Phase 3 — call model
-    raw_result = _call_model(ctx)
 
+def _complete_turn(
+    store: AuthoringStore,
+    session: AuthoringSession,
+    raw_result: AuthoringLLMResult,
+) -> str:
+    """Phases 4–8: sanitize, merge, determine status, persist, precompile. Returns the reply."""
+    prompted_draft = session.draft   # what the model was shown this turn
     # Phase 4 — validate / sanitize
     result = _sanitize_result(raw_result, session)
 
@@ -409,12 +822,100 @@ def process_turn(store: AuthoringStore, session_id: str, user_content: str) -> s
 
     # Phase 7 — persist
     store.update_session(
-        session_id,
+        session.id,
         draft=new_draft,
         status=new_status,
         latest_assistant_question=result.reply,
         is_complete=is_complete,
     )
-    store.append_message(session_id, MessageRole.ASSISTANT, result.reply)
+    store.append_message(session.id, MessageRole.ASSISTANT, result.reply)
+    # Only now that the reply is merged: a failed call leaves the next turn's
+    # "changed since last prompt" marker relative to what the model last saw
+    session.prompted_draft = prompted_draft
+
+    # Phase 8 — precompile (no-op if this exact draft is already compiled)
+    if new_status == AuthoringStatus.READY:
+        prank_compiler.schedule(new_draft)
 
     return result.reply
+
+
+async def process_turn(store: AuthoringStore, session_id: str, user_content: str) -> str:
+    """
+    Process one user turn in a System 1 authoring session.
+
+    Phases:
+      1. Load session and persist user message
+      2. Build AuthoringContext for the model
+      3. Call model (_call_model on the routed tier — see _route_tier)
+      4. Validate / sanitize result
+      5. Merge result into current draft
+      6. Determine new status (backend-authoritative)
+      7. Persist updated state and assistant reply
+    """
+    # Phases 1–2 — load + persist user message, build context
+    session, ctx = _begin_turn(store, session_id, user_content)
+
+    # Phase 3 — call model (cold-start turns may be answered from cache)
+    raw_result = _cached_result(ctx)
+    if raw_result is None:
+        raw_result = await _routed_call(ctx, session)
+        _cache_result(ctx, raw_result)
+        _shadow_turn(ctx, session, raw_result)
+
+    # Phases 4–7 — sanitize, merge, status, persist
+    return _complete_turn(store, session, raw_result)
+
+
+async def process_turn_stream(
+    store: AuthoringStore, session_id: str, user_content: str
+) -> AsyncIterator[str]:
+    """
+    Streaming variant of process_turn: yields reply text deltas as the model
+    generates them. When the generator is exhausted the turn has been fully
+    applied to the store (same phases 4–7 as process_turn); the authoritative
+    reply is the session's last assistant message.
+
+    Raises ValueError (like process_turn) on model or validation failure.
+    """
+    session, ctx = _begin_turn(store, session_id, user_content)
+
+    cached = _cached_result(ctx)
+    if cached is not None:
+        yield cached.reply
+        _complete_turn(store, session, cached)
+        return
+
+    deadline = _turn_deadline()
+    tier = _route_tier(ctx)
+    parser = ReplyStreamParser()
+    async for chunk in _stream_model(ctx, tier, deadline):
+        delta = parser.feed(chunk)
+        if delta:
+            yield delta
+
+    # An escalated reply is not streamed; the client takes the authoritative
+    # reply from the session once the turn is applied.
+    try:
+        raw_result = _parse_model_output(parser.text, session_id)
+    except InvalidModelOutput:
+        if tier == ModelTier.STRONG:
+            raise
+        escalated = await _escalate(ctx, tier, "invalid_output", deadline)
+        if escalated is None:
+            raise
+        raw_result = escalated
+    else:
+        if raw_result.reply != parser.reply:
+            logger.warning(
+                "AuthoringEngine.process_turn_stream: streamed reply diverged from validated reply session=%s",
+                session_id,
+            )
+        reason = _escalation_reason(tier, raw_result, session)
+        if reason is not None:
+            escalated = await _escalate(ctx, tier, reason, deadline)
+            if escalated is not None:
+                raw_result = escalated
+    _cache_result(ctx, raw_result)
+    _shadow_turn(ctx, session, raw_result)
+    _complete_turn(store, session, raw_result)
@@ -0,0 +1,128 @@
+"""
+Token-budgeted conversation history for System 1 authoring turns.
+
+The model sees the session's unsummarised messages verbatim, preceded by a
+running extractive summary of everything older.  compact_history() keeps the
+verbatim part within AUTHORING_HISTORY_TOKEN_BUDGET:
+
+  - Tokens are estimated locally with a script-aware character heuristic
+    — no provider round-trip, and the same count on every worker.
+  - When the unsummarised history outgrows the budget, it is refilled
+    newest-first down to half the budget and the evicted messages are
+    folded into session.context_summary.  Compacting in steps (rather than
+    sliding every turn) keeps the history a stable prompt prefix between
+    compactions, so provider prefix caching keeps working.
+  - The summary is updated incrementally and capped at
+    AUTHORING_SUMMARY_TOKEN_BUDGET; the first user message is always kept
+    because it carries the original idea.
+
+Each compaction builds on the previous summary (trimming its oldest lines),
+so the summary cannot be rebuilt from the messages alone: context_summary and
+summarized_through are persisted with the session (authoring_drafts), and a
+session rehydrated on another worker sends the model the same context.
+"""
+import logging
+import os
+from typing import Optional
+
+from app.schemas.prank_authoring import AuthoringMessage, AuthoringSession, MessageRole
+
+logger = logging.getLogger(__name__)
+
+AUTHORING_HISTORY_TOKEN_BUDGET = int(os.environ.get("AUTHORING_HISTORY_TOKEN_BUDGET", "1200"))
+AUTHORING_SUMMARY_TOKEN_BUDGET = int(os.environ.get("AUTHORING_SUMMARY_TOKEN_BUDGET", "400"))
+
+_COMPACT_TO_FRACTION = 0.5      # refill to this share of the budget on compaction
+_MESSAGE_OVERHEAD_TOKENS = 4    # "User: " label + newline
+_SUMMARY_USER_LINE_TOKENS = 60
+_SUMMARY_ASSISTANT_LINE_TOKENS = 25
+
+
+# =============================================================================
+# Token counting
+# =============================================================================
+
+def count_tokens(text: str) -> int:
+    # ~4 chars/token for ASCII; Cyrillic and other scripts tokenize ~2 chars/token
+    ascii_chars = sum(1 for ch in text if ch < "\x80")
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars + 1) // 2
+
+
+def message_tokens(message: AuthoringMessage) -> int:
+    return count_tokens(message.content) + _MESSAGE_OVERHEAD_TOKENS
+
+
+def _clip(text: str, max_tokens: int) -> str:
+    text = " ".join(text.split())
+    tokens = count_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    return text[: len(text) * max_tokens // tokens].rstrip() + "…"
+
+
+# =============================================================================
+# Rolling summary
+# =============================================================================
+
+_USER_LINE_PREFIX = "- User: "
+
+
+def _summary_line(message: AuthoringMessage) -> str:
+    if message.role == MessageRole.USER:
+        return _USER_LINE_PREFIX + _clip(message.content, _SUMMARY_USER_LINE_TOKENS)
+    return f"- Assistant: {_clip(message.content, _SUMMARY_ASSISTANT_LINE_TOKENS)}"
+
+
+def extend_summary(summary: Optional[str], evicted: list[AuthoringMessage]) -> Optional[str]:
+    """Fold evicted messages into summary, trimming the oldest lines to fit the budget."""
+    lines = summary.split("\n") if summary else []
+    lines += [_summary_line(m) for m in evicted]
+    if not lines:
+        return None
+
+    # Keep the first user line (the original idea); drop the oldest others until it fits
+    pinned = next((i for i, line in enumerate(lines) if line.startswith(_USER_LINE_PREFIX)), None)
+    total = sum(count_tokens(line) for line in lines)
+    kept: list[str] = []
+    for i, line in enumerate(lines):
+        if total > AUTHORING_SUMMARY_TOKEN_BUDGET and i != pinned and i < len(lines) - 1:
+            total -= count_tokens(line)
+            continue
+        kept.append(line)
+    return "\n".join(kept)
+
+
+# =============================================================================
+# Compaction
+# =============================================================================
+
+def compact_history(session: AuthoringSession) -> list[AuthoringMessage]:
+    """
+    Return the messages to send verbatim (the latest user message last),
+    first folding the oldest ones into session.context_summary if the
+    unsummarised history is over budget.
+    """
+    log = session.messages
+    start = min(session.summarized_through, len(log))
+    # Cost from the stored contents; only the messages returned or summarised are materialised
+    costs = [count_tokens(content) + _MESSAGE_OVERHEAD_TOKENS for content in log.contents(start)]
+    if sum(costs) <= AUTHORING_HISTORY_TOKEN_BUDGET:
+        return log[start:]
+
+    target = int(AUTHORING_HISTORY_TOKEN_BUDGET * _COMPACT_TO_FRACTION)
+    kept, used = 0, 0
+    for cost in reversed(costs):
+        # The latest message is always kept, whatever its size
+        if kept and used + cost > target:
+            break
+        kept += 1
+        used += cost
+
+    evicted = log[start:len(log) - kept]
+    session.context_summary = extend_summary(session.context_summary, evicted)
+    session.summarized_through = start + len(evicted)
+    logger.info(
+        "authoring_history: session=%s summarised %d messages (through=%d, kept=%d, ~%d tokens)",
+        session.id, len(evicted), session.summarized_through, kept, used,
+    )
+    return log[session.summarized_through:]
@@ -0,0 +1,224 @@
+"""
+Per-turn model usage accounting for System 1 authoring.
+
+Every model call reports a TurnUsage built from the provider's `usage`
+block: prompt / cached / completion tokens and wall-clock latency.
+record_turn_usage() logs it and folds it into process-wide totals, which
+show how much of each prompt the provider served from its prefix cache.
+
+Hedged turns (authoring_engine) may issue a second attempt; every attempt is
+accounted for — completed ones through record_turn_usage(), abandoned ones
+through record_attempt_cancelled() — and LatencyWindow keeps the recent
+attempt latencies the hedge delay is derived from.
+
+Model routing (authoring_engine) sends easy turns to a faster model tier;
+every call is also folded into per-tier totals (tier_totals) — calls, tokens,
+recent latencies and how often the fast tier had to be escalated — so the
+tiers' cost and speed can be compared.
+
+measure_turn() splits one request's wall time into model time (reported by
+the engine via add_model_time()) and everything else — the backend overhead
+— and renders both as a Server-Timing header.  The same TurnTiming collects
+the turn's telemetry (model, tokens, parse failures, overridden handoffs),
+which the router hands to turn_metrics_writer for the authoring_turn_metrics
+table; the engine reaches it through current_turn().
+"""
+import logging
+import math
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TurnUsage:
+    session_id: str
+    model: str
+    prompt_tokens: int
+    cached_tokens: int
+    completion_tokens: int
+    latency_ms: float
+    attempt: int = 1            # 2 = hedge request
+    tier: str = "strong"        # model tier the call was routed to
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+def usage_from_completion(
+    usage: Optional[Any],
+    *,
+    session_id: str,
+    model: str,
+    latency_ms: float,
+    attempt: int = 1,
+    tier: str = "strong",
+) -> TurnUsage:
+    """Build a TurnUsage from an OpenAI CompletionUsage (or None if absent)."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return TurnUsage(
+        session_id=session_id,
+        model=model,
+        prompt_tokens=getattr(usage, "prompt_tokens", None) or 0,
+        cached_tokens=getattr(details, "cached_tokens", None) or 0,
+        completion_tokens=getattr(usage, "completion_tokens", None) or 0,
+        latency_ms=latency_ms,
+        attempt=attempt,
+        tier=tier,
+    )
+
+
+class UsageTotals:
+    """Process-wide running totals (reset on restart)."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self.hedged_turns = 0
+        self.cancelled_attempts = 0
+
+    def add(self, usage: TurnUsage) -> None:
+        self.calls += 1
+        self.prompt_tokens += usage.prompt_tokens
+        self.cached_tokens += usage.cached_tokens
+        self.completion_tokens += usage.completion_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+
+class LatencyWindow:
+    """The most recent N latencies (ms), for percentile estimates."""
+
+    def __init__(self, maxlen: int) -> None:
+        self._samples: deque[float] = deque(maxlen=maxlen)
+
+    def add(self, latency_ms: float) -> None:
+        self._samples.append(latency_ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Nearest-rank percentile, q in (0, 1]; None when empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class TierTotals(UsageTotals):
+    """UsageTotals for one model tier, plus its recent latencies and escalations."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.latencies = LatencyWindow(maxlen=200)
+        self.escalations = 0   # turns this tier handed up to the next one
+
+    def add(self, usage: TurnUsage) -> None:
+        super().add(usage)
+        self.latencies.add(usage.latency_ms)
+
+
+usage_totals = UsageTotals()
+tier_totals: defaultdict[str, TierTotals] = defaultdict(TierTotals)
+
+
+def record_turn_usage(usage: TurnUsage) -> None:
+    usage_totals.add(usage)
+    tier = tier_totals[usage.tier]
+    tier.add(usage)
+    turn = _current_turn_timing.get()
+    if turn is not None:
+        turn.model, turn.tier = usage.model, usage.tier
+        turn.model_calls += 1
+        turn.prompt_tokens += usage.prompt_tokens
+        turn.cached_tokens += usage.cached_tokens
+        turn.completion_tokens += usage.completion_tokens
+    logger.info(
+        "authoring.turn_usage: session=%s tier=%s model=%s attempt=%d prompt=%d cached=%d "
+        "completion=%d total=%d latency_ms=%.0f tier_p50_ms=%.0f process_cache_hit_ratio=%.2f",
+        usage.session_id, usage.tier, usage.model, usage.attempt, usage.prompt_tokens,
+        usage.cached_tokens, usage.completion_tokens, usage.total_tokens,
+        usage.latency_ms, tier.latencies.percentile(0.5), usage_totals.cache_hit_ratio,
+    )
+
+
+def record_escalation(session_id: str, tier: str, reason: str) -> None:
+    """A turn routed to tier was re-run on a stronger one (reason: why)."""
+    tier_totals[tier].escalations += 1
+    logger.info("authoring.escalation: session=%s from_tier=%s reason=%s", session_id, tier, reason)
+
+
+def record_hedge(session_id: str, delay_ms: float) -> None:
+    usage_totals.hedged_turns += 1
+    logger.info("authoring.hedge: session=%s second attempt after %.0fms", session_id, delay_ms)
+
+
+def record_attempt_cancelled(session_id: str, model: str, attempt: int, elapsed_ms: float) -> None:
+    """An attempt abandoned mid-flight (lost the hedge race or hit the deadline)."""
+    usage_totals.cancelled_attempts += 1
+    logger.info(
+        "authoring.attempt_cancelled: session=%s model=%s attempt=%d elapsed_ms=%.0f",
+        session_id, model, attempt, elapsed_ms,
+    )
+
+
+@dataclass(slots=True)
+class TurnTiming:
+    model_ms: float = 0.0
+    total_ms: float = 0.0
+    # Telemetry for authoring_turn_metrics, filled in as the turn runs
+    status: Optional[str] = None        # session status the turn started in
+    model: Optional[str] = None         # model of the call that produced the reply
+    tier: Optional[str] = None
+    model_calls: int = 0                # completed calls, incl. hedges and escalations
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+    parse_failures: int = 0
+    handoff_overridden: bool = False
+    cache_hit: bool = False             # answered by authoring_response_cache
+
+    @property
+    def backend_ms(self) -> float:
+        return max(0.0, self.total_ms - self.model_ms)
+
+    def server_timing(self) -> str:
+        return f"model;dur={self.model_ms:.1f}, backend;dur={self.backend_ms:.1f}"
+
+
+_current_turn_timing: ContextVar[Optional[TurnTiming]] = ContextVar("authoring_turn_timing", default=None)
+
+
+@contextmanager
+def measure_turn() -> Iterator[TurnTiming]:
+    """Time the enclosed turn; model calls inside it report via add_model_time()."""
+    timing = TurnTiming()
+    token = _current_turn_timing.set(timing)
+    started = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        timing.total_ms = (time.perf_counter() - started) * 1000
+        _current_turn_timing.reset(token)
+
+
+def current_turn() -> Optional[TurnTiming]:
+    """The TurnTiming of the enclosing measure_turn(), if any."""
+    return _current_turn_timing.get()
+
+
+def add_model_time(elapsed_ms: float) -> None:
+    timing = _current_turn_timing.get()
+    if timing is not None:
+        timing.model_ms += elapsed_ms
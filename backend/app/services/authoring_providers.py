@@ -0,0 +1,291 @@
+"""
+Model providers for System 1 authoring turns.
+
+The engine talks to the model only through a ModelProvider:
+
+  complete(ctx, messages, model=, cache_key=) → ProviderCompletion
+  stream(ctx, messages, model=, cache_key=)   → AsyncIterator[ProviderChunk]
+
+Both return the raw completion text (validated by the engine) and the
+provider's usage block, and raise ValueError on provider failure.
+
+Implementations (AUTHORING_PROVIDER selects one; default "openai"):
+
+  OpenAIProvider — the shared AsyncOpenAI client with a pooled HTTP
+                   connection pool.
+  StubProvider   — offline and deterministic.  Answers with schema-valid
+                   AuthoringLLMResult JSON that fills the draft's missing
+                   fields two at a time, so scripted sessions walk through
+                   COLLECTING_INFO → DRAFTING → READY like real ones.  Latency
+                   is lognormal (AUTHORING_STUB_LATENCY_MEDIAN_MS,
+                   AUTHORING_STUB_LATENCY_SIGMA) and token counts are computed
+                   from the actual prompt, so the full API — persistence,
+                   merge, rate limits, hedging — can be load-tested without
+                   spending tokens, and model time separated from backend time.
+"""
+import asyncio
+import logging
+import math
+import os
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+import openai
+
+from app.schemas.prank_authoring import (
+    AuthoringContext,
+    AuthoringLLMResult,
+    CallerUpdate,
+    ConstraintsUpdate,
+    DraftField,
+    DraftUpdate,
+    PrankType,
+    ProgressionUpdate,
+    TargetEffectUpdate,
+)
+from app.services.authoring_history import count_tokens
+
+logger = logging.getLogger(__name__)
+
+AUTHORING_PROVIDER = os.environ.get("AUTHORING_PROVIDER", "openai").strip().lower() or "openai"
+
+
+@dataclass(slots=True)
+class ProviderCompletion:
+    content: str
+    usage: Optional[Any]   # CompletionUsage-shaped (see authoring_metrics.usage_from_completion)
+
+
+@dataclass(slots=True)
+class ProviderChunk:
+    text: str = ""
+    usage: Optional[Any] = None   # set on the final chunk only
+
+
+class ModelProvider(ABC):
+    name: str
+
+    @abstractmethod
+    async def complete(
+        self, ctx: AuthoringContext, messages: list[dict], *, model: str, cache_key: str
+    ) -> ProviderCompletion:
+        ...
+
+    @abstractmethod
+    def stream(
+        self, ctx: AuthoringContext, messages: list[dict], *, model: str, cache_key: str
+    ) -> AsyncIterator[ProviderChunk]:
+        ...
+
+    async def aclose(self) -> None:
+        pass
+
+
+# =============================================================================
+# OpenAI
+# =============================================================================
+
+# Connection pool for the shared client. Keep-alive connections skip the TLS
+# handshake on every turn; the cap bounds concurrent in-flight model calls.
+_OPENAI_MAX_CONNECTIONS = int(os.environ.get("OPENAI_MAX_CONNECTIONS", "100"))
+_OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+
+
+class OpenAIProvider(ModelProvider):
+    name = "openai"
+
+    def __init__(self, client: openai.AsyncOpenAI) -> None:
+        self._client = client
+
+    @classmethod
+    def from_env(cls) -> Optional["OpenAIProvider"]:
+        """None when OPENAI_API_KEY is not set."""
+        api_key = os.environ.get("OPENAI_API_KEY", "").strip()
+        if not api_key:
+            return None
+        return cls(openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=openai.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=_OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=_OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            ),
+        ))
+
+    async def complete(
+        self, ctx: AuthoringContext, messages: list[dict], *, model: str, cache_key: str
+    ) -> ProviderCompletion:
+        try:
+            response = await self._client.chat.completions.create(
+                model=model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                # Via extra_body: prompt_cache_key is only a typed keyword in recent SDKs
+                extra_body={"prompt_cache_key": cache_key},
+            )
+        except openai.OpenAIError as exc:
+            logger.error("OpenAIProvider: error session=%s: %s", ctx.session_id, exc)
+            raise ValueError(f"Model call failed: {exc}") from exc
+        return ProviderCompletion(response.choices[0].message.content, response.usage)
+
+    async def stream(
+        self, ctx: AuthoringContext, messages: list[dict], *, model: str, cache_key: str
+    ) -> AsyncIterator[ProviderChunk]:
+        try:
+            stream = await self._client.chat.completions.create(
+                model=model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                # Via extra_body: prompt_cache_key is only a typed keyword in recent SDKs
+                extra_body={"prompt_cache_key": cache_key},
+                stream=True,
+                # Final chunk carries the usage block (with empty choices)
+                stream_options={"include_usage": True},
+            )
+            async for chunk in stream:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text or chunk.usage is not None:
+                    yield ProviderChunk(text or "", chunk.usage)
+        except openai.OpenAIError as exc:
+            logger.error("OpenAIProvider: stream error session=%s: %s", ctx.session_id, exc)
+            raise ValueError(f"Model call failed: {exc}") from exc
+
+    async def aclose(self) -> None:
+        await self._client.close()
+
+
+# =============================================================================
+# Local stub
+# =============================================================================
+
+AUTHORING_STUB_LATENCY_MEDIAN_MS = float(os.environ.get("AUTHORING_STUB_LATENCY_MEDIAN_MS", "900"))
+AUTHORING_STUB_LATENCY_SIGMA = float(os.environ.get("AUTHORING_STUB_LATENCY_SIGMA", "0.4"))
+AUTHORING_STUB_SEED = os.environ.get("AUTHORING_STUB_SEED", "0")
+
+_STUB_FIELDS_PER_TURN = 2
+_STUB_TIME_TO_FIRST_TOKEN_SHARE = 0.3
+_STUB_STREAM_CHUNK_CHARS = 12
+_PROVIDER_CACHE_BLOCK_TOKENS = 128   # providers cache prefixes in 128-token steps
+
+_STUB_FIELD_UPDATES: dict[DraftField, dict[str, Any]] = {
+    DraftField.PRANK_TYPE: {"prank_type": PrankType.MISTAKEN_CONTINUATION},
+    DraftField.CALLER: {"caller": CallerUpdate(persona="объркан куриер", tone="упорит")},
+    DraftField.TARGET_EFFECT: {"target_effect": TargetEffectUpdate(intended_emotion="леко объркване")},
+    DraftField.PROGRESSION: {"progression": ProgressionUpdate(
+        opening="Куриерът пита за пратката от вчера",
+        escalation="Настоява, че пратката е платена",
+        resolution="Признава, че е сбъркал адреса",
+    )},
+    DraftField.CONSTRAINTS: {"constraints": ConstraintsUpdate(avoid_topics=["здраве"], max_duration_seconds=90)},
+}
+
+_STUB_REPLIES = [
+    "Супер, продължаваме. Как да звучи обаждащият се?",
+    "Добре! Какво искаш да почувства приятелят ти?",
+    "Харесва ми. Как да завърши разговорът?",
+    "Почти сме готови — има ли теми, които да избягваме?",
+]
+_STUB_READY_REPLY = "Готово! Майтапът е сглобен — провери картата и го пусни."
+
+
+@lru_cache(maxsize=32)
+def _cached_count(text: str) -> int:
+    # The system prompt is identical on every call; count it once
+    return count_tokens(text)
+
+
+class StubProvider(ModelProvider):
+    name = "stub"
+
+    def __init__(
+        self,
+        *,
+        latency_median_ms: float = AUTHORING_STUB_LATENCY_MEDIAN_MS,
+        latency_sigma: float = AUTHORING_STUB_LATENCY_SIGMA,
+        seed: str = AUTHORING_STUB_SEED,
+    ) -> None:
+        self._latency_median_ms = latency_median_ms
+        self._latency_sigma = latency_sigma
+        self._seed = seed
+        # Latencies come from one sequence per process (a hedge gets a fresh
+        # draw); content is a pure function of the seed and the turn.
+        self._latency_rng = random.Random(f"{seed}:latency")
+
+    def result_for(self, ctx: AuthoringContext) -> AuthoringLLMResult:
+        rng = random.Random(f"{self._seed}:{ctx.session_id}:{ctx.total_user_turns}")
+        filling = ctx.missing_fields[:_STUB_FIELDS_PER_TURN]
+        update: dict[str, Any] = {}
+        for field in filling:
+            update.update(_STUB_FIELD_UPDATES[field])
+        remaining = [f for f in ctx.missing_fields if f not in filling]
+        done = not remaining
+        if done:
+            update["prank_title"] = "Обърканият куриер"
+        return AuthoringLLMResult(
+            reply=_STUB_READY_REPLY if done else rng.choice(_STUB_REPLIES),
+            draft_update=DraftUpdate(**update),
+            missing_fields=remaining,
+            is_draft_complete=done,
+            ready_for_handoff=done,
+            notes="stub",
+        )
+
+    def _latency_seconds(self) -> float:
+        return self._latency_rng.lognormvariate(
+            math.log(self._latency_median_ms), self._latency_sigma
+        ) / 1000
+
+    def _usage(self, ctx: AuthoringContext, messages: list[dict], content: str) -> SimpleNamespace:
+        prompt_tokens = sum(_cached_count(m["content"]) for m in messages)
+        cached = 0
+        if ctx.total_user_turns > 1:
+            system_tokens = _cached_count(messages[0]["content"])
+            cached = system_tokens // _PROVIDER_CACHE_BLOCK_TOKENS * _PROVIDER_CACHE_BLOCK_TOKENS
+        return SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=count_tokens(content),
+            prompt_tokens_details=SimpleNamespace(cached_tokens=cached),
+        )
+
+    async def complete(
+        self, ctx: AuthoringContext, messages: list[dict], *, model: str, cache_key: str
+    ) -> ProviderCompletion:
+        await asyncio.sleep(self._latency_seconds())
+        content = self.result_for(ctx).model_dump_json()
+        return ProviderCompletion(content, self._usage(ctx, messages, content))
+
+    async def stream(
+        self, ctx: AuthoringContext, messages: list[dict], *, model: str, cache_key: str
+    ) -> AsyncIterator[ProviderChunk]:
+        latency = self._latency_seconds()
+        content = self.result_for(ctx).model_dump_json()
+        pieces = [
+            content[i:i + _STUB_STREAM_CHUNK_CHARS]
+            for i in range(0, len(content), _STUB_STREAM_CHUNK_CHARS)
+        ]
+        await asyncio.sleep(latency * _STUB_TIME_TO_FIRST_TOKEN_SHARE)
+        interval = latency * (1 - _STUB_TIME_TO_FIRST_TOKEN_SHARE) / len(pieces)
+        for piece in pieces:
+            yield ProviderChunk(piece)
+            await asyncio.sleep(interval)
+        yield ProviderChunk(usage=self._usage(ctx, messages, content))
+
+
+# =============================================================================
+# Selection
+# =============================================================================
+
+def create_provider(name: str = AUTHORING_PROVIDER) -> Optional[ModelProvider]:
+    """Build the configured provider; None if it cannot be configured (no API key)."""
+    if name == "stub":
+        logger.warning("AUTHORING_PROVIDER=stub — authoring replies are canned, not model-generated")
+        return StubProvider()
+    if name == "openai":
+        return OpenAIProvider.from_env()
+    raise ValueError(f"Unknown AUTHORING_PROVIDER: {name!r} (expected 'openai' or 'stub')")
@@ -0,0 +1,220 @@
+"""
+Response cache for cold-start authoring turns.
+
+Most sessions open with one of a handful of near-identical messages
+("не знам, предложи ми", "изненадай ме", a bare name) against an empty
+draft, and each one used to cost a full model round trip.  For such
+first turns the validated AuthoringLLMResult is cached and replayed, so the
+reply arrives in milliseconds; the normal sanitize → merge → status phases
+still run on the cached result.
+
+  - Only first user turns are eligible: the model's answer then depends on
+    nothing but the message, the draft and the prompt.
+  - Keys are (PROMPT_VERSION, model, draft digest, normalised text), so a
+    prompt or model change never serves stale answers.
+  - Each key holds up to AUTHORING_RESPONSE_CACHE_MAX_VARIANTS replies and
+    hits pick one at random.  Until the key is full, a hit is turned into a
+    miss with probability AUTHORING_RESPONSE_CACHE_COLLECT_PROBABILITY so
+    fresh model replies keep being collected and users don't all see the
+    same opener.
+  - Entries expire after AUTHORING_RESPONSE_CACHE_TTL_SECONDS and the cache
+    is LRU-bounded by AUTHORING_RESPONSE_CACHE_MAX_ENTRIES.
+  - When numpy is installed, a miss on the exact key falls back to a
+    nearest-neighbour lookup over hashed character-trigram vectors of the
+    cached texts (cosine ≥ AUTHORING_RESPONSE_CACHE_SIMILARITY), so small
+    spelling or punctuation differences still hit.  The vectors are computed
+    locally — no embedding API call on the hot path.
+
+Per-worker and in-memory: a cold worker simply fills its own cache.
+"""
+import hashlib
+import logging
+import os
+import random
+import re
+import time
+import zlib
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional — exact-key lookups only
+    np = None
+
+from app.schemas.prank_authoring import AuthoringContext, AuthoringLLMResult
+from app.services.authoring_prompts import PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+
+AUTHORING_RESPONSE_CACHE_ENABLED = os.environ.get("AUTHORING_RESPONSE_CACHE_ENABLED", "1") == "1"
+AUTHORING_RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get("AUTHORING_RESPONSE_CACHE_TTL_SECONDS", "21600"))
+AUTHORING_RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("AUTHORING_RESPONSE_CACHE_MAX_ENTRIES", "512"))
+AUTHORING_RESPONSE_CACHE_MAX_VARIANTS = int(os.environ.get("AUTHORING_RESPONSE_CACHE_MAX_VARIANTS", "4"))
+AUTHORING_RESPONSE_CACHE_COLLECT_PROBABILITY = float(
+    os.environ.get("AUTHORING_RESPONSE_CACHE_COLLECT_PROBABILITY", "0.25")
+)
+AUTHORING_RESPONSE_CACHE_SIMILARITY = float(os.environ.get("AUTHORING_RESPONSE_CACHE_SIMILARITY", "0.9"))
+
+_MAX_CACHEABLE_CHARS = 200      # longer openers are specific enough to be unique
+_EMBEDDING_DIM = 512
+
+_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of a user message."""
+    return " ".join(_PUNCT_RE.sub(" ", text.casefold()).split())
+
+
+def _embed(text: str):
+    """L2-normalised hashed character-trigram vector (crc32 — stable across workers)."""
+    vec = np.zeros(_EMBEDDING_DIM, dtype=np.float32)
+    padded = f" {text} "
+    for i in range(len(padded) - 2):
+        vec[zlib.crc32(padded[i:i + 3].encode()) % _EMBEDDING_DIM] += 1.0
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+class _Entry:
+    __slots__ = ("partition", "text", "variants", "expires_at")
+
+    def __init__(self, partition: str, text: str, expires_at: float) -> None:
+        self.partition = partition
+        self.text = text
+        self.variants: list[AuthoringLLMResult] = []
+        self.expires_at = expires_at
+
+
+class AuthoringResponseCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        max_variants: int,
+        collect_probability: float,
+        similarity: float,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._max_variants = max_variants
+        self._collect_probability = collect_probability
+        self._similarity = similarity
+        self._rng = rng or random.Random()
+        # (partition, text) → entry; order = LRU (oldest first)
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        # Nearest-neighbour index, rebuilt lazily after inserts/evictions
+        self._matrix = None
+        self._matrix_keys: list[tuple[str, str]] = []
+        self._index_dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(ctx: AuthoringContext, model: str) -> Optional[tuple[str, str]]:
+        if ctx.total_user_turns != 1 or ctx.history_summary:
+            return None
+        text = normalize_text(ctx.latest_user_message)
+        if not text or len(text) > _MAX_CACHEABLE_CHARS:
+            return None
+        draft_digest = hashlib.sha256(ctx.current_draft.model_dump_json().encode()).hexdigest()[:16]
+        partition = f"{PROMPT_VERSION}:{model}:{ctx.current_status.value}:{draft_digest}"
+        return partition, text
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def lookup(self, ctx: AuthoringContext, model: str) -> Optional[AuthoringLLMResult]:
+        key = self._key(ctx, model)
+        if key is None:
+            return None
+        entry = self._live_entry(key) or self._nearest_entry(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if (
+            len(entry.variants) < self._max_variants
+            and self._rng.random() < self._collect_probability
+        ):
+            # Deliberate miss: collect another variant from the model
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end((entry.partition, entry.text))
+        logger.info(
+            "authoring_response_cache: hit session=%s text=%r variants=%d",
+            ctx.session_id, key[1], len(entry.variants),
+        )
+        return self._rng.choice(entry.variants)
+
+    def store(self, ctx: AuthoringContext, model: str, result: AuthoringLLMResult) -> None:
+        key = self._key(ctx, model)
+        if key is None or result.ready_for_handoff:
+            return
+        entry = self._live_entry(key)
+        if entry is None:
+            entry = _Entry(key[0], key[1], time.monotonic() + self._ttl_seconds)
+            self._entries[key] = entry
+            self._index_dirty = True
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        if len(entry.variants) < self._max_variants and result not in entry.variants:
+            entry.variants.append(result)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._matrix = None
+        self._matrix_keys = []
+        self._index_dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+
+    def _live_entry(self, key: tuple[str, str]) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self._index_dirty = True
+            return None
+        return entry
+
+    def _nearest_entry(self, key: tuple[str, str]) -> Optional[_Entry]:
+        if np is None or not self._entries:
+            return None
+        if self._index_dirty or self._matrix is None:
+            self._matrix_keys = list(self._entries)
+            self._matrix = np.stack([_embed(text) for _, text in self._matrix_keys])
+            self._index_dirty = False
+
+        scores = self._matrix @ _embed(key[1])
+        for i in np.argsort(scores)[::-1]:
+            if scores[i] < self._similarity:
+                return None
+            candidate = self._matrix_keys[i]
+            if candidate[0] == key[0]:
+                entry = self._live_entry(candidate)
+                if entry is not None:
+                    return entry
+        return None
+
+
+# Module-level singleton — same pattern as PrankOrchestrator._session_locks
+authoring_response_cache = AuthoringResponseCache(
+    max_entries=AUTHORING_RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=AUTHORING_RESPONSE_CACHE_TTL_SECONDS,
+    max_variants=AUTHORING_RESPONSE_CACHE_MAX_VARIANTS,
+    collect_probability=AUTHORING_RESPONSE_CACHE_COLLECT_PROBABILITY,
+    similarity=AUTHORING_RESPONSE_CACHE_SIMILARITY,
+)
@@ -0,0 +1,223 @@
+"""
+Shared session state behind each worker's AuthoringStore.
+
+AuthoringStore is a per-process working set.  With several API workers the
+authoritative copy of a session lives in a SessionBackend that all of them
+read and write:
+
+  load(db, session_id)                       → StoredSession | None
+  version(db, session_id)                    → int | None   (cheap freshness check)
+  save(db, session, user_id[, launched_at])  → None, bumps session.version
+
+Writes are optimistic.  A session carries the version it was loaded or last
+saved at (AuthoringSession.version, 0 = never saved), and save() only
+succeeds if the stored row is still at that version.  Otherwise it raises
+SessionVersionConflict and leaves the row untouched: a turn computed on a
+stale copy can no longer silently overwrite another worker's turn, so no
+request needs to be pinned to the worker holding the session.
+
+Implementations (AUTHORING_SESSION_BACKEND selects one; default "postgres"):
+
+  PostgresSessionBackend — the authoring_drafts table, versioned by its
+                           version column, plus one authoring_messages row
+                           per message: a save inserts only the messages
+                           added since the last one.  It publishes on the
+                           change bus in the same transaction, so other
+                           workers drop their copy as soon as it commits.
+"""
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.authoring_draft import AuthoringDraft
+from app.models.authoring_message import AuthoringDraftMessage
+from app.schemas.prank_authoring import (
+    AuthoringSession,
+    AuthoringStatus,
+    MessageLog,
+    MessageRole,
+    PrankDraft,
+)
+from app.services.change_bus import CHANNEL_AUTHORING_SESSION, change_bus
+
+logger = logging.getLogger(__name__)
+
+AUTHORING_SESSION_BACKEND = (
+    os.environ.get("AUTHORING_SESSION_BACKEND", "postgres").strip().lower() or "postgres"
+)
+
+
+class SessionVersionConflict(ValueError):
+    """The stored session moved past the version this copy was based on."""
+
+
+@dataclass(slots=True)
+class StoredSession:
+    session: AuthoringSession
+    user_id: uuid.UUID
+
+
+class SessionBackend(ABC):
+    @abstractmethod
+    async def load(self, db: AsyncSession, session_id: str) -> Optional[StoredSession]:
+        """The stored session (at its current version), or None if there is none."""
+
+    @abstractmethod
+    async def version(self, db: AsyncSession, session_id: str) -> Optional[int]:
+        """The stored version, or None if the session does not exist."""
+
+    @abstractmethod
+    async def save(
+        self,
+        db: AsyncSession,
+        session: AuthoringSession,
+        user_id: uuid.UUID,
+        *,
+        launched_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Write the session if the stored copy is still at session.version,
+        then advance session.version.  Raises SessionVersionConflict (and
+        writes nothing) if another writer got there first.
+        """
+
+
+def _parse_id(session_id: str) -> Optional[uuid.UUID]:
+    try:
+        return uuid.UUID(session_id)
+    except ValueError:
+        return None
+
+
+class PostgresSessionBackend(SessionBackend):
+    async def load(self, db: AsyncSession, session_id: str) -> Optional[StoredSession]:
+        sid = _parse_id(session_id)
+        if sid is None:
+            return None
+        row = await db.scalar(select(AuthoringDraft).where(AuthoringDraft.id == sid))
+        if row is None:
+            return None
+        messages = MessageLog()
+        for role, content, created_at in await db.execute(
+            select(AuthoringDraftMessage.role, AuthoringDraftMessage.content, AuthoringDraftMessage.created_at)
+            .where(AuthoringDraftMessage.draft_id == sid)
+            .order_by(AuthoringDraftMessage.seq)
+        ):
+            messages.add(MessageRole(role), content, created_at)
+        session = AuthoringSession(
+            id=str(row.id),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            status=AuthoringStatus(row.status),
+            draft=PrankDraft.model_validate_json(row.draft_json),
+            messages=messages,
+            is_complete=row.is_complete,
+            recipient_phone=row.recipient_phone,
+            version=row.version,
+            persisted_messages=len(messages),
+            context_summary=row.context_summary,
+            summarized_through=row.summarized_through,
+        )
+        return StoredSession(session=session, user_id=row.user_id)
+
+    async def version(self, db: AsyncSession, session_id: str) -> Optional[int]:
+        sid = _parse_id(session_id)
+        if sid is None:
+            return None
+        return await db.scalar(select(AuthoringDraft.version).where(AuthoringDraft.id == sid))
+
+    async def save(
+        self,
+        db: AsyncSession,
+        session: AuthoringSession,
+        user_id: uuid.UUID,
+        *,
+        launched_at: Optional[datetime] = None,
+    ) -> None:
+        sid = _parse_id(session.id)
+        if sid is None:
+            logger.error("PostgresSessionBackend.save: invalid session id %s", session.id)
+            return
+
+        values = {
+            "status": session.status.value,
+            "draft_json": session.draft.model_dump_json(),
+            "recipient_phone": session.recipient_phone,
+            "is_complete": session.is_complete,
+            "prank_title": session.draft.prank_title,
+            "context_summary": session.context_summary,
+            "summarized_through": session.summarized_through,
+            "version": session.version + 1,
+        }
+        if launched_at is not None:
+            values["launched_at"] = launched_at
+
+        created = session.version == 0
+        if created:
+            db.add(AuthoringDraft(id=sid, user_id=user_id, **values))
+            await db.flush()   # the draft row must exist before its messages
+        else:
+            written = await db.scalar(
+                update(AuthoringDraft)
+                .where(AuthoringDraft.id == sid, AuthoringDraft.version == session.version)
+                .values(**values)
+                .returning(AuthoringDraft.version)
+            )
+            if written is None:
+                await db.rollback()
+                raise SessionVersionConflict(
+                    f"Session {session.id} changed since version {session.version}"
+                )
+
+        # The version check above makes this worker the only writer, so the
+        # stored log is exactly messages[:persisted_messages]
+        log = session.messages
+        appended = len(log)
+        if appended > session.persisted_messages:
+            await db.execute(
+                insert(AuthoringDraftMessage),
+                [
+                    {
+                        "draft_id": sid,
+                        "seq": seq,
+                        "role": log.role_at(seq).value,
+                        "content": log.content_at(seq),
+                        "created_at": log.timestamp_at(seq),
+                    }
+                    for seq in range(session.persisted_messages, appended)
+                ],
+            )
+
+        await change_bus.publish(
+            db,
+            CHANNEL_AUTHORING_SESSION,
+            {"id": session.id, "u": str(user_id), "c": int(created)},
+        )
+        await db.commit()
+        session.version = values["version"]
+        session.persisted_messages = appended
+        logger.debug(
+            "PostgresSessionBackend.save: session=%s version=%d messages=%d",
+            session.id, session.version, appended,
+        )
+
+
+# =============================================================================
+# Selection
+# =============================================================================
+
+def create_session_backend(name: str = AUTHORING_SESSION_BACKEND) -> SessionBackend:
+    if name == "postgres":
+        return PostgresSessionBackend()
+    raise ValueError(f"Unknown AUTHORING_SESSION_BACKEND: {name!r} (expected 'postgres')")
+
+
+# Module-level singleton — same pattern as PrankOrchestrator._session_locks
+session_backend = create_session_backend()
@@ -0,0 +1,185 @@
+"""
+Shadow traffic for candidate prompt versions.
+
+When AUTHORING_SHADOW_PROMPT_VERSION names a registered prompt version
+(authoring_prompts.PROMPT_VERSIONS) other than the live one, a random
+AUTHORING_SHADOW_FRACTION of model-answered turns is replayed on it: once
+the primary reply is in, the engine hands the turn to maybe_shadow(), and a
+detached task sends the same context — built with the candidate's system
+prompt and payload — to the same model.  The candidate's reply is parsed
+and scored but never shown, merged or cached; each replay writes one row to
+authoring_prompt_shadow_runs next to the primary call's numbers.
+
+Production turns are never affected: shadow runs start after the primary
+reply, run in an empty contextvars context (so they add nothing to the
+turn's telemetry), are capped at AUTHORING_SHADOW_MAX_INFLIGHT concurrent
+calls (turns beyond that are skipped and counted), and log rather than
+raise on any failure.  stop() cancels whatever is still in flight.
+"""
+import asyncio
+import contextvars
+import logging
+import os
+import random
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from sqlalchemy import insert
+
+from app.database import SessionLocal
+from app.models.authoring_prompt_shadow_run import AuthoringPromptShadowRun
+from app.schemas.prank_authoring import AuthoringContext, AuthoringLLMResult
+from app.services.authoring_metrics import current_turn, usage_from_completion
+from app.services.authoring_prompts import PROMPT_VERSION, PROMPT_VERSIONS, build_provider_messages
+from app.services.authoring_providers import ModelProvider
+
+logger = logging.getLogger(__name__)
+
+AUTHORING_SHADOW_PROMPT_VERSION = os.environ.get("AUTHORING_SHADOW_PROMPT_VERSION", "").strip()
+AUTHORING_SHADOW_FRACTION = float(os.environ.get("AUTHORING_SHADOW_FRACTION", "0.05"))
+AUTHORING_SHADOW_MAX_INFLIGHT = int(os.environ.get("AUTHORING_SHADOW_MAX_INFLIGHT", "4"))
+AUTHORING_SHADOW_DEADLINE_SECONDS = float(os.environ.get("AUTHORING_SHADOW_DEADLINE_SECONDS", "30"))
+if AUTHORING_SHADOW_PROMPT_VERSION and AUTHORING_SHADOW_PROMPT_VERSION not in PROMPT_VERSIONS:
+    raise ValueError(
+        f"Unknown AUTHORING_SHADOW_PROMPT_VERSION: {AUTHORING_SHADOW_PROMPT_VERSION!r} "
+        f"(expected one of {sorted(PROMPT_VERSIONS)})"
+    )
+
+
+class PromptShadow:
+    def __init__(
+        self,
+        *,
+        candidate_version: str,
+        fraction: float,
+        max_inflight: int,
+        deadline_seconds: float,
+        session_factory: Callable = SessionLocal,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self._candidate = candidate_version
+        self._fraction = fraction
+        self._max_inflight = max_inflight
+        self._deadline_seconds = deadline_seconds
+        self._session_factory = session_factory
+        self._rng = rng or random.Random()
+        self._tasks: set[asyncio.Task] = set()
+        self.skipped = 0   # sampled turns dropped because max_inflight runs were busy
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._candidate) and self._candidate != PROMPT_VERSION and self._fraction > 0
+
+    def maybe_shadow(
+        self,
+        ctx: AuthoringContext,
+        provider: ModelProvider,
+        primary: AuthoringLLMResult,
+        completes: Callable[[AuthoringLLMResult], bool],
+    ) -> bool:
+        """
+        Sample this turn and, if picked, start replaying it on the candidate.
+
+        Call inside the turn's measure_turn() once the primary reply is in;
+        `completes` says whether a reply, merged into the draft, completes
+        it.  Returns True if a shadow run was started.  Never awaits.
+        """
+        if not self.enabled or self._rng.random() >= self._fraction:
+            return False
+        turn = current_turn()
+        if turn is None or turn.model is None:
+            return False
+        if len(self._tasks) >= self._max_inflight:
+            self.skipped += 1
+            if self.skipped % 100 == 1:
+                logger.warning("PromptShadow: at capacity, %d sampled turns skipped so far", self.skipped)
+            return False
+        try:
+            session_id = uuid.UUID(ctx.session_id)
+        except ValueError:
+            return False
+        row: dict[str, Any] = {
+            "session_id": session_id,
+            "status": ctx.current_status.value,
+            "model": turn.model,
+            "primary_version": PROMPT_VERSION,
+            "candidate_version": self._candidate,
+            "primary_model_ms": round(turn.model_ms, 1),
+            "primary_prompt_tokens": turn.prompt_tokens,
+            "primary_completion_tokens": turn.completion_tokens,
+            "primary_completes_draft": completes(primary),
+        }
+        # A fresh context: the shadow call must not report into the live turn's TurnTiming
+        task = asyncio.create_task(
+            self._run(ctx, provider, turn.model, completes, row), context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def stop(self) -> None:
+        """Cancel shadow runs still in flight; their rows are not written."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(
+        self,
+        ctx: AuthoringContext,
+        provider: ModelProvider,
+        model: str,
+        completes: Callable[[AuthoringLLMResult], bool],
+        row: dict[str, Any],
+    ) -> None:
+        messages = build_provider_messages(ctx, self._candidate)
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self._deadline_seconds):
+                completion = await provider.complete(
+                    ctx, messages, model=model, cache_key=f"authoring-shadow:{ctx.session_id}"
+                )
+        except TimeoutError:
+            row["candidate_error"] = "timeout"
+        except Exception:
+            logger.warning(
+                "PromptShadow: candidate %s call failed session=%s", self._candidate, ctx.session_id,
+                exc_info=True,
+            )
+            row["candidate_error"] = "error"
+        else:
+            usage = usage_from_completion(
+                completion.usage,
+                session_id=ctx.session_id,
+                model=model,
+                latency_ms=(time.perf_counter() - started) * 1000,
+            )
+            row["candidate_model_ms"] = round(usage.latency_ms, 1)
+            row["candidate_prompt_tokens"] = usage.prompt_tokens
+            row["candidate_completion_tokens"] = usage.completion_tokens
+            try:
+                result = AuthoringLLMResult.model_validate_json(completion.content)
+            except ValueError:
+                row["candidate_error"] = "invalid_output"
+            else:
+                row["candidate_completes_draft"] = completes(result)
+        await self._write(row)
+
+    async def _write(self, row: dict[str, Any]) -> None:
+        try:
+            async with self._session_factory() as db:
+                await db.execute(insert(AuthoringPromptShadowRun), [row])
+                await db.commit()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("PromptShadow: dropping shadow run for session %s", row["session_id"])
+
+
+# Module-level singleton — same pattern as PrankOrchestrator._session_locks
+prompt_shadow = PromptShadow(
+    candidate_version=AUTHORING_SHADOW_PROMPT_VERSION,
+    fraction=AUTHORING_SHADOW_FRACTION,
+    max_inflight=AUTHORING_SHADOW_MAX_INFLIGHT,
+    deadline_seconds=AUTHORING_SHADOW_DEADLINE_SECONDS,
+)
@@ -1,19 +1,33 @@
+import os
+import time
 import uuid
 import random
 import logging
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
 from app.schemas.prank_authoring import (
     AuthoringSession,
     AuthoringStatus,
-    AuthoringMessage,
+    MessageLog,
     MessageRole,
     PrankDraft,
 )
 
 logger = logging.getLogger(__name__)
 
+# Bounds on the in-memory copy; evicted sessions rehydrate from authoring_drafts
+AUTHORING_STORE_MAX_SESSIONS = int(os.environ.get("AUTHORING_STORE_MAX_SESSIONS", "5000"))
+AUTHORING_STORE_MAX_BYTES = int(os.environ.get("AUTHORING_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+AUTHORING_STORE_IDLE_TTL_SECONDS = float(os.environ.get("AUTHORING_STORE_IDLE_TTL_SECONDS", "1800"))
+
+# Rough per-object overhead on top of the text: the session's Pydantic
+# models, and per message a str header plus its MessageLog array slots
+_SESSION_OVERHEAD_BYTES = 2048
+_MESSAGE_OVERHEAD_BYTES = 64
+
 _WELCOME_MESSAGES = [
     "Как искаш да се забавляваме днес? На кого да звъннем?",
     "Какъв майтап ти се върти в главата?",
@@ -23,55 +37,173 @@ _WELCOME_MESSAGES = [
 ]
 
 
+def estimate_session_bytes(session: AuthoringSession) -> int:
+    """Approximate resident size of a session: its text plus fixed per-object overhead."""
+    return (
+        _SESSION_OVERHEAD_BYTES
+        + sum(_MESSAGE_OVERHEAD_BYTES + len(content.encode()) for content in session.messages.contents())
+        + len(session.draft.model_dump_json(exclude_none=True))
+        + len((session.context_summary or "").encode())
+    )
+
+
 class AuthoringStore:
     """
     In-memory store for System 1 authoring sessions.
 
     Swap this for a DB-backed store when persistence is needed —
     the interface is the only contract the engine and router depend on.
+
+    Bounded: sessions are kept in least-recently-used order, and once there
+    are more than max_sessions, their estimated size exceeds max_bytes, or
+    one has been idle for idle_ttl_seconds, the least recently used are
+    dropped.  Limits are enforced on every create / put / get, so an idle
+    worker holds on to at most one pass's worth of expired sessions.
+    Callers rehydrate an evicted session from the DB (router _load_from_db
+    → put_session).  A pinned session (see pinned()) is never evicted.
     """
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, AuthoringSession] = {}
+    def __init__(
+        self,
+        *,
+        max_sessions: int = AUTHORING_STORE_MAX_SESSIONS,
+        max_bytes: int = AUTHORING_STORE_MAX_BYTES,
+        idle_ttl_seconds: float = AUTHORING_STORE_IDLE_TTL_SECONDS,
+    ) -> None:
+        self._max_sessions = max_sessions
+        self._max_bytes = max_bytes
+        self._idle_ttl_seconds = idle_ttl_seconds
+        # Least recently used first; value = (session, last access, monotonic)
+        self._sessions: OrderedDict[str, tuple[AuthoringSession, float]] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._pins: dict[str, int] = {}
+        self._evict_when_unpinned: set[str] = set()
+        self.bytes_used = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
 
     def create_session(self) -> AuthoringSession:
         now = datetime.now(timezone.utc)
-        welcome = AuthoringMessage(
-            role=MessageRole.ASSISTANT,
-            content=random.choice(_WELCOME_MESSAGES),
-            timestamp=now,
-        )
+        messages = MessageLog()
+        messages.add(MessageRole.ASSISTANT, random.choice(_WELCOME_MESSAGES), now)
         session = AuthoringSession(
             id=str(uuid.uuid4()),
             created_at=now,
             updated_at=now,
             status=AuthoringStatus.COLLECTING_INFO,
             draft=PrankDraft(),
-            messages=[welcome],
+            messages=messages,
             latest_assistant_question=None,
             is_complete=False,
             recipient_phone=None,
         )
-        self._sessions[session.id] = session
+        self.put_session(session)
         logger.info("AuthoringStore: created session %s", session.id)
         return session
 
+    def put_session(self, session: AuthoringSession) -> None:
+        """Insert or replace a session (e.g. one rehydrated from the DB)."""
+        self._evict_when_unpinned.discard(session.id)
+        self._sessions[session.id] = (session, time.monotonic())
+        self._sessions.move_to_end(session.id)
+        self._account(session.id)
+        self._enforce_limits()
+
     def get_session(self, session_id: str) -> Optional[AuthoringSession]:
-        return self._sessions.get(session_id)
+        # Touch first: the session being read is the newest, so it is never
+        # the one evicted, even if it had been idle past the TTL
+        session = self._touch(session_id)
+        self._enforce_limits()
+        return session
+
+    def evict(self, session_id: str) -> bool:
+        """
+        Drop the in-memory copy so the next access rehydrates from the DB.
+        Used when another worker changed the session.  A pinned session is
+        dropped when its last pin is released.
+        """
+        if session_id in self._pins:
+            self._evict_when_unpinned.add(session_id)
+            return False
+        evicted = self._drop(session_id)
+        if evicted:
+            logger.debug("AuthoringStore: evicted session %s", session_id)
+        return evicted
+
+    @contextmanager
+    def pinned(self, session_id: str) -> Iterator[None]:
+        """Keep the session resident (not evicted) for the duration, e.g. one turn."""
+        self._pins[session_id] = self._pins.get(session_id, 0) + 1
+        try:
+            yield
+        finally:
+            self._pins[session_id] -= 1
+            if not self._pins[session_id]:
+                del self._pins[session_id]
+                if session_id in self._evict_when_unpinned:
+                    self._evict_when_unpinned.discard(session_id)
+                    self.evict(session_id)
+
+    def _touch(self, session_id: str) -> Optional[AuthoringSession]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        self._sessions[session_id] = (entry[0], time.monotonic())
+        self._sessions.move_to_end(session_id)
+        return entry[0]
+
+    def _require(self, session_id: str) -> AuthoringSession:
+        session = self._touch(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        return session
+
+    def _account(self, session_id: str) -> None:
+        size = estimate_session_bytes(self._sessions[session_id][0])
+        self.bytes_used += size - self._sizes.get(session_id, 0)
+        self._sizes[session_id] = size
+
+    def _drop(self, session_id: str) -> bool:
+        if self._sessions.pop(session_id, None) is None:
+            return False
+        self.bytes_used -= self._sizes.pop(session_id)
+        return True
+
+    def _enforce_limits(self) -> None:
+        """Evict least recently used sessions while over a bound; skips pinned ones."""
+        if not self._sessions:
+            return
+        expired_before = time.monotonic() - self._idle_ttl_seconds
+        newest = next(reversed(self._sessions))
+        count, used = len(self._sessions), self.bytes_used
+        victims: list[tuple[str, str]] = []
+        for session_id, (_, last_access) in self._sessions.items():
+            over_capacity = count > self._max_sessions or used > self._max_bytes
+            if not over_capacity and last_access >= expired_before:
+                break  # everything after this one is newer
+            if session_id == newest:
+                break  # never evict the session being accessed, however large
+            if session_id in self._pins:
+                continue
+            victims.append((session_id, "capacity" if over_capacity else "idle"))
+            count -= 1
+            used -= self._sizes[session_id]
+        for session_id, reason in victims:
+            self._drop(session_id)
+            self.evictions += 1
+            logger.debug("AuthoringStore: evicted session %s (%s)", session_id, reason)
 
     def append_message(self, session_id: str, role: MessageRole, content: str) -> None:
-        session = self._sessions[session_id]
-        session.messages.append(
-            AuthoringMessage(
-                role=role,
-                content=content,
-                timestamp=datetime.now(timezone.utc),
-            )
-        )
-        session.updated_at = datetime.now(timezone.utc)
+        session = self._require(session_id)
+        now = datetime.now(timezone.utc)
+        session.messages.add(role, content, now)
+        session.updated_at = now
+        self._account(session_id)
 
     def set_recipient_phone(self, session_id: str, phone: str) -> None:
-        session = self._sessions[session_id]
+        session = self._require(session_id)
         session.recipient_phone = phone
         session.updated_at = datetime.now(timezone.utc)
         logger.info("AuthoringStore: set recipient_phone for session %s", session_id)
@@ -85,7 +217,7 @@ class AuthoringStore:
         latest_assistant_question: Optional[str] = None,
         is_complete: Optional[bool] = None,
     ) -> AuthoringSession:
-        session = self._sessions[session_id]
+        session = self._require(session_id)
         if draft is not None:
             session.draft = draft
         if status is not None:
@@ -95,6 +227,7 @@ class AuthoringStore:
         if is_complete is not None:
             session.is_complete = is_complete
         session.updated_at = datetime.now(timezone.utc)
+        self._account(session_id)
         return session
 
 
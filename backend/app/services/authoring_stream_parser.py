@@ -0,0 +1,173 @@
+"""
+Incremental parser for streamed AuthoringLLMResult completions.
+
+The model answers every authoring turn with one JSON object.  Only its
+top-level `reply` string is user-facing; draft_update, missing_fields and
+notes are backend-only.  ReplyStreamParser consumes the completion chunk by
+chunk and returns the decoded `reply` characters as soon as they arrive, so
+the reply can be streamed while the rest of the object is still generating.
+
+It is a scanner, not a validator: it tracks just enough JSON structure
+(nesting depth, strings, escapes, top-level keys) to find the reply, in a
+single pass over the input.  The complete text is validated afterwards by
+the engine's normal parse → sanitize → merge pipeline.
+
+Handles:
+  - `reply` in any position among the top-level keys
+  - nested objects that contain their own "reply" keys (ignored)
+  - escape sequences, including \\uXXXX and surrogate pairs, split at any
+    chunk boundary
+"""
+from typing import Optional
+
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+_REPLY_FIELD = "reply"
+
+
+class ReplyStreamParser:
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._depth = 0
+        # Top-level (depth 1) key/value tracking
+        self._expect_key = False
+        self._last_key: Optional[str] = None
+        self._value_key: Optional[str] = None
+        # String state
+        self._in_string = False
+        self._string_is_key = False
+        self._key_chars: list[str] = []
+        self._escape = False
+        self._unicode: Optional[str] = None
+        self._high_surrogate: Optional[int] = None
+        # Reply capture
+        self._capturing = False
+        self.reply_complete = False
+        self._reply_chars: list[str] = []
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far — the raw completion for final validation."""
+        return "".join(self._chunks)
+
+    @property
+    def reply(self) -> str:
+        """The reply decoded so far."""
+        return "".join(self._reply_chars)
+
+    def feed(self, chunk: str) -> str:
+        """Consume the next completion chunk; return newly decoded reply text."""
+        self._chunks.append(chunk)
+        out: list[str] = []
+        for ch in chunk:
+            if self._in_string:
+                self._string_char(ch, out)
+            else:
+                self._structural_char(ch)
+        return "".join(out)
+
+    # ------------------------------------------------------------------
+
+    def _structural_char(self, ch: str) -> None:
+        if ch == '"':
+            self._in_string = True
+            if self._depth == 1 and self._expect_key:
+                self._string_is_key = True
+                self._key_chars = []
+                self._expect_key = False
+            else:
+                self._string_is_key = False
+                if (
+                    self._depth == 1
+                    and self._value_key == _REPLY_FIELD
+                    and not self.reply_complete
+                ):
+                    self._capturing = True
+            self._value_key = None
+        elif ch == "{" or ch == "[":
+            self._depth += 1
+            self._expect_key = ch == "{" and self._depth == 1
+            self._value_key = None
+        elif ch == "}" or ch == "]":
+            self._depth -= 1
+        elif ch == ",":
+            if self._depth == 1:
+                self._expect_key = True
+                self._value_key = None
+        elif ch == ":":
+            if self._depth == 1:
+                self._value_key = self._last_key
+        elif not ch.isspace() and self._depth == 1:
+            # Start of a number / literal value
+            self._value_key = None
+
+    def _string_char(self, ch: str, out: list[str]) -> None:
+        if self._unicode is not None:
+            self._unicode += ch
+            if len(self._unicode) < 4:
+                return
+            try:
+                code = int(self._unicode, 16)
+            except ValueError:
+                code = 0xFFFD
+            self._unicode = None
+            if 0xD800 <= code < 0xDC00:
+                self._flush_high_surrogate(out)
+                self._high_surrogate = code
+                return
+            if 0xDC00 <= code < 0xE000 and self._high_surrogate is not None:
+                code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+                self._high_surrogate = None
+                self._emit(chr(code), out)
+                return
+            self._flush_high_surrogate(out)
+            # A lone low surrogate cannot be encoded as UTF-8 either
+            self._emit("\ufffd" if 0xDC00 <= code < 0xE000 else chr(code), out)
+            return
+
+        if self._escape:
+            self._escape = False
+            if ch == "u":
+                self._unicode = ""
+                return
+            self._flush_high_surrogate(out)
+            self._emit(_SIMPLE_ESCAPES.get(ch, ch), out)
+            return
+
+        if ch == "\\":
+            self._escape = True
+            return
+
+        self._flush_high_surrogate(out)
+        if ch == '"':
+            self._in_string = False
+            if self._string_is_key:
+                self._last_key = "".join(self._key_chars)
+            elif self._capturing:
+                self._capturing = False
+                self.reply_complete = True
+            return
+
+        self._emit(ch, out)
+
+    def _flush_high_surrogate(self, out: list[str]) -> None:
+        # A lone high surrogate cannot be encoded as UTF-8; substitute U+FFFD.
+        if self._high_surrogate is not None:
+            self._high_surrogate = None
+            self._emit("\ufffd", out)
+
+    def _emit(self, decoded: str, out: list[str]) -> None:
+        if self._string_is_key:
+            self._key_chars.append(decoded)
+        elif self._capturing:
+            out.append(decoded)
+            self._reply_chars.append(decoded)
@@ -0,0 +1,136 @@
+"""
+Per-session serialisation of authoring turns.
+
+Two turns for the same session must never run concurrently: both would read
+the same draft, both would call the model, and whichever persisted last would
+silently drop the other's draft update.  AuthoringTurnQueue gives every
+session one lock, and coalesces messages that pile up behind it:
+
+  - submit() queues the message and waits for the session's lock.  Whoever
+    gets the lock with its own message still pending becomes the leader: it
+    takes every pending message, joins them (newline-separated) into a single
+    user turn and runs it once.  The followers whose messages rode along
+    receive the leader's result instead of running a turn of their own.
+    A double-tap or a burst of short messages therefore costs one model call.
+  - exclusive() just holds the lock — for turns that cannot be shared, such
+    as a streamed reply, which belongs to one client connection.
+
+If the leader fails, its followers see the same exception.  If it is
+cancelled, they get TurnInterrupted: the turn may already have recorded the
+joined message, so requeueing it could send and store it twice.  A caller
+that goes away while waiting withdraws its message if no turn has taken it
+yet, and is never handed a result.
+
+The lock serialises turns within one worker.  Across workers, optimistic
+versioning takes over: a turn starts from the stored version
+(_ensure_current in app/api/authoring.py reloads a stale copy), and if
+another worker persists first, PostgresSessionBackend.save raises
+SessionVersionConflict, which _persist_to_db turns into a 409.
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_MESSAGE_SEPARATOR = "\n"
+
+
+class TurnInterrupted(ValueError):
+    """The coalesced turn carrying this message was cancelled before it finished."""
+
+
+class _SessionTurns:
+    __slots__ = ("lock", "pending", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.pending: list[tuple[str, asyncio.Future]] = []
+        self.users = 0   # callers holding or waiting; the entry is dropped at 0
+
+
+class AuthoringTurnQueue:
+    def __init__(self) -> None:
+        self._sessions: dict[str, _SessionTurns] = {}
+
+    @asynccontextmanager
+    async def _session(self, session_id: str) -> AsyncIterator[_SessionTurns]:
+        state = self._sessions.setdefault(session_id, _SessionTurns())
+        state.users += 1
+        try:
+            yield state
+        finally:
+            state.users -= 1
+            if state.users == 0:
+                del self._sessions[session_id]
+
+    @asynccontextmanager
+    async def exclusive(self, session_id: str) -> AsyncIterator[None]:
+        """Hold the session's turn lock without taking part in coalescing."""
+        async with self._session(session_id) as state:
+            async with state.lock:
+                yield
+
+    async def submit(
+        self,
+        session_id: str,
+        content: str,
+        run_turn: Callable[[str], Awaitable[T]],
+    ) -> T:
+        """
+        Queue content for session_id and return the result of the turn that
+        processed it — either run_turn(joined pending messages) if this call
+        leads, or the result of the leader whose batch included it.
+        """
+        async with self._session(session_id) as state:
+            own = asyncio.get_running_loop().create_future()
+            entry = (content, own)
+            state.pending.append(entry)
+            try:
+                async with state.lock:
+                    if not own.done():
+                        batch, state.pending = state.pending, []
+                        followers = [future for _, future in batch if future is not own]
+                        if followers:
+                            logger.info(
+                                "authoring_turn_queue: session=%s coalescing %d messages into one turn",
+                                session_id, len(batch),
+                            )
+                        try:
+                            result = await run_turn(_MESSAGE_SEPARATOR.join(text for text, _ in batch))
+                        except asyncio.CancelledError:
+                            _fail(followers, TurnInterrupted(
+                                f"The turn for session {session_id} was interrupted — resend the message"
+                            ))
+                            raise
+                        except BaseException as exc:
+                            _fail(followers, exc)
+                            raise
+                        for _, future in batch:
+                            if not future.done():
+                                future.set_result(result)
+
+                return await own
+            except asyncio.CancelledError:
+                # The caller went away: withdraw the message if no turn took it
+                # and make sure no result or error is left unread
+                with suppress(ValueError):
+                    state.pending.remove(entry)
+                if own.done() and not own.cancelled():
+                    own.exception()
+                own.cancel()
+                raise
+
+
+def _fail(futures: list[asyncio.Future], exc: BaseException) -> None:
+    # Futures of callers that were cancelled meanwhile are already done
+    for future in futures:
+        if not future.done():
+            future.set_exception(exc)
+
+
+# Module-level singleton — same pattern as PrankOrchestrator._session_locks
+authoring_turn_queue = AuthoringTurnQueue()
@@ -0,0 +1,154 @@
+"""
+Cross-worker change notification over Postgres LISTEN/NOTIFY.
+
+Writers call publish() inside their own transaction, so Postgres delivers the
+NOTIFY to every listener when the transaction commits and drops it on
+rollback.  Each worker keeps one dedicated asyncpg connection that LISTENs on
+every subscribed channel and fans payloads out to local subscribers
+(cache invalidation, long-poll wakeups, rate-limit bookkeeping).
+
+Payloads are compact JSON tagged with the publishing worker's id.  A worker
+ignores its own notifications: local writers already update their own
+process state directly, so the bus only carries changes made elsewhere.
+
+No external broker — the database we already depend on is the bus.
+"""
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PRANK_SESSION = "prank_session"
+CHANNEL_AUTHORING_SESSION = "authoring_session"
+CHANNEL_USER = "app_user"
+
+_RECONNECT_MIN_DELAY_SECONDS = 0.5
+_RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+Subscriber = Callable[[dict[str, Any]], None]
+
+
+def _asyncpg_dsn(database_url: str) -> str:
+    """SQLAlchemy URL (postgresql+asyncpg://...) → plain libpq DSN for asyncpg."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+class ChangeBus:
+    def __init__(self) -> None:
+        self.worker_id = uuid.uuid4().hex[:12]
+        self._subscribers: dict[str, list[Subscriber]] = defaultdict(list)
+        self._dsn: Optional[str] = None
+        self._conn = None
+        self._connect_task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    async def publish(self, db: AsyncSession, channel: str, payload: dict[str, Any]) -> None:
+        """
+        Queue a notification on the caller's transaction.
+
+        Must be called before db.commit(); delivery happens on commit.
+        """
+        message = json.dumps({"w": self.worker_id, **payload}, separators=(",", ":"))
+        await db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": channel, "payload": message},
+        )
+
+    # ------------------------------------------------------------------
+    # Subscribing
+    # ------------------------------------------------------------------
+
+    def subscribe(self, channel: str, callback: Subscriber) -> None:
+        """Register a callback for remote changes on channel (call at import time)."""
+        self._subscribers[channel].append(callback)
+
+    def _on_notification(self, _conn, _pid: int, channel: str, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            logger.warning("ChangeBus: dropping malformed payload on %s: %.200s", channel, payload)
+            return
+        if data.get("w") == self.worker_id:
+            return
+        for callback in self._subscribers.get(channel, ()):
+            try:
+                callback(data)
+            except Exception:
+                logger.exception("ChangeBus: subscriber failed on channel=%s", channel)
+
+    # ------------------------------------------------------------------
+    # Listener lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self, database_url: str) -> None:
+        """Open the LISTEN connection in the background (retries until it succeeds)."""
+        self._dsn = _asyncpg_dsn(database_url)
+        self._closing = False
+        self._connect_task = asyncio.create_task(self._connect_loop())
+
+    async def stop(self) -> None:
+        self._closing = True
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+            self._connect_task = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            try:
+                await conn.close()
+            except Exception:
+                logger.warning("ChangeBus: error closing listener connection", exc_info=True)
+
+    async def _connect_loop(self) -> None:
+        import asyncpg
+
+        delay = _RECONNECT_MIN_DELAY_SECONDS
+        while not self._closing:
+            try:
+                conn = await asyncpg.connect(self._dsn)
+                try:
+                    for channel in self._subscribers:
+                        await conn.add_listener(channel, self._on_notification)
+                    conn.add_termination_listener(self._on_termination)
+                except BaseException:
+                    # Don't leak the half-set-up connection; terminate() is
+                    # synchronous, so this also holds on cancellation
+                    conn.terminate()
+                    raise
+                self._conn = conn
+                logger.info(
+                    "ChangeBus: worker=%s listening on %s",
+                    self.worker_id, ", ".join(sorted(self._subscribers)),
+                )
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "ChangeBus: listener connect failed, retrying in %.1fs", delay, exc_info=True
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_DELAY_SECONDS)
+
+    def _on_termination(self, _conn) -> None:
+        self._conn = None
+        if self._closing:
+            return
+        # Notifications sent while disconnected are lost; subscribers hold
+        # caches that fall back to the DB, so a gap only costs freshness.
+        logger.warning("ChangeBus: listener connection lost, reconnecting")
+        self._connect_task = asyncio.create_task(self._connect_loop())
+
+
+# Module-level singleton — same pattern as PrankOrchestrator._session_locks
+change_bus = ChangeBus()
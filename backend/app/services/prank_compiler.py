@@ -0,0 +1,168 @@
+"""
+Compiles READY authoring drafts into launchable prank material.
+
+When a turn leaves a session READY, the engine calls
+prank_compiler.schedule(draft) and compilation runs in the background:
+
+  1. build the PrankPackage from the draft
+  2. derive the script lines (opening → escalation → resolution)
+  3. render each line to audio through the TTS engine (app.services.tts)
+  4. write everything under PRANK_COMPILED_DIR/<draft digest>/, with
+     package.json written last as the completion marker
+
+Results are keyed by the draft's content digest, so re-compiling an
+unchanged draft is free, an edited READY draft gets a fresh package, and a
+result written by another worker (or before a restart) is reused from disk.
+The launch endpoint calls get(draft), which returns the cached result,
+joins the in-flight compilation, or compiles on the spot as a fallback.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.schemas.prank_authoring import Constraints, PrankDraft, PrankPackage
+from app.services.tts import TTSEngine, create_tts_engine
+
+logger = logging.getLogger(__name__)
+
+PRANK_COMPILED_DIR = Path(os.environ.get("PRANK_COMPILED_DIR", "static/compiled"))
+PRANK_COMPILED_URL_PREFIX = os.environ.get("PRANK_COMPILED_URL_PREFIX", "/static/compiled").rstrip("/")
+
+_MAX_CACHED_RESULTS = 256
+_PACKAGE_FILE = "package.json"
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPrank:
+    digest: str
+    package: PrankPackage
+    script_lines: tuple[str, ...]
+    audio_urls: tuple[str, ...]
+
+
+def draft_digest(draft: PrankDraft) -> str:
+    return hashlib.sha256(draft.model_dump_json().encode()).hexdigest()[:24]
+
+
+def build_package(draft: PrankDraft) -> PrankPackage:
+    """Raises ValueError if the draft is missing a required section."""
+    if draft.prank_type is None or draft.caller is None or draft.target_effect is None or draft.progression is None:
+        raise ValueError("Draft is incomplete — cannot build a PrankPackage")
+    notes = [draft.prank_title, draft.context_notes]
+    return PrankPackage(
+        prank_type=draft.prank_type,
+        caller=draft.caller,
+        target_effect=draft.target_effect,
+        progression=draft.progression,
+        constraints=draft.constraints or Constraints(),
+        script_notes="\n".join(n for n in notes if n),
+    )
+
+
+def script_lines(package: PrankPackage) -> list[str]:
+    progression = package.progression
+    return [line for line in (progression.opening, progression.escalation, progression.resolution) if line]
+
+
+class PrankCompiler:
+    def __init__(self, output_dir: Path, url_prefix: str, tts: Optional[TTSEngine] = None) -> None:
+        self._output_dir = output_dir
+        self._url_prefix = url_prefix
+        self._tts = tts
+        self._results: OrderedDict[str, CompiledPrank] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def schedule(self, draft: PrankDraft) -> None:
+        """Start compiling draft in the background unless it is done or in flight."""
+        digest = draft_digest(draft)
+        if digest in self._results or digest in self._tasks:
+            return
+        self._start(draft, digest)
+
+    async def get(self, draft: PrankDraft) -> CompiledPrank:
+        digest = draft_digest(draft)
+        cached = self._results.get(digest)
+        if cached is not None:
+            self._results.move_to_end(digest)
+            return cached
+        task = self._tasks.get(digest) or self._start(draft, digest)
+        # shield: a cancelled caller must not abort a compilation others share
+        return await asyncio.shield(task)
+
+    # ------------------------------------------------------------------
+
+    def _start(self, draft: PrankDraft, digest: str) -> asyncio.Task:
+        task = asyncio.create_task(self._compile(draft.model_copy(deep=True), digest))
+        self._tasks[digest] = task
+        task.add_done_callback(lambda t: self._finished(digest, t))
+        return task
+
+    def _finished(self, digest: str, task: asyncio.Task) -> None:
+        self._tasks.pop(digest, None)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error("PrankCompiler: compile failed digest=%s: %s", digest, task.exception())
+            return
+        self._results[digest] = task.result()
+        while len(self._results) > _MAX_CACHED_RESULTS:
+            self._results.popitem(last=False)
+
+    async def _compile(self, draft: PrankDraft, digest: str) -> CompiledPrank:
+        target = self._output_dir / digest
+        existing = await asyncio.to_thread(self._load, target, digest)
+        if existing is not None:
+            return existing
+
+        package = build_package(draft)
+        lines = script_lines(package)
+        tts = self._tts or create_tts_engine()
+        audio = [await tts.synthesize(line) for line in lines]
+        names = [f"line_{i:02d}.{tts.extension}" for i in range(len(audio))]
+
+        await asyncio.to_thread(self._write, target, package, lines, names, audio)
+        logger.info("PrankCompiler: compiled digest=%s lines=%d", digest, len(lines))
+        return self._result(digest, package, lines, names)
+
+    def _result(self, digest: str, package: PrankPackage, lines: list[str], names: list[str]) -> CompiledPrank:
+        return CompiledPrank(
+            digest=digest,
+            package=package,
+            script_lines=tuple(lines),
+            audio_urls=tuple(f"{self._url_prefix}/{digest}/{name}" for name in names),
+        )
+
+    def _load(self, target: Path, digest: str) -> Optional[CompiledPrank]:
+        marker = target / _PACKAGE_FILE
+        if not marker.exists():
+            return None
+        data = json.loads(marker.read_text(encoding="utf-8"))
+        return self._result(
+            digest, PrankPackage.model_validate(data["package"]), data["script_lines"], data["audio_files"]
+        )
+
+    @staticmethod
+    def _write(
+        target: Path, package: PrankPackage, lines: list[str], names: list[str], audio: list[bytes]
+    ) -> None:
+        target.mkdir(parents=True, exist_ok=True)
+        for name, data in zip(names, audio):
+            (target / name).write_bytes(data)
+        marker = {
+            "package": package.model_dump(mode="json"),
+            "script_lines": lines,
+            "audio_files": names,
+        }
+        tmp = target / f"{_PACKAGE_FILE}.tmp"
+        tmp.write_text(json.dumps(marker, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(target / _PACKAGE_FILE)
+
+
+# Module-level singleton — same pattern as PrankOrchestrator._session_locks
+prank_compiler = PrankCompiler(PRANK_COMPILED_DIR, PRANK_COMPILED_URL_PREFIX)
@@ -7,6 +7,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.prank_session import PrankSession, PrankSessionState
 from app.models.user import User
+from app.principal_cache import principal_cache
+from app.services.change_bus import CHANNEL_PRANK_SESSION, CHANNEL_USER, change_bus
+from app.services.session_state_notifier import session_state_notifier
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +42,14 @@ class PrankSessionService:
         await self.session.refresh(prank_session)
         return prank_session
 
+    async def _publish_state(self, session: PrankSession) -> None:
+        """Tell other workers the session moved (delivered on commit)."""
+        await change_bus.publish(
+            self.session,
+            CHANNEL_PRANK_SESSION,
+            {"id": str(session.id), "s": session.state.value},
+        )
+
     async def get_session(self, session_id: UUID) -> PrankSession:
         result = await self.session.execute(
             select(PrankSession).where(PrankSession.id == session_id)
@@ -85,8 +96,10 @@ class PrankSessionService:
                 )
 
         session.state = new_state
+        await self._publish_state(session)
         await self.session.commit()
         await self.session.refresh(session)
+        session_state_notifier.notify(session.id)
 
     async def charge_and_transition_to_bridged(self, session: PrankSession) -> bool:
         """Atomically charge 1 credit and transition to BRIDGED.
@@ -108,14 +121,20 @@ class PrankSessionService:
             user = await self.session.get(User, session.user_id)
             if user.credits < 1:
                 session.state = PrankSessionState.FAILED
+                await self._publish_state(session)
                 await self.session.commit()
+                session_state_notifier.notify(session.id)
                 return False
             user.credits -= 1
             session.charged = True
+            await change_bus.publish(self.session, CHANNEL_USER, {"u": str(user.id)})
 
         session.state = PrankSessionState.BRIDGED
+        await self._publish_state(session)
         await self.session.commit()
+        principal_cache.invalidate_user(session.user_id)
         await self.session.refresh(session)
+        session_state_notifier.notify(session.id)
         return True
 
     async def set_call_control_id(
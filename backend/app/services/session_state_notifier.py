@@ -0,0 +1,58 @@
+"""
+In-process change notification for prank session state.
+
+GET /pranks/{id}?wait_for_change_from=<state> parks on listen() until
+PrankSessionService moves the session to a new state and calls notify().
+Waiters register *before* reading the row so a transition that lands between
+the read and the wait is never missed.
+
+Transitions made by other workers arrive through the change bus and wake
+local waiters the same way.
+"""
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+from uuid import UUID
+
+from app.services.change_bus import CHANNEL_PRANK_SESSION, change_bus
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStateNotifier:
+    def __init__(self) -> None:
+        self._waiters: dict[UUID, set[asyncio.Event]] = {}
+
+    @contextmanager
+    def listen(self, session_id: UUID) -> Iterator[asyncio.Event]:
+        """Register a waiter for session_id; the yielded event is set on the next change."""
+        event = asyncio.Event()
+        self._waiters.setdefault(session_id, set()).add(event)
+        try:
+            yield event
+        finally:
+            waiters = self._waiters.get(session_id)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[session_id]
+
+    def notify(self, session_id: UUID) -> None:
+        waiters = self._waiters.get(session_id)
+        if not waiters:
+            return
+        logger.debug("SessionStateNotifier: waking %d waiter(s) for session %s", len(waiters), session_id)
+        for event in waiters:
+            event.set()
+
+
+# Module-level singleton — same pattern as PrankOrchestrator._session_locks
+session_state_notifier = SessionStateNotifier()
+
+
+def _on_remote_state_change(payload: dict) -> None:
+    session_state_notifier.notify(UUID(payload["id"]))
+
+
+change_bus.subscribe(CHANNEL_PRANK_SESSION, _on_remote_state_change)
@@ -0,0 +1,68 @@
+"""
+Text-to-speech for pre-rendered prank audio.
+
+  TTSEngine.synthesize(text) → bytes   one complete audio file
+  TTSEngine.extension                  file extension for that format
+
+TTS_PROVIDER selects the engine.  Only the local stub exists so far: it
+renders a deterministic WAV whose length follows the text, which exercises
+compilation, caching and playback URLs end to end without a TTS vendor.
+"""
+import array
+import asyncio
+import io
+import logging
+import math
+import os
+import sys
+import wave
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+TTS_PROVIDER = os.environ.get("TTS_PROVIDER", "stub").strip().lower() or "stub"
+
+
+class TTSEngine(ABC):
+    extension: str
+
+    @abstractmethod
+    async def synthesize(self, text: str) -> bytes:
+        ...
+
+
+class StubTTS(TTSEngine):
+    """A quiet 440 Hz tone, ~60ms per character (0.5–15s), 16 kHz mono PCM."""
+
+    extension = "wav"
+
+    _SAMPLE_RATE = 16000
+    _SECONDS_PER_CHAR = 0.06
+    _MIN_SECONDS = 0.5
+    _MAX_SECONDS = 15.0
+    _AMPLITUDE = 0.1 * 32767
+
+    async def synthesize(self, text: str) -> bytes:
+        return await asyncio.to_thread(self._render, text)
+
+    def _render(self, text: str) -> bytes:
+        seconds = min(self._MAX_SECONDS, max(self._MIN_SECONDS, len(text) * self._SECONDS_PER_CHAR))
+        n = int(seconds * self._SAMPLE_RATE)
+        step = 2 * math.pi * 440 / self._SAMPLE_RATE
+        samples = array.array("h", (int(self._AMPLITUDE * math.sin(i * step)) for i in range(n)))
+        if sys.byteorder == "big":
+            samples.byteswap()   # WAV PCM is little-endian
+
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(self._SAMPLE_RATE)
+            out.writeframes(samples.tobytes())
+        return buf.getvalue()
+
+
+def create_tts_engine(name: str = TTS_PROVIDER) -> TTSEngine:
+    if name == "stub":
+        return StubTTS()
+    raise ValueError(f"Unknown TTS_PROVIDER: {name!r} (expected 'stub')")
@@ -0,0 +1,152 @@
+"""
+Batched, asynchronous writer for the authoring_turn_metrics table.
+
+The router calls record_turn() when a turn finishes.  It never awaits the
+database: the row goes into a bounded in-memory queue, and a background task
+(started and stopped by the app lifespan) drains it into multi-row INSERTs —
+every AUTHORING_METRICS_FLUSH_SECONDS, or sooner once
+AUTHORING_METRICS_BATCH_SIZE rows are waiting.
+
+Telemetry is best-effort: when the queue is full new rows are dropped and
+counted, and a batch whose INSERT fails is logged and discarded rather than
+retried.  stop() flushes whatever is still queued.
+"""
+import asyncio
+import logging
+import os
+import uuid
+from typing import Any, Callable, Optional
+
+from sqlalchemy import insert
+
+from app.database import SessionLocal
+from app.models.authoring_turn_metric import AuthoringTurnMetric
+from app.services.authoring_metrics import TurnTiming
+
+logger = logging.getLogger(__name__)
+
+AUTHORING_METRICS_ENABLED = os.environ.get("AUTHORING_METRICS_ENABLED", "1") == "1"
+AUTHORING_METRICS_BATCH_SIZE = int(os.environ.get("AUTHORING_METRICS_BATCH_SIZE", "200"))
+AUTHORING_METRICS_FLUSH_SECONDS = float(os.environ.get("AUTHORING_METRICS_FLUSH_SECONDS", "2"))
+AUTHORING_METRICS_QUEUE_MAX = int(os.environ.get("AUTHORING_METRICS_QUEUE_MAX", "10000"))
+
+
+def turn_metric_row(
+    session_id: str, timing: TurnTiming, *, streamed: bool = False, failed: bool = False
+) -> dict[str, Any]:
+    """Column values for one AuthoringTurnMetric, from the turn's TurnTiming."""
+    return {
+        "session_id": uuid.UUID(session_id),
+        "status": timing.status or "unknown",
+        "model": timing.model,
+        "tier": timing.tier,
+        "model_calls": timing.model_calls,
+        "prompt_tokens": timing.prompt_tokens,
+        "cached_tokens": timing.cached_tokens,
+        "completion_tokens": timing.completion_tokens,
+        "model_ms": round(timing.model_ms, 1),
+        "backend_ms": round(timing.backend_ms, 1),
+        "parse_failures": timing.parse_failures,
+        "handoff_overridden": timing.handoff_overridden,
+        "cache_hit": timing.cache_hit,
+        "streamed": streamed,
+        "failed": failed,
+    }
+
+
+class TurnMetricsWriter:
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        flush_seconds: float,
+        max_queue: int,
+        session_factory: Callable = SessionLocal,
+        enabled: bool = True,
+    ) -> None:
+        self._batch_size = batch_size
+        self._flush_seconds = flush_seconds
+        self._session_factory = session_factory
+        self._enabled = enabled
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._unflushed: list[dict[str, Any]] = []   # batch in hand when the task was cancelled
+        self.dropped = 0
+
+    def record_turn(
+        self, session_id: str, timing: TurnTiming, *, streamed: bool = False, failed: bool = False
+    ) -> None:
+        """Queue one turn's row; never blocks and never raises."""
+        if not self._enabled:
+            return
+        try:
+            row = turn_metric_row(session_id, timing, streamed=streamed, failed=failed)
+        except ValueError:
+            logger.warning("TurnMetricsWriter: skipping turn with invalid session id %s", session_id)
+            return
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning("TurnMetricsWriter: queue full, %d rows dropped so far", self.dropped)
+
+    async def start(self) -> None:
+        if self._enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and flush everything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        pending, self._unflushed = self._unflushed, []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for i in range(0, len(pending), self._batch_size):
+            await self._flush(pending[i:i + self._batch_size])
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self._flush_seconds
+                while len(batch) < self._batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except TimeoutError:
+                        break
+                await self._flush(batch)
+            except asyncio.CancelledError:
+                # stop() writes it (an interrupted INSERT was never committed)
+                self._unflushed = batch
+                raise
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            async with self._session_factory() as db:
+                await db.execute(insert(AuthoringTurnMetric), batch)
+                await db.commit()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("TurnMetricsWriter: dropping batch of %d rows", len(batch))
+            return
+        logger.debug("TurnMetricsWriter: wrote %d rows", len(batch))
+
+
+# Module-level singleton — same pattern as PrankOrchestrator._session_locks
+turn_metrics_writer = TurnMetricsWriter(
+    batch_size=AUTHORING_METRICS_BATCH_SIZE,
+    flush_seconds=AUTHORING_METRICS_FLUSH_SECONDS,
+    max_queue=AUTHORING_METRICS_QUEUE_MAX,
+    enabled=AUTHORING_METRICS_ENABLED,
+)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Login-throughput benchmark for bcrypt hashing on vs off the event loop.
+
+Simulates a burst of concurrent /login password checks inside one event
+loop while a heartbeat task ticks every 10ms (standing in for webhooks and
+authoring turns sharing the worker).  Reports login throughput and how late
+the heartbeat ran — the event-loop stall every other request would feel.
+
+No backend or database needed; runs app.auth in-process.
+
+Usage:
+    python scripts/bench_login.py
+    python scripts/bench_login.py --logins 32 --rounds 12
+    python scripts/bench_login.py --mode offloaded
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("JWT_SECRET", "bench")
+
+_HEARTBEAT_INTERVAL_SECONDS = 0.01
+
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + _HEARTBEAT_INTERVAL_SECONDS
+        await asyncio.sleep(_HEARTBEAT_INTERVAL_SECONDS)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def _run(mode: str, logins: int, hashed: str, password: str) -> dict:
+    from app import auth
+
+    async def inline_login() -> bool:
+        # Pre-change behaviour: synchronous bcrypt inside the async handler
+        return auth.verify_password(password, hashed)
+
+    async def offloaded_login() -> bool:
+        return await auth.verify_password_async(password, hashed)
+
+    login = inline_login if mode == "inline" else offloaded_login
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+    await asyncio.sleep(_HEARTBEAT_INTERVAL_SECONDS * 3)  # settle
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await heartbeat
+    assert all(results), "password verification failed"
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "logins_per_s": logins / elapsed,
+        "loop_lag_p50_ms": statistics.median(lags_ms),
+        "loop_lag_max_ms": lags_ms[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bcrypt login throughput / event-loop stall benchmark")
+    parser.add_argument("--logins", type=int, default=16, help="concurrent logins in the burst")
+    parser.add_argument("--rounds", type=int, default=None, help="bcrypt cost (default: BCRYPT_ROUNDS)")
+    parser.add_argument("--threads", type=int, default=None, help="bcrypt pool size (default: BCRYPT_MAX_THREADS)")
+    parser.add_argument("--mode", choices=["both", "inline", "offloaded"], default="both")
+    args = parser.parse_args()
+
+    if args.rounds is not None:
+        os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    if args.threads is not None:
+        os.environ["BCRYPT_MAX_THREADS"] = str(args.threads)
+
+    from app import auth
+
+    password = "correct horse battery staple"
+    hashed = auth.hash_password(password)
+    modes = ["inline", "offloaded"] if args.mode == "both" else [args.mode]
+
+    print(f"\nbcrypt cost={auth.BCRYPT_ROUNDS}  pool threads={auth.BCRYPT_MAX_THREADS}  burst={args.logins} logins")
+    print(f"{'mode':<10} {'elapsed':>9} {'logins/s':>9} {'loop lag p50':>13} {'loop lag max':>13}")
+    for mode in modes:
+        r = asyncio.run(_run(mode, args.logins, hashed, password))
+        print(
+            f"{r['mode']:<10} {r['elapsed_s']:>8.2f}s {r['logins_per_s']:>9.1f} "
+            f"{r['loop_lag_p50_ms']:>11.1f}ms {r['loop_lag_max_ms']:>11.1f}ms"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Memory and hydration cost of a session's message history: one Pydantic
+AuthoringMessage per message vs the array-backed MessageLog.
+
+Measures, for a session of --messages messages:
+  - resident memory of the history (tracemalloc, after a GC)
+  - hydrating it from a JSON message list, the format of the
+    authoring_drafts.messages_json column (replaced by authoring_messages
+    rows in migration 0006)
+  - serialising it back to that JSON
+
+No backend, model or database needed; runs the schemas in-process.
+
+Usage:
+    python scripts/bench_message_log.py
+    python scripts/bench_message_log.py --messages 100 --iterations 500
+"""
+
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic import TypeAdapter
+
+from app.schemas.prank_authoring import AuthoringMessage, MessageLog, MessageRole
+
+_MessageList = TypeAdapter(list[AuthoringMessage])
+# Plain rows — pydantic-core encodes the datetimes exactly as for AuthoringMessage
+_MessageRows = TypeAdapter(list[dict[str, Any]])
+
+
+def _log_from_json(raw: str) -> MessageLog:
+    log = MessageLog()
+    for item in json.loads(raw):
+        log.add(MessageRole(item["role"]), item["content"], datetime.fromisoformat(item["timestamp"]))
+    return log
+
+
+def _log_to_json(log: MessageLog) -> str:
+    return _MessageRows.dump_json([
+        {"role": log.role_at(i).value, "content": log.content_at(i), "timestamp": log.timestamp_at(i)}
+        for i in range(len(log))
+    ]).decode()
+
+
+def _messages_json(message_count: int) -> str:
+    start = datetime.now(timezone.utc)
+    messages = [
+        AuthoringMessage(
+            role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+            content=f"Съобщение номер {i} — искам майтап с куриер, който се обажда за пратка",
+            timestamp=start + timedelta(seconds=i * 7),
+        )
+        for i in range(message_count)
+    ]
+    return _MessageList.dump_json(messages).decode()
+
+
+def _resident_bytes(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return after - before
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    fn()  # warm up (schema/serializer caches)
+    best = min(timeit.repeat(fn, number=iterations, repeat=5))
+    return best / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pydantic message list vs MessageLog")
+    parser.add_argument("--messages", type=int, default=200, help="messages in the session log")
+    parser.add_argument("--iterations", type=int, default=200, help="calls per timing run")
+    args = parser.parse_args()
+
+    raw = _messages_json(args.messages)
+    models = _MessageList.validate_json(raw)
+    log = _log_from_json(raw)
+    assert log == models and _log_to_json(log) == raw
+
+    rows = [
+        (
+            "memory",
+            _resident_bytes(lambda: _MessageList.validate_json(raw)),
+            _resident_bytes(lambda: _log_from_json(raw)),
+            "B",
+        ),
+        (
+            "hydrate",
+            _per_call_us(lambda: _MessageList.validate_json(raw), args.iterations),
+            _per_call_us(lambda: _log_from_json(raw), args.iterations),
+            "us",
+        ),
+        (
+            "persist",
+            _per_call_us(lambda: _MessageList.dump_json(models), args.iterations),
+            _per_call_us(lambda: _log_to_json(log), args.iterations),
+            "us",
+        ),
+    ]
+
+    print(f"\nmessages={args.messages}  iterations={args.iterations}  (timings: best of 5)")
+    print(f"{'path':<9} {'pydantic list':>15} {'MessageLog':>13} {'ratio':>7}")
+    for name, before, after, unit in rows:
+        print(f"{name:<9} {before:>12.0f}{unit:>3} {after:>10.0f}{unit:>3} {before / after:>6.2f}x")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Per-turn Pydantic CPU benchmark: v1 compatibility shims vs native v2 APIs.
+
+Times the model (de)serialisation an authoring turn performs — parsing the
+model's JSON reply, sanitising and merging it into the draft, rendering the
+draft into the prompt, and writing the session back to authoring_drafts —
+once with the pre-migration calls (.parse_raw / .dict / .json / .copy) and
+once with the current ones (model_validate_json / model_dump(_json) /
+model_copy / a cached list[AuthoringMessage] TypeAdapter).  Loading a session
+from the database (restart recovery) is timed separately.
+
+No backend, model or database needed; runs the schemas in-process.
+
+Usage:
+    python scripts/bench_pydantic_turn.py
+    python scripts/bench_pydantic_turn.py --messages 40 --iterations 5000
+"""
+
+import argparse
+import json
+import sys
+import timeit
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic import TypeAdapter
+
+from app.schemas.prank_authoring import AuthoringMessage
+
+# Building a TypeAdapter compiles a core schema, so build it once, not per call
+_MessageList = TypeAdapter(list[AuthoringMessage])
+
+
+def _fixtures(message_count: int):
+    from app.schemas.prank_authoring import (
+        AuthoringLLMResult,
+        AuthoringMessage,
+        Caller,
+        DraftUpdate,
+        MessageRole,
+        PrankDraft,
+        PrankType,
+        Progression,
+        ProgressionUpdate,
+        TargetEffect,
+    )
+
+    draft = PrankDraft(
+        prank_type=PrankType.MISTAKEN_CONTINUATION,
+        caller=Caller(persona="объркан куриер", tone="упорит"),
+        target_effect=TargetEffect(intended_emotion="леко объркване"),
+        progression=Progression(opening="Куриерът пита за пратката от вчера"),
+        context_notes="Приятелят ми чака колет от седмица",
+    )
+    update = DraftUpdate(
+        progression=ProgressionUpdate(
+            escalation="Настоява, че пратката е платена",
+            resolution="Признава, че е сбъркал адреса",
+        ),
+        prank_title="Обърканият куриер",
+    )
+    reply = AuthoringLLMResult(
+        reply="Супер, продължаваме. Има ли теми, които да избягваме?",
+        draft_update=update,
+        missing_fields=[],
+        is_draft_complete=True,
+        ready_for_handoff=True,
+    ).model_dump_json()
+    now = datetime.now(timezone.utc)
+    messages = [
+        AuthoringMessage(
+            role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+            content=f"Съобщение номер {i} — искам майтап с куриер, който се обажда за пратка",
+            timestamp=now,
+        )
+        for i in range(message_count)
+    ]
+    return draft, reply, messages
+
+
+def _legacy_turn(draft, reply, messages):
+    from app.schemas.prank_authoring import AuthoringLLMResult
+
+    result = AuthoringLLMResult.parse_raw(reply)
+    result = result.copy(update={"ready_for_handoff": False})
+    sub = {
+        k: v for k, v in result.draft_update.progression.dict(exclude_none=True).items()
+        if getattr(draft.progression, k) is None
+    }
+    merged = draft.copy(update={
+        "progression": draft.progression.copy(update=sub),
+        "prank_title": result.draft_update.prank_title,
+    })
+    json.dumps(merged.dict(), indent=2, default=str)
+    merged.json()
+    json.dumps([m.dict() for m in messages], default=str)
+
+
+def _current_turn(draft, reply, messages):
+    from app.schemas.prank_authoring import AuthoringLLMResult
+
+    result = AuthoringLLMResult.model_validate_json(reply)
+    result = result.model_copy(update={"ready_for_handoff": False})
+    sub = {
+        k: v for k, v in result.draft_update.progression.model_dump(exclude_none=True).items()
+        if getattr(draft.progression, k) is None
+    }
+    merged = draft.model_copy(update={
+        "progression": draft.progression.model_copy(update=sub),
+        "prank_title": result.draft_update.prank_title,
+    })
+    merged.model_dump_json(indent=2)
+    merged.model_dump_json()
+    _MessageList.dump_json(messages)
+
+
+def _legacy_load(draft_json, messages_json):
+    from app.schemas.prank_authoring import AuthoringMessage, PrankDraft
+
+    PrankDraft.parse_raw(draft_json)
+    [AuthoringMessage(**m) for m in json.loads(messages_json)]
+
+
+def _current_load(draft_json, messages_json):
+    from app.schemas.prank_authoring import PrankDraft
+
+    PrankDraft.model_validate_json(draft_json)
+    _MessageList.validate_json(messages_json)
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    fn()  # warm up (schema/serializer caches)
+    best = min(timeit.repeat(fn, number=iterations, repeat=5))
+    return best / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pydantic v1-shim vs v2 per-turn CPU benchmark")
+    parser.add_argument("--messages", type=int, default=20, help="messages in the session log")
+    parser.add_argument("--iterations", type=int, default=2000, help="calls per timing run")
+    args = parser.parse_args()
+
+    # The v1 shims emit a DeprecationWarning per call; don't time the warning machinery
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    draft, reply, messages = _fixtures(args.messages)
+    draft_json = draft.model_dump_json()
+    messages_json = json.dumps([m.model_dump(mode="json") for m in messages])
+
+    rows = [
+        ("turn", lambda: _legacy_turn(draft, reply, messages), lambda: _current_turn(draft, reply, messages)),
+        ("db load", lambda: _legacy_load(draft_json, messages_json), lambda: _current_load(draft_json, messages_json)),
+    ]
+
+    print(f"\nmessages={args.messages}  iterations={args.iterations}  (best of 5)")
+    print(f"{'path':<10} {'v1 shims':>11} {'v2 native':>11} {'speed-up':>9}")
+    for name, legacy, current in rows:
+        before = _per_call_us(legacy, args.iterations)
+        after = _per_call_us(current, args.iterations)
+        print(f"{name:<10} {before:>9.1f}us {after:>9.1f}us {before / after:>8.2f}x")
+    print()
+
+
+if __name__ == "__main__":
+    main()
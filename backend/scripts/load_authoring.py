@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Load test for the System 1 authoring API.
+
+Drives complete authoring sessions (register → create session → scripted
+turns) from many concurrent virtual users against a running backend, and
+reports turn latency split into model time and backend overhead using the
+Server-Timing header of POST /authoring/sessions/{id}/messages.
+
+Start the backend with the offline model stub so no tokens are spent and
+model latency is a known distribution:
+
+    AUTHORING_PROVIDER=stub AUTHORING_STUB_LATENCY_MEDIAN_MS=800 \\
+        uvicorn app.main:app --port 8000
+
+Usage:
+    python scripts/load_authoring.py
+    python scripts/load_authoring.py --users 50 --sessions 2
+    python scripts/load_authoring.py --base-url http://localhost:8000 --scenario-file evals/authoring_scenarios.json
+
+Each virtual user registers its own account (per-user session rate limits
+apply: at most 10 sessions per user per hour).  The first-turn response cache
+answers repeated openers without a model call; run the backend with
+AUTHORING_RESPONSE_CACHE_ENABLED=0 to measure uncached turns only.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+DEFAULT_SCENARIO_FILE = Path(__file__).parent.parent / "evals" / "authoring_scenarios.json"
+
+
+def _parse_server_timing(header: str) -> dict[str, float]:
+    timings = {}
+    for metric in header.split(","):
+        name, _, params = metric.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "dur":
+                timings[name] = float(value)
+    return timings
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, int(round(q * len(ordered))) - 1)] if ordered else 0.0
+
+
+async def _virtual_user(
+    client: httpx.AsyncClient,
+    user_no: int,
+    scenarios: list[list[str]],
+    sessions: int,
+    samples: list[dict],
+    errors: list[str],
+) -> None:
+    email = f"load-{uuid.uuid4().hex[:12]}@example.com"
+    resp = await client.post("/register", json={
+        "email": email, "password": "load-test-password", "phone_number": "+359888000000",
+    })
+    if resp.status_code != 201:
+        errors.append(f"register: {resp.status_code}")
+        return
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+    for n in range(sessions):
+        turns = scenarios[(user_no + n) % len(scenarios)]
+        resp = await client.post("/authoring/sessions", headers=headers)
+        if resp.status_code != 201:
+            errors.append(f"create session: {resp.status_code}")
+            return
+        session_id = resp.json()["session"]["id"]
+
+        for content in turns:
+            started = time.perf_counter()
+            resp = await client.post(
+                f"/authoring/sessions/{session_id}/messages",
+                headers=headers,
+                json={"content": content},
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if resp.status_code != 200:
+                errors.append(f"message: {resp.status_code}")
+                break
+            timing = _parse_server_timing(resp.headers.get("Server-Timing", ""))
+            samples.append({
+                "client_ms": elapsed_ms,
+                "model_ms": timing.get("model", 0.0),
+                "backend_ms": timing.get("backend", 0.0),
+                "status": resp.json()["status"],
+            })
+
+
+def _report(samples: list[dict], errors: list[str], wall_s: float) -> None:
+    print(f"\nturns={len(samples)}  errors={len(errors)}  wall={wall_s:.1f}s  "
+          f"throughput={len(samples) / wall_s:.1f} turns/s")
+    if samples:
+        print(f"{'metric':<12} {'p50':>9} {'p95':>9} {'p99':>9} {'mean':>9}")
+        for key in ("client_ms", "model_ms", "backend_ms"):
+            values = [s[key] for s in samples]
+            print(
+                f"{key:<12} {_percentile(values, 0.5):>8.1f} {_percentile(values, 0.95):>8.1f} "
+                f"{_percentile(values, 0.99):>8.1f} {statistics.fmean(values):>8.1f}"
+            )
+        ready = sum(1 for s in samples if s["status"] == "ready")
+        print(f"turns that ended READY: {ready}")
+    if errors:
+        print("first errors:", ", ".join(errors[:5]))
+    print()
+
+
+async def _run(args) -> None:
+    data = json.loads(Path(args.scenario_file).read_text(encoding="utf-8"))
+    scenarios = [s["turns"] for s in data["scenarios"] if s.get("mode") == "allowed" and s.get("turns")]
+    if not scenarios:
+        sys.exit("no allowed scenarios with turns in the scenario file")
+
+    samples: list[dict] = []
+    errors: list[str] = []
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            _virtual_user(client, i, scenarios, args.sessions, samples, errors)
+            for i in range(args.users)
+        ))
+        wall_s = time.perf_counter() - started
+    _report(samples, errors, wall_s)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="System 1 authoring load test")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--scenario-file", default=str(DEFAULT_SCENARIO_FILE))
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--sessions", type=int, default=1, help="sessions per user (max 10)")
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Token cost of each authoring prompt version on the eval scenarios.
+
+Replays every scenario's scripted turns through the real engine (context
+building, history compaction, draft merge) with the offline stub provider
+filling the draft, and counts, for every turn, the tokens of the system
+prompt and of the user payload each prompt version would send.
+
+No backend, model or database needed.  Token counts use the
+authoring_history heuristic (the estimate the engine itself budgets with).
+
+Usage:
+    python scripts/measure_payload_tokens.py
+    python scripts/measure_payload_tokens.py --versions 2 3 --mode all
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ["AUTHORING_RESPONSE_CACHE_ENABLED"] = "0"   # every turn reaches the provider
+os.environ["PRANK_COMPILED_DIR"] = tempfile.mkdtemp(prefix="payload-tokens-")
+
+DEFAULT_SCENARIO_FILE = Path(__file__).parent.parent / "evals" / "authoring_scenarios.json"
+
+
+def _measuring_provider(versions: list[str], totals: dict[str, list[tuple[int, int]]]):
+    from app.services.authoring_history import count_tokens
+    from app.services.authoring_prompts import build_user_payload, system_prompt_tokens
+    from app.services.authoring_providers import StubProvider
+
+    class _Measuring(StubProvider):
+        async def complete(self, ctx, messages, *, model, cache_key):
+            for version in versions:
+                totals[version].append((
+                    system_prompt_tokens(ctx.current_status, ctx.missing_fields, version),
+                    count_tokens(build_user_payload(ctx, version)),
+                ))
+            return await super().complete(ctx, messages, model=model, cache_key=cache_key)
+
+    return _Measuring(latency_median_ms=0.01, latency_sigma=0.0)
+
+
+async def _replay(scenarios: list[dict], provider) -> None:
+    from app.services import authoring_engine
+    from app.services.authoring_store import AuthoringStore
+
+    authoring_engine._provider = provider
+    store = AuthoringStore()
+    for scenario in scenarios:
+        session = store.create_session()
+        for content in scenario["turns"]:
+            await authoring_engine.process_turn(store, session.id, content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Authoring prompt token comparison")
+    parser.add_argument("--scenario-file", default=str(DEFAULT_SCENARIO_FILE))
+    parser.add_argument("--versions", nargs="+", default=["2", "3", "4"], help="prompt versions to compare")
+    parser.add_argument("--mode", choices=["allowed", "disallowed", "all"], default="all")
+    args = parser.parse_args()
+
+    data = json.loads(Path(args.scenario_file).read_text(encoding="utf-8"))
+    scenarios = [
+        s for s in data["scenarios"]
+        if s.get("turns") and (args.mode == "all" or s.get("mode") == args.mode)
+    ]
+    totals: dict[str, list[tuple[int, int]]] = {v: [] for v in args.versions}
+    asyncio.run(_replay(scenarios, _measuring_provider(args.versions, totals)))
+
+    turns = len(totals[args.versions[0]])
+    baseline = sum(system + payload for system, payload in totals[args.versions[0]])
+    print(f"\nscenarios={len(scenarios)}  turns={turns}  tokens: heuristic  (per turn)")
+    print(f"{'version':<9} {'system':>9} {'payload':>9} {'total':>9} {'vs ' + args.versions[0]:>8}")
+    for version in args.versions:
+        system = sum(s for s, _ in totals[version])
+        payload = sum(p for _, p in totals[version])
+        print(
+            f"{version:<9} {system / turns:>9.1f} {payload / turns:>9.1f} {(system + payload) / turns:>9.1f} "
+            f"{(system + payload) / baseline - 1:>+8.1%}"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ asyncpg or a live database at test time.
 """
 import os
 import sys
+import tempfile
 from unittest.mock import MagicMock
 
 from sqlalchemy.orm import DeclarativeBase
@@ -17,6 +18,8 @@ os.environ.setdefault("MAX_CALL_DURATION_SECONDS", "1")
 os.environ.setdefault("TELNYX_API_KEY", "test_key")
 os.environ.setdefault("TELNYX_CONNECTION_ID", "test_conn")
 os.environ.setdefault("TELNYX_NUMBER", "+15550000000")
+os.environ.setdefault("JWT_SECRET", "test_secret")
+os.environ.setdefault("PRANK_COMPILED_DIR", tempfile.mkdtemp(prefix="compiled-"))
 
 
 # --- Stub app.database ---------------------------------------------------
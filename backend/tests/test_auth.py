@@ -0,0 +1,49 @@
+"""Unit tests for password hashing offload and cost upgrades."""
+import bcrypt
+import pytest
+
+from app import auth
+
+
+@pytest.fixture(autouse=True)
+def _cheap_rounds(monkeypatch):
+    monkeypatch.setattr(auth, "BCRYPT_ROUNDS", 4)
+
+
+def test_hash_uses_configured_cost():
+    assert auth.hash_password("pw").split("$")[2] == "04"
+
+
+def test_needs_rehash_when_cost_differs():
+    old = bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=5)).decode()
+    assert auth.needs_rehash(old)
+    assert not auth.needs_rehash(auth.hash_password("pw"))
+
+
+def test_needs_rehash_ignores_unknown_formats():
+    assert not auth.needs_rehash("not-a-bcrypt-hash")
+
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_roundtrip():
+    hashed = await auth.hash_password_async("secret")
+    assert await auth.verify_password_async("secret", hashed)
+    assert not await auth.verify_password_async("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_async_variants_run_off_the_event_loop_thread(monkeypatch):
+    import threading
+
+    seen: list[str] = []
+    original = auth.verify_password
+
+    def _spy(password, hashed):
+        seen.append(threading.current_thread().name)
+        return original(password, hashed)
+
+    hashed = auth.hash_password("secret")
+    monkeypatch.setattr(auth, "verify_password", _spy)
+    await auth.verify_password_async("secret", hashed)
+
+    assert seen and seen[0].startswith("bcrypt")
@@ -6,17 +6,25 @@ partial nested objects like {"caller": {"persona": "X", "tone": null}},
 which broke validation against the original non-optional Caller model.
 """
 
+import json
+from datetime import datetime, timezone
+
 import pytest
 from pydantic import ValidationError
 
 from app.schemas.prank_authoring import (
     AuthoringLLMResult,
+    AuthoringMessage,
+    AuthoringSession,
+    AuthoringStatus,
     CallerUpdate,
     Caller,
     Constraints,
     ConstraintsUpdate,
     DraftField,
     DraftUpdate,
+    MessageLog,
+    MessageRole,
     PrankDraft,
     PrankType,
     Progression,
@@ -229,7 +237,7 @@ class TestRealisticLivePayload:
             "next_question": "Who should the caller pretend to be?",
             "notes": "Prank type inferred as Chaos. Need caller details next."
         }"""
-        result = AuthoringLLMResult.parse_raw(raw_json)
+        result = AuthoringLLMResult.model_validate_json(raw_json)
         assert result.reply.startswith("Got it!")
         assert result.draft_update.prank_type == PrankType.CHAOS
         assert result.draft_update.caller is not None
@@ -253,3 +261,41 @@ class TestRealisticLivePayload:
         assert result.caller is None       # partial with no subfields — not promoted
         assert result.target_effect is None  # no emotion — not promoted
         assert result.context_notes == "User wants a chaos-style prank"
+
+
+# ---------------------------------------------------------------------------
+# MessageLog: compact in-memory history with the list[AuthoringMessage] shape
+# ---------------------------------------------------------------------------
+
+class TestMessageLog:
+    MESSAGES = [
+        AuthoringMessage(role=MessageRole.USER, content="Искам майтап", timestamp=datetime(2025, 5, 1, 12, 0, tzinfo=timezone.utc)),
+        AuthoringMessage(role=MessageRole.ASSISTANT, content="Какъв?", timestamp=datetime(2025, 5, 1, 12, 0, 3, tzinfo=timezone.utc)),
+    ]
+
+    def test_messages_materialise_on_access(self):
+        log = MessageLog(self.MESSAGES)
+        assert log[-1] == self.MESSAGES[-1] and log[:1] == self.MESSAGES[:1]
+        assert (log.role_at(0), log.content_at(1)) == (MessageRole.USER, "Какъв?")
+        assert log.count_role(MessageRole.USER) == 1
+        with pytest.raises(IndexError):
+            log[2]
+
+    def test_session_keeps_the_log_and_serialises_a_list(self):
+        log = MessageLog(self.MESSAGES)
+        session = AuthoringSession(
+            id="s", created_at=self.MESSAGES[0].timestamp, updated_at=self.MESSAGES[0].timestamp,
+            status=AuthoringStatus.COLLECTING_INFO, draft=PrankDraft(), messages=log,
+        )
+        assert session.messages is log
+        dumped = json.loads(session.model_dump_json())["messages"]
+        assert dumped == [m.model_dump(mode="json") for m in self.MESSAGES]
+        assert AuthoringSession.model_validate_json(session.model_dump_json()).messages == log
+
+    def test_unknown_role_is_rejected(self):
+        with pytest.raises(ValidationError):
+            AuthoringSession.model_validate_json(
+                '{"id": "s", "created_at": "2025-05-01T12:00:00Z", "updated_at": "2025-05-01T12:00:00Z",'
+                ' "status": "collecting_info", "draft": {},'
+                ' "messages": [{"role": "narrator", "content": "x", "timestamp": "2025-05-01T12:00:00Z"}]}'
+            )
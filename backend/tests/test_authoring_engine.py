@@ -0,0 +1,503 @@
+"""Unit tests for the async authoring turn pipeline."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.schemas.prank_authoring import (
+    AuthoringLLMResult,
+    AuthoringStatus,
+    Caller,
+    CallerUpdate,
+    DraftUpdate,
+    MessageRole,
+    PrankDraft,
+    PrankType,
+    Progression,
+    TargetEffect,
+)
+from app.services import authoring_engine
+from app.services.authoring_engine import process_turn
+from app.services.authoring_providers import OpenAIProvider
+from app.services.authoring_response_cache import authoring_response_cache
+from app.services.authoring_store import AuthoringStore
+
+
+@pytest.fixture(autouse=True)
+def _empty_response_cache():
+    authoring_response_cache.clear()
+    yield
+    authoring_response_cache.clear()
+
+
+def _result(reply="Кой да звъни?", **draft) -> AuthoringLLMResult:
+    return AuthoringLLMResult(
+        reply=reply,
+        draft_update=DraftUpdate(**draft),
+        missing_fields=[],
+        is_draft_complete=False,
+        ready_for_handoff=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_turn_merges_and_appends_reply():
+    store = AuthoringStore()
+    session = store.create_session()
+    model = AsyncMock(return_value=_result(caller=CallerUpdate(persona="куриер", tone="объркан")))
+
+    with patch("app.services.authoring_engine._call_model", new=model):
+        reply = await process_turn(store, session.id, "искам куриер")
+
+    assert reply == "Кой да звъни?"
+    session = store.get_session(session.id)
+    assert session.draft.caller.persona == "куриер"
+    assert session.status == AuthoringStatus.COLLECTING_INFO
+    assert [m.role for m in session.messages[-2:]] == [MessageRole.USER, MessageRole.ASSISTANT]
+
+
+@pytest.mark.asyncio
+async def test_failed_call_does_not_advance_the_prompted_draft():
+    store = AuthoringStore()
+    session = store.create_session()
+    seen: list = []
+
+    async def _model(ctx, tier, deadline=None):
+        seen.append(ctx)
+        if len(seen) == 2:
+            raise ValueError("model down")
+        return _result(caller=CallerUpdate(persona="куриер", tone="объркан"))
+
+    with patch("app.services.authoring_engine._call_model", new=_model):
+        await process_turn(store, session.id, "искам куриер")
+        with pytest.raises(ValueError):
+            await process_turn(store, session.id, "по-смешно")
+        await process_turn(store, session.id, "по-смешно")
+
+    # Turn 2 showed the courier draft but never answered: turn 3 still diffs
+    # against the draft the model last saw (turn 1's empty one)
+    assert seen[1].current_draft.caller.persona == "куриер"
+    assert seen[2].previous_draft == seen[0].current_draft
+
+
+@pytest.mark.asyncio
+async def test_turns_for_different_sessions_run_concurrently():
+    """A slow model call must not serialise the event loop."""
+    store = AuthoringStore()
+    sessions = [store.create_session() for _ in range(5)]
+
+    async def _slow_model(ctx, tier, deadline=None):
+        await asyncio.sleep(0.2)
+        return _result()
+
+    with patch("app.services.authoring_engine._call_model", new=_slow_model):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(process_turn(store, s.id, "здрасти") for s in sessions))
+        elapsed = loop.time() - start
+
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_call_model_goes_through_provider():
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = _result().model_dump_json()
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=completion)
+
+    store = AuthoringStore()
+    session = store.create_session()
+    ctx = authoring_engine._build_authoring_context(session, "здрасти")
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)):
+        result = await authoring_engine._call_model(ctx)
+
+    assert result.reply == "Кой да звъни?"
+    client.chat.completions.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_call_model_records_cached_token_usage():
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = _result().model_dump_json()
+    completion.usage.prompt_tokens = 1800
+    completion.usage.prompt_tokens_details.cached_tokens = 1536
+    completion.usage.completion_tokens = 90
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=completion)
+
+    store = AuthoringStore()
+    session = store.create_session()
+    ctx = authoring_engine._build_authoring_context(session, "здрасти")
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)), \
+         patch("app.services.authoring_engine.record_turn_usage") as record:
+        await authoring_engine._call_model(ctx)
+
+    kwargs = client.chat.completions.create.await_args.kwargs
+    assert kwargs["extra_body"]["prompt_cache_key"] == f"authoring:{session.id}"
+    usage = record.call_args.args[0]
+    assert (usage.prompt_tokens, usage.cached_tokens, usage.completion_tokens) == (1800, 1536, 90)
+    assert usage.session_id == session.id
+    assert usage.tier == "strong"
+
+
+@pytest.mark.asyncio
+async def test_missing_api_key_fails_clearly(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(authoring_engine, "_provider", None)
+
+    with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+        authoring_engine._get_provider()
+
+
+# ---------------------------------------------------------------------------
+# Streaming turns
+# ---------------------------------------------------------------------------
+
+def _chunked(text: str, size: int):
+    async def _gen(ctx, tier, deadline=None):
+        for i in range(0, len(text), size):
+            yield text[i:i + size]
+    return _gen
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_reply_deltas_then_applies_turn():
+    store = AuthoringStore()
+    session = store.create_session()
+    raw = _result(reply='Хаха, "куриер"\nс колет?', caller=CallerUpdate(persona="куриер", tone="объркан"))
+
+    with patch("app.services.authoring_engine._stream_model", new=_chunked(raw.model_dump_json(), 3)):
+        deltas = [d async for d in authoring_engine.process_turn_stream(store, session.id, "куриер")]
+
+    assert len(deltas) > 1
+    assert "".join(deltas) == 'Хаха, "куриер"\nс колет?'
+    session = store.get_session(session.id)
+    assert session.messages[-1].content == 'Хаха, "куриер"\nс колет?'
+    assert session.draft.caller.persona == "куриер"
+
+
+@pytest.mark.asyncio
+async def test_stream_invalid_json_raises_without_merging():
+    store = AuthoringStore()
+    session = store.create_session()
+
+    with patch("app.services.authoring_engine._stream_model", new=_chunked('{"reply": "hi", "oops"', 4)):
+        with pytest.raises(ValueError, match="invalid AuthoringLLMResult"):
+            async for _ in authoring_engine.process_turn_stream(store, session.id, "здрасти"):
+                pass
+
+    assert store.get_session(session.id).messages[-1].role == MessageRole.USER
+
+
+# ---------------------------------------------------------------------------
+# Deadlines and hedging
+# ---------------------------------------------------------------------------
+
+def _completion_after(delays: list[float]):
+    """A fake completions.create whose n-th call answers after delays[n]."""
+    calls = []
+
+    async def _create(**kwargs):
+        delay = delays[len(calls)]
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        completion = MagicMock()
+        completion.choices = [MagicMock()]
+        completion.choices[0].message.content = _result(reply=f"after {delay}").model_dump_json()
+        return completion
+
+    client = MagicMock()
+    client.chat.completions.create = _create
+    return client, calls
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_fastest_attempt_wins(monkeypatch):
+    monkeypatch.setattr(authoring_engine, "_HEDGE_DELAY_OVERRIDE", "0.05")
+    client, calls = _completion_after([1.0, 0.01])
+    ctx = authoring_engine._build_authoring_context(AuthoringStore().create_session(), "здрасти")
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)), \
+         patch("app.services.authoring_engine.record_turn_usage") as usage, \
+         patch("app.services.authoring_engine.record_attempt_cancelled") as cancelled:
+        result = await authoring_engine._call_model(ctx)
+        await asyncio.sleep(0)   # let the loser observe its cancellation
+
+    assert result.reply == "after 0.01"
+    assert calls == [1.0, 0.01]
+    assert usage.call_args.args[0].attempt == 2
+    assert cancelled.call_args.args[2] == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_call_is_not_hedged(monkeypatch):
+    monkeypatch.setattr(authoring_engine, "_HEDGE_DELAY_OVERRIDE", "0.5")
+    client, calls = _completion_after([0.01])
+    ctx = authoring_engine._build_authoring_context(AuthoringStore().create_session(), "здрасти")
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)):
+        result = await authoring_engine._call_model(ctx)
+
+    assert result.reply == "after 0.01"
+    assert calls == [0.01]
+
+
+@pytest.mark.asyncio
+async def test_call_past_deadline_fails_clearly(monkeypatch):
+    monkeypatch.setattr(authoring_engine, "AUTHORING_TURN_DEADLINE_SECONDS", 0.05)
+    monkeypatch.setattr(authoring_engine, "AUTHORING_HEDGE_ENABLED", False)
+    client, _ = _completion_after([1.0])
+    ctx = authoring_engine._build_authoring_context(AuthoringStore().create_session(), "здрасти")
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)):
+        with pytest.raises(ValueError, match="turn budget"):
+            await authoring_engine._call_model(ctx)
+
+
+def test_hedge_delay_tracks_recent_p95(monkeypatch):
+    monkeypatch.setattr(authoring_engine, "_HEDGE_DELAY_OVERRIDE", "")
+    window = authoring_engine.LatencyWindow(maxlen=100)
+    monkeypatch.setitem(authoring_engine._attempt_latencies, authoring_engine.ModelTier.STRONG, window)
+    assert authoring_engine._hedge_delay() == authoring_engine._HEDGE_DELAY_DEFAULT_SECONDS
+
+    for ms in range(1000, 6000, 50):   # 1.0s … 5.95s
+        window.add(ms)
+    assert authoring_engine._hedge_delay() == pytest.approx(5.7)
+
+
+@pytest.mark.asyncio
+async def test_lost_hedge_does_not_lower_the_hedge_delay(monkeypatch):
+    monkeypatch.setattr(authoring_engine, "_HEDGE_DELAY_OVERRIDE", "")
+    monkeypatch.setattr(authoring_engine, "_HEDGE_DELAY_MIN_SECONDS", 0.0)
+    window = authoring_engine.LatencyWindow(maxlen=100)
+    monkeypatch.setitem(authoring_engine._attempt_latencies, authoring_engine.ModelTier.STRONG, window)
+    for _ in range(20):
+        window.add(30)
+    delay = authoring_engine._hedge_delay()
+    # The primary answers ~15ms after the hedge fires; the hedge is cancelled
+    client, calls = _completion_after([0.045, 1.0])
+    ctx = authoring_engine._build_authoring_context(AuthoringStore().create_session(), "здрасти")
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)):
+        result = await authoring_engine._call_model(ctx)
+        await asyncio.sleep(0)   # let the hedge observe its cancellation
+
+    assert result.reply == "after 0.045" and calls == [0.045, 1.0]
+    assert len(window) == 21 and window.percentile(0.0001) >= 30   # only the primary was recorded
+    assert authoring_engine._hedge_delay() >= delay
+
+
+@pytest.mark.asyncio
+async def test_primary_beaten_by_its_hedge_is_recorded_as_a_lower_bound(monkeypatch):
+    monkeypatch.setattr(authoring_engine, "_HEDGE_DELAY_OVERRIDE", "0.05")
+    window = authoring_engine.LatencyWindow(maxlen=100)
+    monkeypatch.setitem(authoring_engine._attempt_latencies, authoring_engine.ModelTier.STRONG, window)
+    client, _ = _completion_after([1.0, 0.01])
+    ctx = authoring_engine._build_authoring_context(AuthoringStore().create_session(), "здрасти")
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)):
+        await authoring_engine._call_model(ctx)
+
+    # The winning hedge (~10ms) and the primary's lower bound (past the 50ms hedge delay)
+    assert len(window) == 2 and window.percentile(1.0) >= 50
+
+
+def _streaming_client(pieces: list[str], stall_after: int = -1):
+    async def _stream():
+        for i, piece in enumerate(pieces):
+            if i == stall_after:
+                await asyncio.sleep(10)
+            chunk = MagicMock()
+            chunk.usage = None
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = piece
+            yield chunk
+
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=lambda **kwargs: _stream())
+    return client
+
+
+@pytest.mark.asyncio
+async def test_stream_model_yields_chunks_within_deadline():
+    ctx = authoring_engine._build_authoring_context(AuthoringStore().create_session(), "здрасти")
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(_streaming_client(["{", "}"]))):
+        chunks = [c async for c in authoring_engine._stream_model(ctx)]
+
+    assert chunks == ["{", "}"]
+
+
+@pytest.mark.asyncio
+async def test_stalled_stream_hits_deadline(monkeypatch):
+    monkeypatch.setattr(authoring_engine, "AUTHORING_TURN_DEADLINE_SECONDS", 0.05)
+    ctx = authoring_engine._build_authoring_context(AuthoringStore().create_session(), "здрасти")
+    client = _streaming_client(['{"reply": "Зд', 'равей"}'], stall_after=1)
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)):
+        chunks = []
+        with pytest.raises(ValueError, match="turn budget"):
+            async for chunk in authoring_engine._stream_model(ctx):
+                chunks.append(chunk)
+
+    assert chunks == ['{"reply": "Зд']
+
+
+# ---------------------------------------------------------------------------
+# Model routing
+# ---------------------------------------------------------------------------
+
+FAST, STRONG = authoring_engine.ModelTier.FAST, authoring_engine.ModelTier.STRONG
+
+
+@pytest.fixture
+def _fast_tier(monkeypatch):
+    monkeypatch.setenv("OPENAI_MODEL", "strong-model")
+    monkeypatch.setenv("OPENAI_MODEL_FAST", "fast-model")
+
+
+def _ctx(status=AuthoringStatus.COLLECTING_INFO, message="да", **draft):
+    store = AuthoringStore()
+    session = store.create_session()
+    store.update_session(session.id, status=status, draft=PrankDraft(**draft))
+    return authoring_engine._build_authoring_context(store.get_session(session.id), message)
+
+
+_COMPLETE = dict(
+    prank_type=PrankType.CHAOS,
+    caller=Caller(persona="куриер", tone="объркан"),
+    target_effect=TargetEffect(intended_emotion="смях"),
+    progression=Progression(opening="Звъни за колет"),
+)
+
+
+def test_routing_is_off_without_a_fast_model(monkeypatch):
+    monkeypatch.delenv("OPENAI_MODEL_FAST", raising=False)
+    assert authoring_engine._route_tier(_ctx(AuthoringStatus.READY, **_COMPLETE)) == STRONG
+
+
+def test_routing_picks_tier_from_status_fields_and_length(_fast_tier):
+    route = authoring_engine._route_tier
+    assert route(_ctx()) == STRONG                                   # idea generation
+    assert route(_ctx(AuthoringStatus.READY, "по-смешно", **_COMPLETE)) == FAST
+    assert route(_ctx(AuthoringStatus.DRAFTING, "ок", **_COMPLETE)) == FAST
+    assert route(_ctx(AuthoringStatus.COLLECTING_INFO, "без политика", **_COMPLETE)) == FAST
+    assert route(_ctx(AuthoringStatus.READY, "х" * 500, **_COMPLETE)) == STRONG
+
+
+def _tiered_model(results: dict):
+    calls = []
+
+    async def _model(ctx, tier, deadline=None):
+        calls.append(tier)
+        outcome = results[tier]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return _model, calls
+
+
+async def _ready_session_turn(store, model):
+    session = store.create_session()
+    store.update_session(session.id, status=AuthoringStatus.READY, draft=PrankDraft(**_COMPLETE))
+    with patch("app.services.authoring_engine._call_model", new=model), \
+         patch("app.services.authoring_engine.prank_compiler"):
+        return await process_turn(store, session.id, "по-смешно")
+
+
+@pytest.mark.asyncio
+async def test_fast_tier_answers_easy_turn(_fast_tier):
+    model, calls = _tiered_model({FAST: _result(reply="бързо")})
+    assert await _ready_session_turn(AuthoringStore(), model) == "бързо"
+    assert calls == [FAST]
+
+
+@pytest.mark.asyncio
+async def test_invalid_fast_output_escalates_to_strong(_fast_tier):
+    model, calls = _tiered_model({
+        FAST: authoring_engine.InvalidModelOutput("bad json"),
+        STRONG: _result(reply="силно"),
+    })
+    with patch("app.services.authoring_engine.record_escalation") as escalation:
+        assert await _ready_session_turn(AuthoringStore(), model) == "силно"
+    assert calls == [FAST, STRONG]
+    assert escalation.call_args.args[1:] == ("fast", "invalid_output")
+
+
+def _invalid_fast_reply_client(seconds: float):
+    """completions.create answering after `seconds`: unparseable on the fast model, valid on the strong one."""
+    models = []
+
+    async def _create(**kwargs):
+        models.append(kwargs["model"])
+        await asyncio.sleep(seconds)
+        completion = MagicMock()
+        completion.choices = [MagicMock()]
+        completion.choices[0].message.content = (
+            "not json" if kwargs["model"] == "fast-model" else _result(reply="силно").model_dump_json()
+        )
+        return completion
+
+    client = MagicMock()
+    client.chat.completions.create = _create
+    return client, models
+
+
+async def _routed_ready_turn(client):
+    store = AuthoringStore()
+    session = store.create_session()
+    store.update_session(session.id, status=AuthoringStatus.READY, draft=PrankDraft(**_COMPLETE))
+    session = store.get_session(session.id)
+    ctx = authoring_engine._build_authoring_context(session, "по-смешно")
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)):
+        return await authoring_engine._routed_call(ctx, session)
+
+
+@pytest.mark.asyncio
+async def test_escalation_shares_the_turn_deadline(_fast_tier, monkeypatch):
+    monkeypatch.setattr(authoring_engine, "AUTHORING_TURN_DEADLINE_SECONDS", 0.1)
+    monkeypatch.setattr(authoring_engine, "AUTHORING_ESCALATION_MIN_SECONDS", 0.0)
+    monkeypatch.setattr(authoring_engine, "AUTHORING_HEDGE_ENABLED", False)
+    client, models = _invalid_fast_reply_client(0.06)   # one call fits the deadline, two do not
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with pytest.raises(ValueError, match="turn budget"):
+        await _routed_ready_turn(client)
+
+    assert models == ["fast-model", "strong-model"]
+    assert loop.time() - started < 0.15
+
+
+@pytest.mark.asyncio
+async def test_escalation_is_skipped_when_the_deadline_is_near(_fast_tier, monkeypatch):
+    monkeypatch.setattr(authoring_engine, "AUTHORING_TURN_DEADLINE_SECONDS", 0.1)
+    monkeypatch.setattr(authoring_engine, "AUTHORING_ESCALATION_MIN_SECONDS", 0.05)
+    monkeypatch.setattr(authoring_engine, "AUTHORING_HEDGE_ENABLED", False)
+    client, models = _invalid_fast_reply_client(0.06)
+
+    with patch("app.services.authoring_engine.record_escalation") as escalation:
+        with pytest.raises(authoring_engine.InvalidModelOutput):
+            await _routed_ready_turn(client)
+
+    assert models == ["fast-model"]
+    escalation.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rejected_fast_handoff_escalates_to_strong(_fast_tier):
+    store = AuthoringStore()
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, "първо")
+    draft = {k: v for k, v in _COMPLETE.items() if k != "progression"}
+    store.update_session(session.id, draft=PrankDraft(**draft))   # only PROGRESSION missing → STRONG
+    bogus = _result(reply="готово")
+    bogus.ready_for_handoff = True
+
+    assert authoring_engine._escalation_reason(FAST, bogus, store.get_session(session.id)) == "handoff_rejected"
+    assert authoring_engine._escalation_reason(STRONG, bogus, store.get_session(session.id)) is None
@@ -0,0 +1,80 @@
+"""Unit tests for token-budgeted authoring history and the rolling summary."""
+import pytest
+
+from app.schemas.prank_authoring import MessageRole
+from app.services import authoring_history
+from app.services.authoring_engine import _build_authoring_context
+from app.services.authoring_history import compact_history, count_tokens, message_tokens
+from app.services.authoring_prompts import build_user_payload
+from app.services.authoring_store import AuthoringStore
+
+
+@pytest.fixture(autouse=True)
+def _small_budgets(monkeypatch):
+    monkeypatch.setattr(authoring_history, "AUTHORING_HISTORY_TOKEN_BUDGET", 200)
+    monkeypatch.setattr(authoring_history, "AUTHORING_SUMMARY_TOKEN_BUDGET", 80)
+
+
+def _long_session(store, turns=20):
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, "Искам шега с куриер, без да споменава работата на Иван.")
+    for i in range(turns):
+        store.append_message(session.id, MessageRole.ASSISTANT, f"Добре, промяна {i}: нека куриерът звучи още по-объркан.")
+        store.append_message(session.id, MessageRole.USER, f"Редакция номер {i}, направи го по-смешно и по-кратко.")
+    return store.get_session(session.id)
+
+
+def test_count_tokens_is_positive_and_monotonic():
+    assert count_tokens("") == 0
+    assert 0 < count_tokens("здрасти") <= count_tokens("здрасти, как си днес?")
+
+
+def test_short_history_is_sent_verbatim_without_summary():
+    store = AuthoringStore()
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, "куриер")
+    session = store.get_session(session.id)
+
+    assert compact_history(session) == session.messages
+    assert session.context_summary is None
+
+
+def test_long_history_stays_within_budget_and_keeps_latest_message():
+    store = AuthoringStore()
+    session = _long_session(store)
+
+    recent = compact_history(session)
+
+    assert sum(message_tokens(m) for m in recent) <= authoring_history.AUTHORING_HISTORY_TOKEN_BUDGET
+    assert recent[-1] == session.messages[-1]
+    assert session.summarized_through == len(session.messages) - len(recent)
+    assert count_tokens(session.context_summary) <= authoring_history.AUTHORING_SUMMARY_TOKEN_BUDGET
+    # The opening idea survives summary trimming
+    assert "без да споменава работата на Иван" in session.context_summary
+
+
+def test_history_is_stable_between_compactions():
+    store = AuthoringStore()
+    session = _long_session(store)
+    compact_history(session)
+    through = session.summarized_through
+
+    store.append_message(session.id, MessageRole.ASSISTANT, "Още нещо?")
+    store.append_message(session.id, MessageRole.USER, "не")
+    recent = compact_history(session)
+
+    assert session.summarized_through == through
+    assert recent[0] == session.messages[through]
+
+
+def test_summary_reaches_prompt_but_not_api():
+    store = AuthoringStore()
+    session = _long_session(store)
+    ctx = _build_authoring_context(session, session.messages[-1].content)
+
+    for version in ("2", "3"):
+        first_line = build_user_payload(ctx, version).split("\n", 1)[0]
+        assert first_line.startswith("## Earlier") and first_line.endswith("(summary):")
+    assert "context_summary" not in session.model_dump()
+    assert "prompted_draft" not in session.model_dump()
+    assert "summarized_through" not in session.model_dump_json()
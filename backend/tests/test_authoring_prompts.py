@@ -0,0 +1,159 @@
+"""Unit tests for authoring prompt layout (prefix-cache friendliness)."""
+import pytest
+
+from app.schemas.prank_authoring import (
+    AuthoringLLMResult,
+    AuthoringStatus,
+    Caller,
+    DraftField,
+    DraftUpdate,
+    MessageRole,
+)
+from app.services import authoring_engine
+from app.services.authoring_metrics import UsageTotals, usage_from_completion
+from app.services.authoring_prompts import (
+    build_provider_messages,
+    build_system_prompt,
+    build_user_payload,
+    system_prompt_tokens,
+)
+from app.services.authoring_store import AuthoringStore
+
+
+# Per payload format: (history header, assistant line prefix, status header, draft header)
+_LAYOUTS = {
+    "2": ("## Conversation so far:", "Assistant: ", "\n\n## Authoring status:", "## Current draft:"),
+    "3": ("## Chat (U=user, A=assistant):", "A: ", "\n## Status:", "## Draft"),
+    "4": ("## Chat (U=user, A=assistant):", "A: ", "\n## Status:", "## Draft"),
+}
+
+
+def _payload_after_user_message(store, session_id, text, version="2"):
+    store.append_message(session_id, MessageRole.USER, text)
+    ctx = authoring_engine._build_authoring_context(store.get_session(session_id), text)
+    return build_user_payload(ctx, version)
+
+
+def _answer(store, session_id, reply):
+    """Complete the turn as the engine does after a model reply (no draft change)."""
+    result = AuthoringLLMResult(
+        reply=reply, draft_update=DraftUpdate(), missing_fields=[],
+        is_draft_complete=False, ready_for_handoff=False,
+    )
+    authoring_engine._complete_turn(store, store.get_session(session_id), result)
+
+
+def test_system_prompt_is_identical_across_sessions():
+    store = AuthoringStore()
+    contexts = []
+    for text in ("искам куриер", "нещо съвсем друго"):
+        session = store.create_session()
+        store.append_message(session.id, MessageRole.USER, text)
+        contexts.append(authoring_engine._build_authoring_context(store.get_session(session.id), text))
+
+    first, second = (build_provider_messages(ctx) for ctx in contexts)
+    assert first[0]["role"] == "system"
+    assert first[0] == second[0]
+
+
+def test_opening_turn_gets_the_full_system_prompt():
+    full = build_system_prompt()
+    assert build_system_prompt(version="3") == full
+    assert build_system_prompt(AuthoringStatus.READY, [], version="3") == full
+    assert build_system_prompt(AuthoringStatus.COLLECTING_INFO, list(DraftField), version="4") == full
+
+
+def test_modular_prompt_drops_sections_once_the_prank_has_shape():
+    full = build_system_prompt()
+    ready = build_system_prompt(AuthoringStatus.READY, [], version="4")
+
+    assert "EXAMPLES" in ready and "MODE 5: NONSENSE" in ready
+    assert "MODE 2: SUGGESTION" in ready and "Кое ти харесва?" not in ready
+    assert "WHAT MAKES A GOOD PRANK" not in ready and "WHEN TO STOP" not in ready
+    assert ready.endswith(full[-200:])
+    assert system_prompt_tokens(AuthoringStatus.READY, [], "4") < system_prompt_tokens(version="4")
+
+
+def test_modular_prompt_is_shared_by_turns_in_the_same_state():
+    store = AuthoringStore()
+    contexts = []
+    for text in ("искам куриер", "нещо съвсем друго"):
+        session = store.create_session()
+        store.update_session(session.id, status=AuthoringStatus.DRAFTING)
+        store.append_message(session.id, MessageRole.USER, text)
+        contexts.append(authoring_engine._build_authoring_context(store.get_session(session.id), text))
+
+    first, second = (build_provider_messages(ctx, "4") for ctx in contexts)
+    assert first[0] == second[0]
+    assert first[0]["content"] == contexts[0].system_instructions
+
+
+@pytest.mark.parametrize("version", sorted(_LAYOUTS))
+def test_history_precedes_turn_state(version):
+    history_header, assistant, status_header, draft_header = _LAYOUTS[version]
+    store = AuthoringStore()
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, "първо")
+    store.append_message(session.id, MessageRole.ASSISTANT, "Кой да звъни?")
+
+    payload = _payload_after_user_message(store, session.id, "куриер", version)
+
+    assert payload.startswith(history_header)
+    assert payload.index(f"{assistant}Кой да звъни?") < payload.index(status_header)
+    assert payload.index(draft_header) < payload.index("## Latest user message:")
+
+
+@pytest.mark.parametrize("version", sorted(_LAYOUTS))
+def test_history_block_is_a_prefix_of_the_next_turn(version):
+    status_header = _LAYOUTS[version][2]
+    store = AuthoringStore()
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, "първо")
+    store.append_message(session.id, MessageRole.ASSISTANT, "Кой да звъни?")
+    before = _payload_after_user_message(store, session.id, "куриер", version)
+    store.append_message(session.id, MessageRole.ASSISTANT, "А на кого?")
+    after = _payload_after_user_message(store, session.id, "на Иван", version)
+
+    history = before[:before.index(status_header)]
+    assert after.startswith(history)
+
+
+def test_compact_draft_drops_nulls_and_marks_changed_sections():
+    store = AuthoringStore()
+    session = store.create_session()
+    first = _payload_after_user_message(store, session.id, "куриер", "3")
+    assert "## Draft:\n{}\n" in first          # first prompt: no marker, empty draft
+
+    _answer(store, session.id, "Как звучи?")
+    store.update_session(session.id, draft=session.draft.model_copy(
+        update={"caller": Caller(persona="куриер", tone="упорит")}
+    ))
+    changed = _payload_after_user_message(store, session.id, "упорит", "3")
+    assert '## Draft (changed since last turn: caller):\n{"caller":{"persona":"куриер","tone":"упорит"}}' in changed
+
+    _answer(store, session.id, "Добре")
+    unchanged = _payload_after_user_message(store, session.id, "ок", "3")
+    assert "## Draft (unchanged since last turn):" in unchanged
+
+
+def test_unknown_prompt_version_is_rejected():
+    ctx = authoring_engine._build_authoring_context(AuthoringStore().create_session(), "здрасти")
+    with pytest.raises(ValueError, match="prompt version"):
+        build_user_payload(ctx, "99")
+
+
+def test_usage_totals_track_cache_hit_ratio():
+    totals = UsageTotals()
+    totals.add(usage_from_completion(None, session_id="s", model="m", latency_ms=1.0))
+    assert totals.cache_hit_ratio == 0.0
+
+    class _Details:
+        cached_tokens = 750
+
+    class _Usage:
+        prompt_tokens = 1000
+        completion_tokens = 50
+        prompt_tokens_details = _Details()
+
+    totals.add(usage_from_completion(_Usage(), session_id="s", model="m", latency_ms=1.0))
+    assert totals.cache_hit_ratio == 0.75
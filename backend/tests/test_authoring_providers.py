@@ -0,0 +1,83 @@
+"""Unit tests for authoring model providers (stub focus)."""
+import statistics
+from unittest.mock import patch
+
+import pytest
+
+from app.schemas.prank_authoring import AuthoringLLMResult, AuthoringStatus
+from app.services import authoring_engine
+from app.services.authoring_metrics import measure_turn
+from app.services.authoring_prompts import build_provider_messages
+from app.services.authoring_providers import StubProvider, create_provider
+from app.services.authoring_response_cache import authoring_response_cache
+from app.services.authoring_store import AuthoringStore
+
+
+@pytest.fixture(autouse=True)
+def _empty_response_cache():
+    authoring_response_cache.clear()
+    yield
+    authoring_response_cache.clear()
+
+
+def _ctx(text="куриер"):
+    store = AuthoringStore()
+    session = store.create_session()
+    return authoring_engine._build_authoring_context(session, text)
+
+
+@pytest.mark.asyncio
+async def test_stub_returns_schema_valid_json_with_token_counts():
+    ctx = _ctx()
+    messages = build_provider_messages(ctx)
+
+    completion = await StubProvider(latency_median_ms=1).complete(ctx, messages, model="m", cache_key="k")
+
+    result = AuthoringLLMResult.model_validate_json(completion.content)
+    assert result.reply
+    assert completion.usage.prompt_tokens > 1000          # includes the system prompt
+    assert completion.usage.completion_tokens > 0
+
+
+def test_stub_content_is_deterministic_per_seed():
+    ctx = _ctx()
+    assert StubProvider(seed="a").result_for(ctx) == StubProvider(seed="a").result_for(ctx)
+
+
+def test_stub_latency_follows_configured_median():
+    stub = StubProvider(latency_median_ms=500, latency_sigma=0.3, seed="x")
+    samples = [stub._latency_seconds() for _ in range(2000)]
+    assert statistics.median(samples) == pytest.approx(0.5, rel=0.1)
+
+
+@pytest.mark.asyncio
+async def test_stub_stream_reassembles_to_complete_result():
+    ctx = _ctx()
+    stub = StubProvider(latency_median_ms=5)
+    chunks = [c async for c in stub.stream(ctx, build_provider_messages(ctx), model="m", cache_key="k")]
+
+    text = "".join(c.text for c in chunks)
+    assert AuthoringLLMResult.model_validate_json(text) == stub.result_for(ctx)
+    assert chunks[-1].usage is not None
+
+
+@pytest.mark.asyncio
+async def test_full_session_reaches_ready_on_stub():
+    store = AuthoringStore()
+    session = store.create_session()
+
+    with patch("app.services.authoring_engine._get_provider", return_value=StubProvider(latency_median_ms=2)):
+        for text in ("куриер", "да е упорит", "за Иван", "без здраве"):
+            with measure_turn() as timing:
+                await authoring_engine.process_turn(store, session.id, text)
+            assert timing.model_ms > 0
+            assert timing.total_ms >= timing.model_ms
+
+    session = store.get_session(session.id)
+    assert session.status == AuthoringStatus.READY
+    assert session.draft.prank_title
+
+
+def test_unknown_provider_is_rejected():
+    with pytest.raises(ValueError, match="AUTHORING_PROVIDER"):
+        create_provider("carrier-pigeon")
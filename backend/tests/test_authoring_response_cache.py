@@ -0,0 +1,125 @@
+"""Unit tests for the cold-start authoring response cache."""
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.schemas.prank_authoring import AuthoringLLMResult, DraftUpdate, MessageRole
+from app.services import authoring_response_cache as cache_module
+from app.services.authoring_engine import _build_authoring_context, process_turn
+from app.services.authoring_response_cache import AuthoringResponseCache, normalize_text
+from app.services.authoring_store import AuthoringStore
+
+
+def _result(reply: str) -> AuthoringLLMResult:
+    return AuthoringLLMResult(
+        reply=reply,
+        draft_update=DraftUpdate(),
+        missing_fields=[],
+        is_draft_complete=False,
+        ready_for_handoff=False,
+    )
+
+
+def _first_turn_ctx(store: AuthoringStore, text: str):
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, text)
+    return _build_authoring_context(store.get_session(session.id), text)
+
+
+def _cache(**overrides) -> AuthoringResponseCache:
+    params = dict(
+        max_entries=16,
+        ttl_seconds=60,
+        max_variants=2,
+        collect_probability=0.0,
+        similarity=0.8,
+        rng=random.Random(0),
+    )
+    params.update(overrides)
+    return AuthoringResponseCache(**params)
+
+
+def test_normalize_text_ignores_case_punctuation_and_spacing():
+    assert normalize_text("  Не знам,  ПРЕДЛОЖИ ми!!") == "не знам предложи ми"
+
+
+def test_first_turn_hit_after_store():
+    store, cache = AuthoringStore(), _cache()
+    cache.store(_first_turn_ctx(store, "Изненадай ме!"), "m", _result("Добре!"))
+
+    assert cache.lookup(_first_turn_ctx(store, "изненадай ме"), "m").reply == "Добре!"
+    assert cache.lookup(_first_turn_ctx(store, "изненадай ме"), "other-model") is None
+
+
+def test_later_turns_are_never_cached():
+    store, cache = AuthoringStore(), _cache()
+    session = store.create_session()
+    for text in ("куриер", "изненадай ме"):
+        store.append_message(session.id, MessageRole.USER, text)
+    ctx = _build_authoring_context(store.get_session(session.id), "изненадай ме")
+
+    cache.store(ctx, "m", _result("Добре!"))
+    assert len(cache) == 0
+
+
+def test_prompt_version_partitions_entries(monkeypatch):
+    store, cache = AuthoringStore(), _cache()
+    cache.store(_first_turn_ctx(store, "изненадай ме"), "m", _result("Добре!"))
+    monkeypatch.setattr(cache_module, "PROMPT_VERSION", "next")
+
+    assert cache.lookup(_first_turn_ctx(store, "изненадай ме"), "m") is None
+
+
+def test_collects_variants_then_picks_among_them():
+    store = AuthoringStore()
+    cache = _cache(collect_probability=1.0)
+    cache.store(_first_turn_ctx(store, "не знам"), "m", _result("А"))
+
+    # Not full yet: every lookup is a deliberate miss
+    assert cache.lookup(_first_turn_ctx(store, "не знам"), "m") is None
+    cache.store(_first_turn_ctx(store, "не знам"), "m", _result("Б"))
+
+    replies = {cache.lookup(_first_turn_ctx(store, "не знам"), "m").reply for _ in range(20)}
+    assert replies == {"А", "Б"}
+
+
+def test_ttl_and_lru_eviction(monkeypatch):
+    store = AuthoringStore()
+    cache = _cache(max_entries=2, ttl_seconds=10)
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    for text in ("едно", "две", "три"):
+        cache.store(_first_turn_ctx(store, text), "m", _result(text))
+    assert len(cache) == 2
+    assert cache.lookup(_first_turn_ctx(store, "едно"), "m") is None
+
+    now[0] += 11
+    assert cache.lookup(_first_turn_ctx(store, "три"), "m") is None
+
+
+def test_nearest_neighbour_matches_small_variations():
+    pytest.importorskip("numpy")
+    store, cache = AuthoringStore(), _cache()
+    cache.store(_first_turn_ctx(store, "не знам, предложи ми нещо"), "m", _result("Ето идея"))
+
+    assert cache.lookup(_first_turn_ctx(store, "не знам предложи ми нещо смешно"), "m").reply == "Ето идея"
+    assert cache.lookup(_first_turn_ctx(store, "обади се на шефа ми"), "m") is None
+
+
+@pytest.mark.asyncio
+async def test_process_turn_answers_repeated_opener_without_model_call(monkeypatch):
+    monkeypatch.setattr("app.services.authoring_engine.authoring_response_cache", _cache())
+    store = AuthoringStore()
+    model = AsyncMock(return_value=_result("Кой да звъни?"))
+
+    with patch("app.services.authoring_engine._call_model", new=model):
+        first = store.create_session()
+        await process_turn(store, first.id, "Изненадай ме")
+        second = store.create_session()
+        reply = await process_turn(store, second.id, "изненадай ме!")
+
+    assert reply == "Кой да звъни?"
+    model.assert_awaited_once()
+    assert store.get_session(second.id).messages[-1].content == "Кой да звъни?"
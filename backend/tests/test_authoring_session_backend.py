@@ -0,0 +1,204 @@
+"""Unit tests for optimistic, append-only session writes in PostgresSessionBackend and the router's freshness check."""
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import authoring as authoring_api
+from app.schemas.prank_authoring import MessageRole
+from app.services import authoring_history
+from app.services import authoring_session_backend as backend_module
+from app.services.authoring_session_backend import PostgresSessionBackend, SessionVersionConflict, StoredSession
+from app.services.authoring_store import AuthoringStore
+
+
+class _FakeDB:
+    """Records writes; scalar() answers UPDATE ... RETURNING with `returned`."""
+
+    def __init__(self, returned=None):
+        self.returned = returned
+        self.added: list = []
+        self.statements: list = []
+        self.message_rows: list = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def add(self, row):
+        self.added.append(row)
+
+    async def scalar(self, stmt):
+        self.statements.append(stmt)
+        return self.returned
+
+    async def flush(self):
+        pass
+
+    async def execute(self, stmt, rows):
+        self.message_rows.extend(rows)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture(autouse=True)
+def _quiet_bus(monkeypatch):
+    published: list = []
+
+    async def _publish(db, channel, payload):
+        published.append(payload)
+
+    monkeypatch.setattr(backend_module.change_bus, "publish", _publish)
+    return published
+
+
+@pytest.mark.asyncio
+async def test_first_save_inserts_at_version_one(_quiet_bus):
+    session = AuthoringStore().create_session()
+    db = _FakeDB()
+
+    await PostgresSessionBackend().save(db, session, uuid.uuid4())
+
+    [row] = db.added
+    assert row.version == 1 and session.version == 1
+    assert [(r["seq"], r["role"]) for r in db.message_rows] == [(0, "assistant")]
+    assert session.persisted_messages == 1
+    assert db.commits == 1 and _quiet_bus[0]["c"] == 1
+
+
+@pytest.mark.asyncio
+async def test_save_is_conditional_on_the_loaded_version(_quiet_bus):
+    session = AuthoringStore().create_session()
+    session.version = 3
+    db = _FakeDB(returned=4)
+
+    await PostgresSessionBackend().save(db, session, uuid.uuid4())
+
+    sql = str(db.statements[0])
+    assert "authoring_drafts.version = :version_1" in sql and "RETURNING" in sql
+    assert session.version == 4 and not db.added and _quiet_bus[0]["c"] == 0
+
+
+@pytest.mark.asyncio
+async def test_a_turn_inserts_only_its_new_messages():
+    store = AuthoringStore()
+    session = store.create_session()
+    backend = PostgresSessionBackend()
+    await backend.save(_FakeDB(), session, uuid.uuid4())
+
+    store.append_message(session.id, MessageRole.USER, "куриер")
+    store.append_message(session.id, MessageRole.ASSISTANT, "Кой звъни?")
+    db = _FakeDB(returned=2)
+    await backend.save(db, session, uuid.uuid4())
+
+    assert [(r["seq"], r["role"], r["content"]) for r in db.message_rows] == [
+        (1, "user", "куриер"),
+        (2, "assistant", "Кой звъни?"),
+    ]
+    assert db.message_rows[0]["created_at"] == session.messages[1].timestamp
+
+    # A save without new messages (e.g. a phone update) inserts none
+    db = _FakeDB(returned=3)
+    await backend.save(db, session, uuid.uuid4())
+    assert db.message_rows == [] and session.persisted_messages == 3
+
+
+@pytest.mark.asyncio
+async def test_lost_race_writes_nothing(_quiet_bus):
+    session = AuthoringStore().create_session()
+    session.version = 3
+    db = _FakeDB(returned=None)
+
+    with pytest.raises(SessionVersionConflict):
+        await PostgresSessionBackend().save(db, session, uuid.uuid4())
+
+    assert session.version == 3 and session.persisted_messages == 0
+    assert db.message_rows == [] and db.rollbacks == 1 and db.commits == 0 and _quiet_bus == []
+
+
+@pytest.mark.asyncio
+async def test_conflict_drops_the_stale_copy_and_returns_409(monkeypatch):
+    store = AuthoringStore()
+    session = store.create_session()
+    monkeypatch.setattr(authoring_api, "authoring_store", store)
+
+    class _Conflicting:
+        async def save(self, db, session, user_id, *, launched_at=None):
+            raise SessionVersionConflict(session.id)
+
+    monkeypatch.setattr(authoring_api, "session_backend", _Conflicting())
+
+    with pytest.raises(HTTPException) as exc:
+        await authoring_api._persist_to_db(session, uuid.uuid4(), db=None)
+
+    assert exc.value.status_code == 409
+    assert store.get_session(session.id) is None
+
+
+@pytest.mark.asyncio
+async def test_turn_reloads_a_copy_another_worker_has_moved_past(monkeypatch):
+    store = AuthoringStore()
+    local = store.create_session()
+    local.version = 2
+    newer = local.model_copy(deep=True)
+    newer.version = 3
+    user_id = uuid.uuid4()
+    monkeypatch.setattr(authoring_api, "authoring_store", store)
+
+    class _Backend:
+        stored_version = 2
+        loads = 0
+
+        async def version(self, db, session_id):
+            return self.stored_version
+
+        async def load(self, db, session_id):
+            self.loads += 1
+            return StoredSession(session=newer, user_id=user_id)
+
+    backend = _Backend()
+    monkeypatch.setattr(authoring_api, "session_backend", backend)
+
+    await authoring_api._ensure_current(local.id, user_id, db=None)
+    assert backend.loads == 0 and store.get_session(local.id) is local
+
+    backend.stored_version = 3
+    await authoring_api._ensure_current(local.id, user_id, db=None)
+    assert backend.loads == 1 and store.get_session(local.id) is newer
+
+
+@pytest.mark.asyncio
+async def test_history_summary_survives_a_save_and_reload(monkeypatch):
+    monkeypatch.setattr(authoring_history, "AUTHORING_HISTORY_TOKEN_BUDGET", 200)
+    store = AuthoringStore()
+    session = store.create_session()
+    for i in range(30):
+        store.append_message(session.id, MessageRole.USER, f"Редакция номер {i}, направи го по-смешно.")
+        store.append_message(session.id, MessageRole.ASSISTANT, f"Добре, промяна {i}: куриерът е объркан.")
+        authoring_history.compact_history(session)   # compacts in several steps
+    assert session.context_summary and session.summarized_through
+
+    db = _FakeDB()
+    await PostgresSessionBackend().save(db, session, uuid.uuid4())
+    [row] = db.added
+
+    class _LoadDB:
+        async def scalar(self, stmt):
+            return SimpleNamespace(
+                id=uuid.UUID(session.id), user_id=row.user_id, created_at=session.created_at,
+                updated_at=session.updated_at, status=row.status, draft_json=row.draft_json,
+                is_complete=row.is_complete, recipient_phone=None, version=row.version,
+                context_summary=row.context_summary, summarized_through=row.summarized_through,
+            )
+
+        async def execute(self, stmt):
+            return [(r["role"], r["content"], r["created_at"]) for r in db.message_rows]
+
+    stored = await PostgresSessionBackend().load(_LoadDB(), session.id)
+
+    assert stored.session.messages == session.messages
+    assert stored.session.context_summary == session.context_summary
+    assert stored.session.summarized_through == session.summarized_through
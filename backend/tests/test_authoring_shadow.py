@@ -0,0 +1,150 @@
+"""Unit tests for shadow replays of live turns on a candidate prompt version."""
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.prank_authoring import AuthoringLLMResult, DraftUpdate
+from app.services import authoring_engine
+from app.services.authoring_metrics import current_turn, measure_turn
+from app.services.authoring_prompts import PROMPT_VERSION
+from app.services.authoring_providers import ProviderCompletion, StubProvider
+from app.services.authoring_shadow import PromptShadow
+from app.services.authoring_store import AuthoringStore
+
+_CANDIDATE = "2" if PROMPT_VERSION != "2" else "3"
+
+
+class _FakeDB:
+    def __init__(self, inserted: list):
+        self._inserted = inserted
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, rows):
+        self._inserted.extend(rows)
+
+    async def commit(self):
+        pass
+
+
+class _ScriptedProvider:
+    def __init__(self, content: str, release: asyncio.Event | None = None):
+        self._content = content
+        self._release = release
+        self.calls = 0
+
+    async def complete(self, ctx, messages, *, model, cache_key):
+        self.calls += 1
+        if self._release is not None:
+            await self._release.wait()
+        usage = SimpleNamespace(prompt_tokens=1200, completion_tokens=40, prompt_tokens_details=None)
+        return ProviderCompletion(self._content, usage)
+
+
+def _shadow(inserted: list, **kwargs) -> PromptShadow:
+    options = dict(candidate_version=_CANDIDATE, fraction=1.0, max_inflight=4, deadline_seconds=5)
+    options.update(kwargs)
+    return PromptShadow(session_factory=lambda: _FakeDB(inserted), rng=random.Random(0), **options)
+
+
+def _ctx():
+    store = AuthoringStore()
+    session = store.create_session()
+    return authoring_engine._build_authoring_context(session, "куриер")
+
+
+def _reply() -> AuthoringLLMResult:
+    return AuthoringLLMResult(
+        reply="Кой да звъни?",
+        draft_update=DraftUpdate(),
+        missing_fields=[],
+        is_draft_complete=False,
+        ready_for_handoff=False,
+    )
+
+
+async def _drain(shadow: PromptShadow) -> None:
+    await asyncio.gather(*shadow._tasks)
+
+
+def test_disabled_without_a_distinct_candidate():
+    assert not _shadow([], candidate_version="").enabled
+    assert not _shadow([], candidate_version=PROMPT_VERSION).enabled
+    assert not _shadow([], fraction=0.0).enabled
+    assert _shadow([]).enabled
+
+
+@pytest.mark.asyncio
+async def test_live_turn_is_replayed_on_the_candidate(monkeypatch):
+    inserted: list = []
+    shadow = _shadow(inserted)
+    monkeypatch.setattr(authoring_engine, "prompt_shadow", shadow)
+    monkeypatch.setattr(authoring_engine, "AUTHORING_RESPONSE_CACHE_ENABLED", False)
+    monkeypatch.setattr(authoring_engine, "_provider", StubProvider(latency_median_ms=0.01, latency_sigma=0.0))
+    store = AuthoringStore()
+    session = store.create_session()
+
+    with measure_turn() as timing:
+        await authoring_engine.process_turn(store, session.id, "искам майтап с куриер")
+    await _drain(shadow)
+
+    [row] = inserted
+    assert (row["primary_version"], row["candidate_version"]) == (PROMPT_VERSION, _CANDIDATE)
+    assert row["status"] == "collecting_info" and row["model"] == timing.model
+    assert row["primary_prompt_tokens"] == timing.prompt_tokens
+    assert row["candidate_prompt_tokens"] > 0 and "candidate_error" not in row
+    assert row["candidate_completes_draft"] is False
+    # The replay reported nothing into the live turn
+    assert timing.model_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_candidate_output_is_recorded_not_raised():
+    inserted: list = []
+    shadow = _shadow(inserted)
+    with measure_turn():
+        current_turn().model = "m"
+        assert shadow.maybe_shadow(_ctx(), _ScriptedProvider("not json"), _reply(), completes=lambda r: False)
+    await _drain(shadow)
+
+    [row] = inserted
+    assert row["candidate_error"] == "invalid_output"
+    assert row["candidate_prompt_tokens"] == 1200
+    assert "candidate_completes_draft" not in row
+
+
+@pytest.mark.asyncio
+async def test_turns_beyond_max_inflight_are_skipped():
+    inserted: list = []
+    shadow = _shadow(inserted, max_inflight=1)
+    release = asyncio.Event()
+    provider = _ScriptedProvider(_reply().model_dump_json(), release)
+    with measure_turn():
+        current_turn().model = "m"
+        assert shadow.maybe_shadow(_ctx(), provider, _reply(), completes=lambda r: True)
+        assert not shadow.maybe_shadow(_ctx(), provider, _reply(), completes=lambda r: True)
+    assert shadow.skipped == 1
+
+    release.set()
+    await _drain(shadow)
+    assert len(inserted) == 1 and inserted[0]["candidate_completes_draft"] is True
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_runs_in_flight():
+    inserted: list = []
+    shadow = _shadow(inserted)
+    provider = _ScriptedProvider(_reply().model_dump_json(), asyncio.Event())
+    with measure_turn():
+        current_turn().model = "m"
+        shadow.maybe_shadow(_ctx(), provider, _reply(), completes=lambda r: True)
+    await asyncio.sleep(0)
+
+    await shadow.stop()
+    assert not shadow._tasks and inserted == []
@@ -0,0 +1,111 @@
+"""Unit tests for AuthoringStore eviction (LRU, byte budget, idle TTL) and pinning."""
+import pytest
+
+from app.schemas.prank_authoring import MessageRole
+from app.services import authoring_store as store_module
+from app.services.authoring_store import AuthoringStore, estimate_session_bytes
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(store_module.time, "monotonic", clock)
+    return clock
+
+
+def test_least_recently_used_session_is_evicted_first():
+    store = AuthoringStore(max_sessions=2)
+    first, second = store.create_session(), store.create_session()
+    store.get_session(first.id)          # second is now least recently used
+
+    third = store.create_session()
+
+    assert store.get_session(second.id) is None
+    assert store.get_session(first.id) is first and store.get_session(third.id) is third
+    assert store.evictions == 1
+
+
+def test_byte_budget_tracks_message_growth():
+    store = AuthoringStore()
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, "куриер" * 100)
+    assert store.bytes_used == estimate_session_bytes(session)
+
+    tight = AuthoringStore(max_bytes=store.bytes_used + 100)
+    old = tight.create_session()
+    tight.append_message(old.id, MessageRole.USER, "куриер" * 100)
+    new = tight.create_session()
+
+    assert tight.get_session(old.id) is None and tight.get_session(new.id) is new
+    assert tight.bytes_used == estimate_session_bytes(new)
+
+
+def test_idle_sessions_expire(clock):
+    store = AuthoringStore(idle_ttl_seconds=60)
+    idle, active = store.create_session(), store.create_session()
+    clock.now += 45
+    store.get_session(active.id)
+    clock.now += 30
+
+    assert store.get_session(active.id) is active
+    assert len(store) == 1 and store.get_session(idle.id) is None
+
+
+def test_reading_an_expired_session_keeps_it(clock):
+    store = AuthoringStore(idle_ttl_seconds=60)
+    session = store.create_session()
+    session.context_summary = "- User: куриер"
+    clock.now += 120
+
+    assert store.get_session(session.id) is session
+    assert store.get_session(session.id).context_summary == "- User: куриер"
+
+
+def test_a_single_oversized_session_stays_resident():
+    store = AuthoringStore(max_bytes=1)
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, "дълго съобщение")
+    assert store.get_session(session.id) is session
+
+
+def test_pinned_session_survives_pressure_and_deferred_evict(clock):
+    store = AuthoringStore(max_sessions=1, idle_ttl_seconds=60)
+    session = store.create_session()
+    with store.pinned(session.id):
+        clock.now += 120
+        store.create_session()
+        assert store.evict(session.id) is False          # remote change mid-turn
+        store.append_message(session.id, MessageRole.USER, "още съм тук")
+        assert store.get_session(session.id) is session
+
+    assert store.get_session(session.id) is None
+
+
+def test_memory_stays_flat_under_churn():
+    store = AuthoringStore(max_sessions=50, max_bytes=200_000)
+    for i in range(1000):
+        session = store.create_session()
+        store.append_message(session.id, MessageRole.USER, f"съобщение {i}" * 20)
+    assert len(store) <= 50
+    assert store.bytes_used <= 200_000
+    assert store.bytes_used == sum(store._sizes.values())
+
+
+def test_put_session_replaces_a_stale_copy():
+    store = AuthoringStore()
+    session = store.create_session()
+    reloaded = session.model_copy(deep=True)
+    reloaded.messages.append(reloaded.messages[0])
+
+    store.put_session(reloaded)
+
+    assert store.get_session(session.id) is reloaded
+    assert len(store) == 1 and store.bytes_used == estimate_session_bytes(reloaded)
@@ -0,0 +1,80 @@
+"""Unit tests for the incremental reply parser used by streamed authoring turns."""
+import json
+
+import pytest
+
+from app.schemas.prank_authoring import AuthoringLLMResult, DraftUpdate
+from app.services.authoring_stream_parser import ReplyStreamParser
+
+
+def _feed_all(text: str, size: int) -> tuple[ReplyStreamParser, list[str]]:
+    parser = ReplyStreamParser()
+    deltas = [parser.feed(text[i:i + size]) for i in range(0, len(text), size)]
+    return parser, [d for d in deltas if d]
+
+
+def _payload(reply: str, **extra) -> str:
+    obj = {
+        "reply": reply,
+        "draft_update": {},
+        "missing_fields": [],
+        "is_draft_complete": False,
+        "ready_for_handoff": False,
+        **extra,
+    }
+    return json.dumps(obj)
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+@pytest.mark.parametrize("reply", [
+    "Здравей! Кой да звъни?",
+    'Кавички "така" и \\ наклонена\nнов ред\tтаб',
+    "Емоджи 😂 и още 🎉",
+])
+def test_reply_decoded_across_any_chunk_boundary(size, reply):
+    # ensure_ascii=True forces \uXXXX escapes (incl. surrogate pairs for emoji)
+    parser, deltas = _feed_all(_payload(reply), size)
+    assert "".join(deltas) == reply
+    assert parser.reply == reply
+    assert parser.reply_complete
+
+
+def test_reply_after_other_keys_and_nested_reply_ignored():
+    text = json.dumps({
+        "draft_update": {"reply": "nested — not this", "caller": {"persona": "x"}},
+        "missing_fields": ["caller"],
+        "notes": "reply: also not this",
+        "reply": "Това е отговорът",
+        "is_draft_complete": False,
+        "ready_for_handoff": False,
+    }, ensure_ascii=False)
+    parser, deltas = _feed_all(text, 5)
+    assert "".join(deltas) == "Това е отговорът"
+
+
+def test_reply_value_equal_to_key_name_not_confused():
+    text = '{"notes": "reply", "reply": "ok"}'
+    parser, deltas = _feed_all(text, 1)
+    assert "".join(deltas) == "ok"
+
+
+def test_text_is_raw_completion_for_final_validation():
+    text = _payload("Хаха", draft_update={"prank_title": "Куриерът"})
+    parser, _ = _feed_all(text, 4)
+    assert parser.text == text
+    result = AuthoringLLMResult.model_validate_json(parser.text)
+    assert result.reply == parser.reply
+    assert result.draft_update == DraftUpdate(prank_title="Куриерът")
+
+
+def test_partial_stream_yields_only_complete_characters():
+    parser = ReplyStreamParser()
+    assert parser.feed('{"reply": "ab\\') == "ab"
+    assert parser.feed("u04") == ""
+    assert parser.feed("31c") == "бc"
+    assert not parser.reply_complete
+
+
+def test_lone_surrogates_replaced():
+    parser, deltas = _feed_all('{"reply": "a\\ud83d b\\ude02"}', 3)
+    assert "".join(deltas) == "a\ufffd b\ufffd"
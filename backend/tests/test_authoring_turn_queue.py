@@ -0,0 +1,166 @@
+"""Unit tests for per-session authoring turn serialisation and coalescing."""
+import asyncio
+
+import pytest
+
+from app.services.authoring_turn_queue import AuthoringTurnQueue, TurnInterrupted
+
+
+@pytest.mark.asyncio
+async def test_messages_queued_behind_a_turn_are_coalesced():
+    queue = AuthoringTurnQueue()
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    async def run_turn(content: str) -> str:
+        calls.append(content)
+        if len(calls) == 1:
+            await release.wait()
+        return f"reply to {content!r}"
+
+    first = asyncio.create_task(queue.submit("s1", "здрасти", run_turn))
+    await asyncio.sleep(0)
+    burst = [asyncio.create_task(queue.submit("s1", text, run_turn)) for text in ("куриер", "за Иван")]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(first, *burst)
+
+    assert calls == ["здрасти", "куриер\nза Иван"]
+    assert results[1] == results[2] == "reply to 'куриер\\nза Иван'"
+    assert queue._sessions == {}
+
+
+@pytest.mark.asyncio
+async def test_turns_never_overlap_within_a_session():
+    queue = AuthoringTurnQueue()
+    running = 0
+    overlap = False
+
+    async def run_turn(content: str) -> str:
+        nonlocal running, overlap
+        running += 1
+        overlap = overlap or running > 1
+        await asyncio.sleep(0.01)
+        running -= 1
+        return content
+
+    async def streamed():
+        async with queue.exclusive("s1"):
+            await run_turn("stream")
+
+    await asyncio.gather(streamed(), *(queue.submit("s1", str(i), run_turn) for i in range(5)), streamed())
+    assert not overlap
+
+
+@pytest.mark.asyncio
+async def test_sessions_run_independently():
+    queue = AuthoringTurnQueue()
+
+    async def run_turn(content: str) -> str:
+        await asyncio.sleep(0.1)
+        return content
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(*(queue.submit(f"s{i}", "hi", run_turn) for i in range(5)))
+    assert loop.time() - start < 0.3
+
+
+@pytest.mark.asyncio
+async def test_leader_failure_propagates_to_coalesced_followers():
+    queue = AuthoringTurnQueue()
+    release = asyncio.Event()
+    calls = 0
+
+    async def run_turn(content: str) -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release.wait()
+            return "ok"
+        raise ValueError("model down")
+
+    first = asyncio.create_task(queue.submit("s1", "a", run_turn))
+    await asyncio.sleep(0)
+    followers = [asyncio.create_task(queue.submit("s1", text, run_turn)) for text in ("b", "c")]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == "ok"
+    for task in followers:
+        with pytest.raises(ValueError, match="model down"):
+            await task
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_interrupts_followers_without_requeueing():
+    queue = AuthoringTurnQueue()
+    seen: list[str] = []
+
+    async def run_turn(content: str) -> str:
+        seen.append(content)   # the turn has started: the message is recorded
+        if content.startswith("x"):
+            await asyncio.Event().wait()   # never returns
+        return content
+
+    async with queue.exclusive("s1"):
+        leader = asyncio.create_task(queue.submit("s1", "x", run_turn))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(queue.submit("s1", "y", run_turn))
+        await asyncio.sleep(0)
+    # "x" leads the batch [x, y]; cancel it mid-turn
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    with pytest.raises(TurnInterrupted):
+        await follower
+    assert await queue.submit("s1", "z", run_turn) == "z"
+    assert seen == ["x\ny", "z"]     # "y" is never sent a second time
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_withdraws_its_message():
+    queue = AuthoringTurnQueue()
+    seen: list[str] = []
+
+    async def run_turn(content: str) -> str:
+        seen.append(content)
+        return content
+
+    async with queue.exclusive("s1"):
+        gone = asyncio.create_task(queue.submit("s1", "a", run_turn))
+        await asyncio.sleep(0)
+        stays = asyncio.create_task(queue.submit("s1", "b", run_turn))
+        await asyncio.sleep(0)
+        gone.cancel()
+        await asyncio.sleep(0)
+
+    assert await stays == "b"
+    assert gone.cancelled() and seen == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_failure_skips_followers_that_went_away():
+    queue = AuthoringTurnQueue()
+    release = asyncio.Event()
+
+    async def run_turn(content: str) -> str:
+        await release.wait()
+        raise ValueError("model down")
+
+    async with queue.exclusive("s1"):
+        leader = asyncio.create_task(queue.submit("s1", "a", run_turn))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(queue.submit("s1", "b", run_turn))
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)      # leader is running [a, b]
+    follower.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    # The leader reports its own failure, not an InvalidStateError from the follower's future
+    with pytest.raises(ValueError, match="model down"):
+        await leader
+    assert follower.cancelled()
@@ -0,0 +1,81 @@
+"""Unit tests for the LISTEN/NOTIFY change bus (no live Postgres needed)."""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.change_bus import ChangeBus, _asyncpg_dsn
+
+
+def test_asyncpg_dsn_strips_sqlalchemy_driver():
+    assert _asyncpg_dsn("postgresql+asyncpg://u:p@db:5432/app") == "postgresql://u:p@db:5432/app"
+
+
+@pytest.mark.asyncio
+async def test_publish_emits_compact_pg_notify_on_callers_transaction():
+    bus = ChangeBus()
+    db = AsyncMock()
+
+    await bus.publish(db, "prank_session", {"id": "abc", "s": "BRIDGED"})
+
+    db.execute.assert_awaited_once()
+    params = db.execute.await_args.args[1]
+    assert params["channel"] == "prank_session"
+    assert " " not in params["payload"]
+    assert json.loads(params["payload"]) == {"w": bus.worker_id, "id": "abc", "s": "BRIDGED"}
+    db.commit.assert_not_awaited()  # delivery is tied to the caller's commit
+
+
+def test_remote_notification_fans_out_to_subscribers():
+    bus = ChangeBus()
+    first, second = MagicMock(), MagicMock()
+    bus.subscribe("authoring_session", first)
+    bus.subscribe("authoring_session", second)
+
+    bus._on_notification(None, 1, "authoring_session", json.dumps({"w": "other", "id": "x"}))
+
+    first.assert_called_once_with({"w": "other", "id": "x"})
+    second.assert_called_once_with({"w": "other", "id": "x"})
+
+
+def test_own_notifications_are_ignored():
+    bus = ChangeBus()
+    callback = MagicMock()
+    bus.subscribe("authoring_session", callback)
+
+    bus._on_notification(None, 1, "authoring_session", json.dumps({"w": bus.worker_id, "id": "x"}))
+
+    callback.assert_not_called()
+
+
+def test_malformed_payload_and_failing_subscriber_do_not_propagate():
+    bus = ChangeBus()
+    failing = MagicMock(side_effect=RuntimeError("boom"))
+    after = MagicMock()
+    bus.subscribe("prank_session", failing)
+    bus.subscribe("prank_session", after)
+
+    bus._on_notification(None, 1, "prank_session", "not json")
+    bus._on_notification(None, 1, "prank_session", json.dumps({"w": "other", "id": "x"}))
+
+    after.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_connection_is_closed_when_listen_setup_fails(monkeypatch):
+    import asyncpg
+    from app.services import change_bus as bus_module
+
+    failed, ok = MagicMock(), MagicMock()
+    failed.add_listener = AsyncMock(side_effect=OSError("connection reset"))
+    ok.add_listener = AsyncMock()
+    monkeypatch.setattr(asyncpg, "connect", AsyncMock(side_effect=[failed, ok]))
+    monkeypatch.setattr(bus_module, "_RECONNECT_MIN_DELAY_SECONDS", 0)
+    bus = ChangeBus()
+    bus.subscribe("authoring_session", MagicMock())
+    bus._dsn = "postgresql://x"
+
+    await bus._connect_loop()
+
+    failed.terminate.assert_called_once()
+    assert bus._conn is ok
+    ok.terminate.assert_not_called()
@@ -0,0 +1,48 @@
+"""Unit tests for conditional-GET helpers."""
+from datetime import datetime, timedelta, timezone
+
+from starlette.requests import Request
+
+from app.etag import is_not_modified, make_etag, not_modified
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+_TS = datetime(2026, 4, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_etag_changes_with_updated_at():
+    assert make_etag("abc", _TS) != make_etag("abc", _TS + timedelta(microseconds=1))
+
+
+def test_etag_is_timezone_independent():
+    local = _TS.astimezone(timezone(timedelta(hours=3)))
+    assert make_etag("abc", _TS) == make_etag("abc", local)
+
+
+def test_matching_if_none_match_is_not_modified():
+    etag = make_etag("abc", _TS)
+    assert is_not_modified(_request(etag), etag)
+
+
+def test_weak_comparison_and_lists():
+    etag = make_etag("abc", _TS)
+    strong = etag[2:]
+    assert is_not_modified(_request(f'"other", {strong}'), etag)
+    assert is_not_modified(_request("*"), etag)
+
+
+def test_missing_or_stale_header_is_modified():
+    etag = make_etag("abc", _TS)
+    assert not is_not_modified(_request(), etag)
+    assert not is_not_modified(_request(make_etag("abc", _TS - timedelta(seconds=1))), etag)
+
+
+def test_not_modified_response_has_no_body():
+    response = not_modified('W/"x"')
+    assert response.status_code == 304
+    assert response.headers["etag"] == 'W/"x"'
+    assert response.body == b""
@@ -0,0 +1,47 @@
+"""Unit tests for the operator-only gate on cross-user telemetry endpoints."""
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app import dependencies
+from app.api import authoring as authoring_api
+from app.database import get_db
+from app.dependencies import get_current_principal, require_internal_access
+from app.principal_cache import Principal
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(authoring_api.router)
+    app.dependency_overrides[get_current_principal] = lambda: Principal(uuid.uuid4(), "a@b.bg", "+359", 0)
+
+    async def _db():
+        yield AsyncMock()
+
+    app.dependency_overrides[get_db] = _db
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/authoring/metrics/turns", "/authoring/metrics/shadow"])
+def test_end_user_cannot_read_telemetry(client, monkeypatch, path):
+    monkeypatch.setattr(dependencies, "INTERNAL_API_TOKEN", "s3cret")
+    assert client.get(path).status_code == 403
+    assert client.get(path, headers={"X-Internal-Token": "guess"}).status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_internal_token_grants_access(monkeypatch):
+    monkeypatch.setattr(dependencies, "INTERNAL_API_TOKEN", "s3cret")
+    await require_internal_access("s3cret")
+
+
+@pytest.mark.asyncio
+async def test_no_configured_token_refuses_everyone(monkeypatch):
+    monkeypatch.setattr(dependencies, "INTERNAL_API_TOKEN", "")
+    with pytest.raises(HTTPException) as exc:
+        await require_internal_access("")
+    assert exc.value.status_code == 403
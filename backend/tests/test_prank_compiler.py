@@ -0,0 +1,127 @@
+"""Unit tests for READY-time prank compilation."""
+import json
+import wave
+from unittest.mock import patch
+
+import pytest
+
+from app.schemas.prank_authoring import (
+    AuthoringLLMResult,
+    Caller,
+    DraftField,
+    DraftUpdate,
+    MessageRole,
+    PrankDraft,
+    PrankType,
+    Progression,
+    TargetEffect,
+)
+from app.services import authoring_engine
+from app.services.authoring_store import AuthoringStore
+from app.services.prank_compiler import PrankCompiler, build_package, draft_digest
+from app.services.tts import StubTTS
+
+
+class _CountingTTS(StubTTS):
+    def __init__(self):
+        self.calls = 0
+
+    async def synthesize(self, text):
+        self.calls += 1
+        return await super().synthesize(text)
+
+
+def _ready_draft(**overrides) -> PrankDraft:
+    fields = dict(
+        prank_type=PrankType.MISTAKEN_CONTINUATION,
+        caller=Caller(persona="куриер", tone="упорит"),
+        target_effect=TargetEffect(intended_emotion="объркване"),
+        progression=Progression(opening="Пита за пратката", escalation="Настоява", resolution="Извинява се"),
+        prank_title="Куриерът",
+    )
+    fields.update(overrides)
+    return PrankDraft(**fields)
+
+
+def test_incomplete_draft_cannot_be_packaged():
+    with pytest.raises(ValueError, match="incomplete"):
+        build_package(PrankDraft(prank_type=PrankType.CHAOS))
+
+
+@pytest.mark.asyncio
+async def test_compile_writes_package_and_audio(tmp_path):
+    tts = _CountingTTS()
+    compiler = PrankCompiler(tmp_path, "/static/compiled", tts=tts)
+    draft = _ready_draft()
+
+    compiled = await compiler.get(draft)
+
+    digest = draft_digest(draft)
+    assert compiled.script_lines == ("Пита за пратката", "Настоява", "Извинява се")
+    assert compiled.audio_urls[0] == f"/static/compiled/{digest}/line_00.wav"
+    with wave.open(str(tmp_path / digest / "line_00.wav")) as audio:
+        assert audio.getnframes() > 0
+    marker = json.loads((tmp_path / digest / "package.json").read_text(encoding="utf-8"))
+    assert marker["package"]["caller"]["persona"] == "куриер"
+    assert tts.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_by_draft_digest(tmp_path):
+    tts = _CountingTTS()
+    compiler = PrankCompiler(tmp_path, "/c", tts=tts)
+
+    compiler.schedule(_ready_draft())
+    compiler.schedule(_ready_draft())          # in flight — deduplicated
+    first = await compiler.get(_ready_draft())
+    again = await compiler.get(_ready_draft())
+    edited = await compiler.get(_ready_draft(prank_title="Друг"))
+
+    assert first is again
+    assert edited.digest != first.digest
+    assert tts.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_compiled_output_is_reused_from_disk(tmp_path):
+    await PrankCompiler(tmp_path, "/c", tts=StubTTS()).get(_ready_draft())
+    tts = _CountingTTS()
+
+    reloaded = await PrankCompiler(tmp_path, "/c", tts=tts).get(_ready_draft())
+
+    assert reloaded.package.prank_type == PrankType.MISTAKEN_CONTINUATION
+    assert tts.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_turn_that_reaches_ready_schedules_compilation():
+    store = AuthoringStore()
+    session = store.create_session()
+    draft = _ready_draft()
+    store.update_session(session.id, draft=draft)
+    store.append_message(session.id, MessageRole.USER, "първо")
+    store.append_message(session.id, MessageRole.USER, "второ")
+    result = AuthoringLLMResult(
+        reply="Готово!", draft_update=DraftUpdate(), missing_fields=[],
+        is_draft_complete=True, ready_for_handoff=True,
+    )
+
+    with patch("app.services.authoring_engine.prank_compiler") as compiler:
+        authoring_engine._complete_turn(store, store.get_session(session.id), result)
+
+    compiler.schedule.assert_called_once_with(draft)
+
+
+def test_turn_that_stays_open_does_not_compile():
+    store = AuthoringStore()
+    session = store.create_session()
+    store.append_message(session.id, MessageRole.USER, "първо")
+    result = AuthoringLLMResult(
+        reply="Разкажи още", draft_update=DraftUpdate(), missing_fields=list(DraftField),
+        is_draft_complete=False, ready_for_handoff=False,
+    )
+
+    with patch("app.services.authoring_engine.prank_compiler") as compiler:
+        authoring_engine._complete_turn(store, store.get_session(session.id), result)
+
+    compiler.schedule.assert_not_called()
@@ -0,0 +1,125 @@
+"""Unit tests for the principal cache and get_current_principal."""
+import time
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import HTTPException
+
+from app.auth import create_access_token
+from app.dependencies import get_current_principal
+from app.principal_cache import Principal, PrincipalCache, principal_cache
+
+
+def _principal(user_id=None, credits=1) -> Principal:
+    return Principal(id=user_id or uuid.uuid4(), email="a@b.c", phone_number="+359", credits=credits)
+
+
+def _far_future() -> float:
+    return time.time() + 3600
+
+
+def test_put_then_get_returns_principal():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    p = _principal()
+    cache.put("tok", p, _far_future())
+    assert cache.get("tok") is p
+    assert cache.get("other") is None
+
+
+def test_entry_expires_with_ttl():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put("tok", _principal(), _far_future())
+    with patch("app.principal_cache.time.monotonic", return_value=time.monotonic() + 61):
+        assert cache.get("tok") is None
+    assert len(cache) == 0
+
+
+def test_entry_never_outlives_token_exp():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put("expired", _principal(), time.time() - 1)
+    assert cache.get("expired") is None
+
+    cache.put("short", _principal(), time.time() + 5)
+    with patch("app.principal_cache.time.monotonic", return_value=time.monotonic() + 6):
+        assert cache.get("short") is None
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = PrincipalCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", _principal(), _far_future())
+    cache.put("b", _principal(), _far_future())
+    cache.get("a")                      # a is now most recent
+    cache.put("c", _principal(), _far_future())
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_invalidate_user_drops_all_their_tokens():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    user_id = uuid.uuid4()
+    cache.put("t1", _principal(user_id), _far_future())
+    cache.put("t2", _principal(user_id), _far_future())
+    cache.put("other", _principal(), _far_future())
+
+    cache.invalidate_user(user_id)
+
+    assert cache.get("t1") is None
+    assert cache.get("t2") is None
+    assert cache.get("other") is not None
+
+
+# ---------------------------------------------------------------------------
+# get_current_principal
+# ---------------------------------------------------------------------------
+
+def _user(user_id):
+    user = MagicMock()
+    user.id = user_id
+    user.email = "a@b.c"
+    user.phone_number = "+359888000000"
+    user.credits = 3
+    return user
+
+
+@pytest.mark.asyncio
+async def test_get_current_principal_hits_db_once_per_token():
+    principal_cache.clear()
+    user_id = uuid.uuid4()
+    token = create_access_token(str(user_id))
+    db = AsyncMock()
+    db.scalar = AsyncMock(return_value=_user(user_id))
+
+    first = await get_current_principal(token=token, db=db)
+    second = await get_current_principal(token=token, db=db)
+
+    assert first == second
+    assert first.id == user_id
+    assert first.credits == 3
+    db.scalar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_current_principal_rejects_invalid_token_without_db():
+    principal_cache.clear()
+    db = AsyncMock()
+
+    with pytest.raises(HTTPException) as exc:
+        await get_current_principal(token="not-a-jwt", db=db)
+
+    assert exc.value.status_code == 401
+    db.scalar.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_current_principal_unknown_user_not_cached():
+    principal_cache.clear()
+    token = create_access_token(str(uuid.uuid4()))
+    db = AsyncMock()
+    db.scalar = AsyncMock(return_value=None)
+
+    with pytest.raises(HTTPException):
+        await get_current_principal(token=token, db=db)
+
+    assert principal_cache.get(token) is None
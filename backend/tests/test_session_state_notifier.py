@@ -0,0 +1,48 @@
+"""Unit tests for the in-process long-poll notifier."""
+import asyncio
+import pytest
+from uuid import uuid4
+
+from app.services.session_state_notifier import SessionStateNotifier
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_all_waiters_for_session():
+    notifier = SessionStateNotifier()
+    session_id = uuid4()
+
+    with notifier.listen(session_id) as a, notifier.listen(session_id) as b:
+        notifier.notify(session_id)
+        await asyncio.wait_for(a.wait(), timeout=1)
+        await asyncio.wait_for(b.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_notify_other_session_does_not_wake():
+    notifier = SessionStateNotifier()
+
+    with notifier.listen(uuid4()) as changed:
+        notifier.notify(uuid4())
+        assert not changed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_notify_before_wait_is_not_lost():
+    """A change between registering and awaiting must still wake the waiter."""
+    notifier = SessionStateNotifier()
+    session_id = uuid4()
+
+    with notifier.listen(session_id) as changed:
+        notifier.notify(session_id)
+        await asyncio.wait_for(changed.wait(), timeout=1)
+
+
+def test_listen_cleans_up_on_exit():
+    notifier = SessionStateNotifier()
+    session_id = uuid4()
+
+    with notifier.listen(session_id):
+        pass
+
+    assert session_id not in notifier._waiters
+    notifier.notify(session_id)  # no waiters — must not raise
@@ -5,6 +5,7 @@ from uuid import uuid4
 
 from app.models.prank_session import PrankSession, PrankSessionState
 from app.services.prank_session_service import PrankSessionService
+from app.services.session_state_notifier import session_state_notifier
 
 
 def _make_db():
@@ -244,3 +245,29 @@ async def test_set_call_control_id_invalid_leg_raises():
 
     with pytest.raises(ValueError, match="Invalid leg"):
         await service.set_call_control_id(session, "third_party", "x-ccid")
+
+
+# ---------------------------------------------------------------------------
+# Long-poll notification
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_transition_wakes_long_poll_waiters():
+    db = _make_db()
+    service = PrankSessionService(db)
+    session = _make_session(PrankSessionState.CREATED)
+
+    with session_state_notifier.listen(session.id) as changed:
+        await service.transition_state(session, PrankSessionState.CALLING_SENDER)
+        assert changed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_transition_does_not_wake_waiters():
+    db = _make_db()
+    service = PrankSessionService(db)
+    session = _make_session(PrankSessionState.CALLING_SENDER)
+
+    with session_state_notifier.listen(session.id) as changed:
+        await service.transition_state(session, PrankSessionState.CALLING_SENDER)
+        assert not changed.is_set()
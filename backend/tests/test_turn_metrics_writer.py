@@ -0,0 +1,128 @@
+"""Unit tests for per-turn telemetry collection and the batched metrics writer."""
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.schemas.prank_authoring import AuthoringLLMResult, DraftUpdate
+from app.services import authoring_engine
+from app.services.authoring_metrics import TurnTiming, measure_turn
+from app.services.authoring_providers import OpenAIProvider
+from app.services.authoring_response_cache import authoring_response_cache
+from app.services.authoring_store import AuthoringStore
+from app.services.turn_metrics_writer import TurnMetricsWriter, turn_metric_row
+
+
+class _FakeDB:
+    def __init__(self, inserted: list, fail: bool = False):
+        self._inserted = inserted
+        self._fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, rows):
+        if self._fail:
+            raise RuntimeError("db down")
+        self._inserted.append(list(rows))
+
+    async def commit(self):
+        pass
+
+
+def _writer(inserted: list, **kwargs) -> TurnMetricsWriter:
+    options = dict(batch_size=3, flush_seconds=0.05, max_queue=100)
+    options.update(kwargs)
+    return TurnMetricsWriter(session_factory=lambda: _FakeDB(inserted), **options)
+
+
+def _timing(**fields) -> TurnTiming:
+    return TurnTiming(model_ms=800.0, total_ms=830.0, status="collecting_info", **fields)
+
+
+def test_row_splits_model_time_from_backend_overhead():
+    sid = str(uuid.uuid4())
+    row = turn_metric_row(sid, _timing(model="m", prompt_tokens=10), streamed=True)
+    assert row["session_id"] == uuid.UUID(sid)
+    assert (row["model_ms"], row["backend_ms"]) == (800.0, 30.0)
+    assert row["streamed"] is True and row["failed"] is False
+
+
+@pytest.mark.asyncio
+async def test_rows_are_written_in_batches():
+    inserted: list = []
+    writer = _writer(inserted)
+    await writer.start()
+
+    for _ in range(7):
+        writer.record_turn(str(uuid.uuid4()), _timing())
+    await asyncio.sleep(0.2)
+    await writer.stop()
+
+    assert [len(batch) for batch in inserted] == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_queued_rows():
+    inserted: list = []
+    writer = _writer(inserted, flush_seconds=60)
+    await writer.start()
+    writer.record_turn(str(uuid.uuid4()), _timing())
+    await asyncio.sleep(0)
+
+    await writer.stop()
+
+    assert sum(len(batch) for batch in inserted) == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_instead_of_blocking():
+    writer = _writer([], max_queue=2)
+    for _ in range(5):
+        writer.record_turn(str(uuid.uuid4()), _timing())
+    assert writer.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_insert_is_dropped_not_raised():
+    writer = TurnMetricsWriter(
+        batch_size=10, flush_seconds=0.01, max_queue=10,
+        session_factory=lambda: _FakeDB([], fail=True),
+    )
+    await writer.start()
+    writer.record_turn(str(uuid.uuid4()), _timing())
+    await asyncio.sleep(0.05)
+    await writer.stop()   # must not raise
+
+
+@pytest.mark.asyncio
+async def test_turn_collects_tokens_status_and_overridden_handoff():
+    authoring_response_cache.clear()
+    result = AuthoringLLMResult(
+        reply="Готово!", draft_update=DraftUpdate(), missing_fields=[],
+        is_draft_complete=True, ready_for_handoff=True,   # draft is empty → overridden
+    )
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = result.model_dump_json()
+    completion.usage.prompt_tokens = 1200
+    completion.usage.prompt_tokens_details.cached_tokens = 1024
+    completion.usage.completion_tokens = 60
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=completion)
+    store = AuthoringStore()
+    session = store.create_session()
+
+    with patch("app.services.authoring_engine._get_provider", return_value=OpenAIProvider(client)), \
+         patch("app.services.authoring_engine.AUTHORING_RESPONSE_CACHE_ENABLED", False):
+        with measure_turn() as timing:
+            await authoring_engine.process_turn(store, session.id, "здрасти")
+
+    assert timing.status == "collecting_info"
+    assert (timing.model_calls, timing.prompt_tokens, timing.cached_tokens) == (1, 1200, 1024)
+    assert timing.handoff_overridden is True
+    assert timing.parse_failures == 0 and timing.cache_hit is False